@@ -1,6 +1,7 @@
 """Counterpart to the API slurper; takes description files generated by the API slurper and builds Python code to pop into the client object."""
 import json
 import os
+import sys
 from typing import List
 
 from api_slurper import DocParameter, Documentation
@@ -19,6 +20,8 @@ class APIFunc:
 
 
 if __name__ == "__main__":
+    # With --async, emit coroutine methods for AsyncClubhouseClient instead
+    asynchronous = "--async" in sys.argv[1:]
     funcs: List[APIFunc] = []
 
     for fname in os.listdir("api_def"):
@@ -28,10 +31,22 @@ if __name__ == "__main__":
 
     funcs.sort()
 
+    # With --templates, emit clubhouse_lib/endpoints.py instead, which labels request events by endpoint template
+    if "--templates" in sys.argv[1:]:
+        print('"""The URL templates of every Clubhouse API endpoint, generated by the API builder with --templates."""')
+        print("\nENDPOINT_TEMPLATES = (")
+        for url_path in sorted({api_func.data["url_path"] for api_func in funcs}):
+            print('    "{}",'.format(url_path))
+        print(")")
+        sys.exit(0)
+
     prev_category = ""
 
     for api_func in funcs:
         func: Documentation = api_func.data
+        # Endpoints which cannot be expressed as a JSON request, e.g. multipart uploads, are maintained by hand
+        if func.get("hand_written"):
+            continue
         # Separate query params from body params
         url_params: List[DocParameter] = []
         body_params: List[DocParameter] = []
@@ -108,6 +123,8 @@ if __name__ == "__main__":
 
         # Build the string used to fetch/update data from Clubhouse
         request_string = 'self.{}("{}"'.format(func["http_verb"], func["url_path"])
+        if asynchronous:
+            request_string = "await " + request_string
         if len(url_params) > 0:
             request_string += (
                 ".format("
@@ -139,13 +156,16 @@ if __name__ == "__main__":
             result_str = " -> " + func["response"]
             # Only convert the result and return if there's something to return
             return_str = "return "
+            if asynchronous:
+                request_string = "(" + request_string + ")"
             request_string += ".json()"
 
         # Generate the function and throw it on stdout
         result = """
-    def {title}(self{py_params}){result}:
+    {async_str}def {title}(self{py_params}){result}:
         {description}{return_str}{request_string}
         """.format(
+            async_str="async " if asynchronous else "",
             title=func["identifier"],
             py_params=py_parameters,
             result=result_str,
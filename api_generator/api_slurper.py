@@ -23,6 +23,7 @@ class Documentation(TypedDict, total=False):
     http_verb: str
     url_path: str
     category: str
+    hand_written: bool  # Skipped by the API builder, as the method is maintained by hand
 
 
 def readAPIDoc(doc: str) -> Documentation:
@@ -2,3 +2,25 @@ __version__ = "1.0.0"
 
 # Declare top-level shortcuts
 from clubhouse_lib.client import ClubhouseClient
+from clubhouse_lib.async_client import AsyncClubhouseClient
+from clubhouse_lib.batch import BatchResult
+from clubhouse_lib.mirror import WorkspaceMirror
+from clubhouse_lib.cache import ResponseCache
+from clubhouse_lib.serializer import (
+    InterningSerializer,
+    JSONSerializer,
+    OrjsonSerializer,
+)
+from clubhouse_lib.bulk import BulkProgress
+from clubhouse_lib.files import TransferProgress
+from clubhouse_lib.record import RecordClient, RecordType, Records
+from clubhouse_lib.frame import StoryFrame
+from clubhouse_lib.timestamps import DecodeTimestamps, TimestampArray
+from clubhouse_lib.index import LocalSearch
+from clubhouse_lib.singleflight import SingleFlight
+from clubhouse_lib.events import (
+    LatencyHistogram,
+    OpenTelemetrySink,
+    PrometheusText,
+    RequestEvent,
+)
@@ -0,0 +1,2458 @@
+"""
+An asyncio flavour of ClubhouseClient. Every endpoint method is a coroutine with the same parameters, Omit
+semantics and return types as its blocking counterpart, and all requests share one non-blocking connection
+pool so a single event loop can keep many requests in flight.
+
+The endpoint methods below are generated from ClubhouseClient; regenerate them with the API builder's --async flag.
+uploadFiles is written by hand in both clients, as it streams a multipart body, and is skipped by the builder.
+"""
+
+import asyncio
+from datetime import datetime
+import time
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, see the "async" extra
+    aiohttp = None
+
+import requests
+
+from .batch import BatchResult, FetchManyAsync
+from .client import Omit, PrepareLocals
+from .files import (
+    FileSource,
+    IterPartAsync,
+    TRANSFER_CHUNK_SIZE,
+    TransferProgress,
+    _Part,
+)
+from .ratelimit import RequestScheduler
+from .search import IterPagesAsync
+from .serializer import DefaultSerializer, InterningSerializer, JSONSerializer
+from .type import (
+    Category,
+    CategoryType,
+    Comment,
+    CreateCategoryParams,
+    CreateExternalTicketParams,
+    CreateLabelParams,
+    CreateStoryCommentParams,
+    CreateStoryContents,
+    CreateStoryLinkParams,
+    CreateStoryParams,
+    CreateTaskParams,
+    EntityTemplate,
+    Epic,
+    EpicSearchResults,
+    EpicSlim,
+    EpicWorkflow,
+    File,
+    Group,
+    Iteration,
+    IterationSlim,
+    Label,
+    LinkedFile,
+    LinkedFileType,
+    Member,
+    MemberInfo,
+    Milestone,
+    MilestoneWorkflowState,
+    Project,
+    Reaction,
+    Repository,
+    SearchResults,
+    Story,
+    StoryLink,
+    StoryLinkVerb,
+    StorySearchResults,
+    StorySlim,
+    StoryType,
+    Task,
+    Team,
+    ThreadedComment,
+    Workflow,
+    WorkflowStateTypes,
+)
+
+
+class AsyncResponse:
+    """The fully read body and metadata of a response received by AsyncClubhouseClient."""
+
+    def __init__(
+        self, status_code: int, headers: dict, content: bytes, url: str, serializer=None
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.serializer = serializer or JSONSerializer()
+
+    def json(self):
+        return self.serializer.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise requests.HTTPError for 4xx and 5xx responses, just as the blocking client does."""
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(
+                "{} Error for url: {}".format(self.status_code, self.url), response=self
+            )
+
+
+class AsyncClubhouseClient:
+    def __init__(
+        self,
+        token: str,
+        baseURL: str = "https://api.clubhouse.io",
+        version: str = "v3",
+        debug: bool = False,
+        pool_limit: int = 100,
+        pool_maxsize: int = 0,
+        keep_alive: bool = True,
+        pool_idle_timeout: Optional[float] = 15.0,
+        session: "aiohttp.ClientSession" = None,
+        scheduler: Optional[RequestScheduler] = None,
+        serializer=None,
+        intern_strings: bool = False,
+    ) -> None:
+        """
+        param token: Required. The Clubhouse API token used to authenticate every request.
+        param baseURL: The root URL of the Clubhouse API.
+        param version: The API version to target.
+        param debug: Print an equivalent curl command for every request.
+        param pool_limit: The maximum number of connections open at once. 0 means unlimited.
+        param pool_maxsize: The maximum number of connections open to any one host. 0 means unlimited.
+        param keep_alive: When false, connections are closed after every request instead of being reused.
+        param pool_idle_timeout: Seconds an idle connection is kept alive before being closed.
+        param session: A preconfigured aiohttp.ClientSession to use instead of building one from the pool settings.
+        param scheduler: Paces and retries requests. Defaults to a RequestScheduler matching the Clubhouse rate limit.
+        param serializer: Encodes request bodies and decodes responses. Defaults to orjson when installed, json otherwise.
+        param intern_strings: Intern the UUIDs, entity types and label names of decoded responses, and turn Enum fields into Enums, to save memory on large responses.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncClubhouseClient requires aiohttp; install clubhouse-lib[async]"
+            )
+        self.token = token
+        self.baseURL = baseURL
+        self.version = version
+        self.debug = debug
+        self.apiURL = baseURL.rstrip("/") + "/api/" + version
+        self.pool_limit = pool_limit
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.pool_idle_timeout = pool_idle_timeout
+        self.session = session
+        if scheduler is None:
+            scheduler = RequestScheduler()
+        self.scheduler = scheduler
+        if serializer is None:
+            serializer = DefaultSerializer()
+        if intern_strings:
+            serializer = InterningSerializer(serializer)
+        self.serializer = serializer
+
+    def _session(self) -> "aiohttp.ClientSession":
+        # The session binds itself to the running event loop, so it is only built once the first request is made
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_maxsize,
+                force_close=not self.keep_alive,
+                keepalive_timeout=self.pool_idle_timeout if self.keep_alive else None,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self) -> None:
+        """Release every pooled connection held by the client."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> "AsyncClubhouseClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    ############
+    # Requests #
+    ############
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        form: Callable[[], "aiohttp.FormData"] = None,
+    ) -> AsyncResponse:
+        """
+        Send a request under the scheduler's rate limit and retry policy.
+
+        param form: Builds a multipart body to send instead of data. It is called again for every attempt, since aiohttp
+                    consumes a FormData as it is sent.
+        """
+        url = "{}/{}".format(self.apiURL, endpoint.lstrip("/"))
+        params = dict(params or {})
+        params["token"] = self.token
+        body = None if data is None else self.serializer.dumps(data)
+        headers = {} if form is not None else {"Content-Type": "application/json"}
+        if self.debug and form is None:
+            print(
+                "curl -X {} -H \"Content-Type: application/json\" '{}?{}'{}".format(
+                    method,
+                    url,
+                    "&".join("{}={}".format(k, v) for k, v in params.items()),
+                    "" if body is None else " --data '{}'".format(body.decode("utf-8")),
+                )
+            )
+
+        async def send() -> AsyncResponse:
+            async with self._session().request(
+                method,
+                url,
+                params=params,
+                data=body if form is None else form(),
+                headers=headers,
+            ) as r:
+                return AsyncResponse(
+                    r.status,
+                    dict(r.headers),
+                    await r.read(),
+                    str(r.url),
+                    self.serializer,
+                )
+
+        r = await self.scheduler.send_async(
+            method, send, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        )
+        r.raise_for_status()
+        return r
+
+    async def get(self, endpoint: str, params: dict = None) -> AsyncResponse:
+        return await self.request("GET", endpoint, params=params)
+
+    async def put(self, endpoint: str, data: dict = None) -> AsyncResponse:
+        return await self.request("PUT", endpoint, data={} if data is None else data)
+
+    async def post(self, endpoint: str, data: dict = None) -> AsyncResponse:
+        return await self.request("POST", endpoint, data={} if data is None else data)
+
+    async def delete(self, endpoint: str, data: dict = None) -> AsyncResponse:
+        return await self.request("DELETE", endpoint, data=data)
+
+    ###########
+    # Batches #
+    ###########
+
+    async def getStories(
+        self, story_public_ids: Iterable[int], max_concurrency: int = 50
+    ) -> Dict[int, BatchResult]:
+        """
+        Get Stories fetches many Stories concurrently, returning a BatchResult holding the Story or error for each id.
+
+        param story_public_ids: Required. The IDs of the Stories. Repeated IDs are only fetched once.
+        param max_concurrency: The maximum number of requests in flight at once.
+        """
+        return await FetchManyAsync(self.getStory, story_public_ids, max_concurrency)
+
+    async def getEpics(
+        self, epic_public_ids: Iterable[int], max_concurrency: int = 50
+    ) -> Dict[int, BatchResult]:
+        """
+        Get Epics fetches many Epics concurrently, returning a BatchResult holding the Epic or error for each id.
+
+        param epic_public_ids: Required. The IDs of the Epics. Repeated IDs are only fetched once.
+        param max_concurrency: The maximum number of requests in flight at once.
+        """
+        return await FetchManyAsync(self.getEpic, epic_public_ids, max_concurrency)
+
+    async def getMembers(
+        self,
+        member_public_ids: Iterable[str],
+        org_public_id: str = Omit,  # type: ignore
+        max_concurrency: int = 50,
+    ) -> Dict[str, BatchResult]:
+        """
+        Get Members fetches many Members concurrently, returning a BatchResult holding the Member or error for each id.
+
+        param member_public_ids: Required. The IDs of the Members. Repeated IDs are only fetched once.
+        param org_public_id: The unique ID of the Organization to limit the lookup to.
+        param max_concurrency: The maximum number of requests in flight at once.
+        """
+        return await FetchManyAsync(
+            lambda member_public_id: self.getMember(member_public_id, org_public_id),
+            member_public_ids,
+            max_concurrency,
+        )
+
+    ##############
+    # Pagination #
+    ##############
+
+    async def _getJSON(self, endpoint: str, params: dict = None):
+        return (await self.get(endpoint, params)).json()
+
+    async def iterSearchEpics(
+        self, query: str, page_size: int = 25, prefetch: bool = False
+    ) -> AsyncIterator[Epic]:
+        """
+        Iter Search Epics lazily yields every Epic matching a search, fetching further pages only as they are needed.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to fetch per page. Minimum of 1 and maximum of 25.
+        param prefetch: Fetch the next page in the background while the current one is being consumed.
+        """
+        async for page in IterPagesAsync(
+            self._getJSON,
+            "/search/epics",
+            {"query": query, "page_size": page_size},
+            self.apiURL,
+            prefetch,
+        ):
+            for epic in page["data"]:
+                yield epic
+
+    async def iterSearchStories(
+        self, query: str, page_size: int = 25, prefetch: bool = False
+    ) -> AsyncIterator[Story]:
+        """
+        Iter Search Stories lazily yields every Story matching a search, fetching further pages only as they are needed.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to fetch per page. Minimum of 1 and maximum of 25.
+        param prefetch: Fetch the next page in the background while the current one is being consumed.
+        """
+        async for page in IterPagesAsync(
+            self._getJSON,
+            "/search/stories",
+            {"query": query, "page_size": page_size},
+            self.apiURL,
+            prefetch,
+        ):
+            for story in page["data"]:
+                yield story
+
+    ##############
+    # Categories #
+    ##############
+
+    async def createCategory(
+        self,
+        name: str,
+        type: CategoryType,
+        color: str = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+    ) -> Category:
+        """
+        Create Category allows you to create a new Category in Clubhouse.
+
+        param name: Required. The name of the new Category.
+        param type: Required. The type of entity this Category is associated with; currently Milestone is the only type of Category.
+        param color: The hex color to be displayed with the Category (for example, “#ff0000”).
+        param external_id: This field can be set to another unique ID. In the case that the Category has been imported from another tool, the ID in the other tool can be indicated here.
+        """
+        return (
+            await self.post(
+                "/categories",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "type": type,
+                        "color": color,
+                        "external_id": external_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteCategory(self, category_public_id: int):
+        """
+        Delete Category can be used to delete any Category.
+
+        param category_public_id: Required. The unique ID of the Category.
+        """
+        await self.delete(
+            "/categories/{category_public_id}".format(
+                category_public_id=category_public_id
+            )
+        )
+
+    async def getCategory(self, category_public_id: int) -> Category:
+        """
+        Get Category returns information about the selected Category.
+
+        param category_public_id: Required. The unique ID of the Category.
+        """
+        return (
+            await self.get(
+                "/categories/{category_public_id}".format(
+                    category_public_id=category_public_id
+                )
+            )
+        ).json()
+
+    async def listCategories(self) -> List[Category]:
+        """List Categories returns a list of all Categories and their attributes."""
+        return (await self.get("/categories")).json()
+
+    async def listCategoryMilestones(self, category_public_id: int) -> List[Milestone]:
+        """
+        List Category Milestones returns a list of all Milestones with the Category.
+
+        param category_public_id: Required. The unique ID of the Category.
+        """
+        return (
+            await self.get(
+                "/categories/{category_public_id}/milestones".format(
+                    category_public_id=category_public_id
+                )
+            )
+        ).json()
+
+    async def updateCategory(
+        self,
+        category_public_id: int,
+        archived: bool = Omit,  # type: ignore
+        color: Optional[str] = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+    ) -> Category:
+        """
+        Update Category allows you to replace a Category name with another name. If you try to name a Category something that already exists, you will receive a 422 response.
+
+        param category_public_id: Required. The unique ID of the Category you wish to update.
+        param archived: A true/false boolean indicating if the Category has been archived.
+        param color: The hex color to be displayed with the Category (for example, “#ff0000”).
+        param name: The new name of the Category.
+        """
+        return (
+            await self.put(
+                "/categories/{category_public_id}".format(
+                    category_public_id=category_public_id
+                ),
+                PrepareLocals({"archived": archived, "color": color, "name": name}),
+            )
+        ).json()
+
+    ####################
+    # Entity-Templates #
+    ####################
+
+    async def createEntityTemplate(
+        self,
+        name: str,
+        story_contents: CreateStoryContents,
+        author_id: str = Omit,  # type: ignore
+    ) -> EntityTemplate:
+        """
+        Create a new entity template for your organization.
+
+        param name: Required. The name of the new entity template
+        param story_contents: Required. A map of story attributes this template populates.
+        param author_id: The id of the user creating this template.
+        """
+        return (
+            await self.post(
+                "/entity-templates",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "story_contents": story_contents,
+                        "author_id": author_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteEntityTemplate(self, entity_template_public_id: str):
+        """param entity_template_public_id: Required. The unique ID of the entity template."""
+        await self.delete(
+            "/entity-templates/{entity_template_public_id}".format(
+                entity_template_public_id=entity_template_public_id
+            )
+        )
+
+    async def disableStoryTemplates(self):
+        """Disables the Story Template feature for the given Organization."""
+        await self.put("/entity-templates/disable")
+
+    async def enableStoryTemplates(self):
+        """Enables the Story Template feature for the given Organization."""
+        await self.put("/entity-templates/enable")
+
+    async def getEntityTemplate(self, entity_template_public_id: str) -> EntityTemplate:
+        """
+        Get Entity Template returns information about a given entity template.
+
+        param entity_template_public_id: Required. The unique ID of the entity template.
+        """
+        return (
+            await self.get(
+                "/entity-templates/{entity_template_public_id}".format(
+                    entity_template_public_id=entity_template_public_id
+                )
+            )
+        ).json()
+
+    async def listEntityTemplates(self) -> List[EntityTemplate]:
+        """List all the entity templates for an organization."""
+        return (await self.get("/entity-templates")).json()
+
+    async def updateEntityTemplate(
+        self,
+        entity_template_public_id: str,
+        name: str = Omit,  # type: ignore
+        story_contents: CreateStoryContents = Omit,  # type: ignore
+    ) -> EntityTemplate:
+        """
+        Update an entity template’s name or its contents.
+
+        param entity_template_public_id: Required. The unique ID of the template to be updated.
+        param name: The updated template name.
+        param story_contents: A map of story attributes this template populates.
+        """
+        return (
+            await self.put(
+                "/entity-templates/{entity_template_public_id}".format(
+                    entity_template_public_id=entity_template_public_id
+                ),
+                PrepareLocals({"name": name, "story_contents": story_contents}),
+            )
+        ).json()
+
+    #################
+    # Epic-Workflow #
+    #################
+
+    async def getEpicWorkflow(self) -> EpicWorkflow:
+        """Get Epic Workflow returns the Epic Workflow for the organization."""
+        return (await self.get("/epic-workflow")).json()
+
+    #########
+    # Epics #
+    #########
+
+    async def createEpic(
+        self,
+        name: str,
+        completed_at_override: datetime = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        deadline: Optional[datetime] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        epic_state_id: int = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        labels: List[CreateLabelParams] = Omit,  # type: ignore
+        milestone_id: Optional[int] = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+        requested_by_id: str = Omit,  # type: ignore
+        started_at_override: datetime = Omit,  # type: ignore
+        state: MilestoneWorkflowState = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+    ) -> Epic:
+        """
+        Create Epic allows you to create a new Epic in Clubhouse.
+
+        param name: Required. The Epic’s name.
+        param completed_at_override: A manual override for the time/date the Epic was completed.
+        param created_at: Defaults to the time/date it is created but can be set to reflect another date.
+        param deadline: The Epic’s deadline.
+        param description: The Epic’s description.
+        param epic_state_id: The ID of the Epic State.
+        param external_id: This field can be set to another unique ID. In the case that the Epic has been imported from another tool, the ID in the other tool can be indicated here.
+        param follower_ids: An array of UUIDs for any Members you want to add as Followers on this new Epic.
+        param labels: An array of Labels attached to the Epic.
+        param milestone_id: The ID of the Milestone this Epic is related to.
+        param owner_ids: An array of UUIDs for any members you want to add as Owners on this new Epic.
+        param requested_by_id: The ID of the member that requested the epic.
+        param started_at_override: A manual override for the time/date the Epic was started.
+        param state: Deprecated The Epic’s state (to do, in progress, or done); will be ignored when epic_state_id is set.
+        param updated_at: Defaults to the time/date it is created but can be set to reflect another date.
+        """
+        return (
+            await self.post(
+                "/epics",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "completed_at_override": completed_at_override,
+                        "created_at": created_at,
+                        "deadline": deadline,
+                        "description": description,
+                        "epic_state_id": epic_state_id,
+                        "external_id": external_id,
+                        "follower_ids": follower_ids,
+                        "labels": labels,
+                        "milestone_id": milestone_id,
+                        "owner_ids": owner_ids,
+                        "requested_by_id": requested_by_id,
+                        "started_at_override": started_at_override,
+                        "state": state,
+                        "updated_at": updated_at,
+                    }
+                ),
+            )
+        ).json()
+
+    async def createEpicComment(
+        self,
+        epic_public_id: int,
+        text: str,
+        author_id: str = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+    ) -> ThreadedComment:
+        """
+        This endpoint allows you to create a threaded Comment on an Epic.
+
+        param epic_public_id: Required. The ID of the associated Epic.
+        param text: Required. The comment text.
+        param author_id: The Member ID of the Comment’s author. Defaults to the user identified by the API token.
+        param created_at: Defaults to the time/date the comment is created, but can be set to reflect another date.
+        param external_id: This field can be set to another unique ID. In the case that the comment has been imported from another tool, the ID in the other tool can be indicated here.
+        param updated_at: Defaults to the time/date the comment is last updated, but can be set to reflect another date.
+        """
+        return (
+            await self.post(
+                "/epics/{epic_public_id}/comments".format(
+                    epic_public_id=epic_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "text": text,
+                        "author_id": author_id,
+                        "created_at": created_at,
+                        "external_id": external_id,
+                        "updated_at": updated_at,
+                    }
+                ),
+            )
+        ).json()
+
+    async def createEpicCommentComment(
+        self,
+        comment_public_id: int,
+        epic_public_id: int,
+        text: str,
+        author_id: str = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+    ) -> ThreadedComment:
+        """
+        This endpoint allows you to create a nested Comment reply to an existing Epic Comment.
+
+        param comment_public_id: Required. The ID of the parent Epic Comment.
+        param epic_public_id: Required. The ID of the associated Epic.
+        param text: Required. The comment text.
+        param author_id: The Member ID of the Comment’s author. Defaults to the user identified by the API token.
+        param created_at: Defaults to the time/date the comment is created, but can be set to reflect another date.
+        param external_id: This field can be set to another unique ID. In the case that the comment has been imported from another tool, the ID in the other tool can be indicated here.
+        param updated_at: Defaults to the time/date the comment is last updated, but can be set to reflect another date.
+        """
+        return (
+            await self.post(
+                "/epics/{epic_public_id}/comments/{comment_public_id}".format(
+                    comment_public_id=comment_public_id, epic_public_id=epic_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "text": text,
+                        "author_id": author_id,
+                        "created_at": created_at,
+                        "external_id": external_id,
+                        "updated_at": updated_at,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteEpic(self, epic_public_id: int):
+        """
+        Delete Epic can be used to delete the Epic. The only required parameter is Epic ID.
+
+        param epic_public_id: Required. The unique ID of the Epic.
+        """
+        await self.delete(
+            "/epics/{epic_public_id}".format(epic_public_id=epic_public_id)
+        )
+
+    async def deleteEpicComment(self, comment_public_id: int, epic_public_id: int):
+        """
+        This endpoint allows you to delete a Comment from an Epic.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param epic_public_id: Required. The ID of the associated Epic.
+        """
+        await self.delete(
+            "/epics/{epic_public_id}/comments/{comment_public_id}".format(
+                comment_public_id=comment_public_id, epic_public_id=epic_public_id
+            )
+        )
+
+    async def getEpic(self, epic_public_id: int) -> Epic:
+        """
+        Get Epic returns information about the selected Epic.
+
+        param epic_public_id: Required. The unique ID of the Epic.
+        """
+        return (
+            await self.get(
+                "/epics/{epic_public_id}".format(epic_public_id=epic_public_id)
+            )
+        ).json()
+
+    async def getEpicComment(
+        self, comment_public_id: int, epic_public_id: int
+    ) -> ThreadedComment:
+        """
+        This endpoint returns information about the selected Epic Comment.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param epic_public_id: Required. The ID of the associated Epic.
+        """
+        return (
+            await self.get(
+                "/epics/{epic_public_id}/comments/{comment_public_id}".format(
+                    comment_public_id=comment_public_id, epic_public_id=epic_public_id
+                )
+            )
+        ).json()
+
+    async def listEpicComments(self, epic_public_id: int) -> List[ThreadedComment]:
+        """
+        Get a list of all Comments on an Epic.
+
+        param epic_public_id: Required. The unique ID of the Epic.
+        """
+        return (
+            await self.get(
+                "/epics/{epic_public_id}/comments".format(epic_public_id=epic_public_id)
+            )
+        ).json()
+
+    async def listEpics(self) -> List[EpicSlim]:
+        """List Epics returns a list of all Epics and their attributes."""
+        return (await self.get("/epics")).json()
+
+    async def updateEpic(
+        self,
+        epic_public_id: int,
+        after_id: int = Omit,  # type: ignore
+        archived: bool = Omit,  # type: ignore
+        before_id: int = Omit,  # type: ignore
+        completed_at_override: Optional[datetime] = Omit,  # type: ignore
+        deadline: Optional[datetime] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        epic_state_id: int = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        labels: List[CreateLabelParams] = Omit,  # type: ignore
+        milestone_id: Optional[int] = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+        requested_by_id: str = Omit,  # type: ignore
+        started_at_override: Optional[datetime] = Omit,  # type: ignore
+        state: MilestoneWorkflowState = Omit,  # type: ignore
+    ) -> Epic:
+        """
+        Update Epic can be used to update numerous fields in the Epic. The only required parameter is Epic ID, which can be found in the Clubhouse UI.
+
+        param epic_public_id: Required. The unique ID of the Epic.
+        param after_id: The ID of the Epic we want to move this Epic after.
+        param archived: A true/false boolean indicating whether the Epic is in archived state.
+        param before_id: The ID of the Epic we want to move this Epic before.
+        param completed_at_override: A manual override for the time/date the Epic was completed.
+        param deadline: The Epic’s deadline.
+        param description: The Epic’s description.
+        param epic_state_id: The ID of the Epic State.
+        param follower_ids: An array of UUIDs for any Members you want to add as Followers on this Epic.
+        param labels: An array of Labels attached to the Epic.
+        param milestone_id: The ID of the Milestone this Epic is related to.
+        param name: The Epic’s name.
+        param owner_ids: An array of UUIDs for any members you want to add as Owners on this Epic.
+        param requested_by_id: The ID of the member that requested the epic.
+        param started_at_override: A manual override for the time/date the Epic was started.
+        param state: Deprecated The Epic’s state (to do, in progress, or done); will be ignored when epic_state_id is set.
+        """
+        return (
+            await self.put(
+                "/epics/{epic_public_id}".format(epic_public_id=epic_public_id),
+                PrepareLocals(
+                    {
+                        "after_id": after_id,
+                        "archived": archived,
+                        "before_id": before_id,
+                        "completed_at_override": completed_at_override,
+                        "deadline": deadline,
+                        "description": description,
+                        "epic_state_id": epic_state_id,
+                        "follower_ids": follower_ids,
+                        "labels": labels,
+                        "milestone_id": milestone_id,
+                        "name": name,
+                        "owner_ids": owner_ids,
+                        "requested_by_id": requested_by_id,
+                        "started_at_override": started_at_override,
+                        "state": state,
+                    }
+                ),
+            )
+        ).json()
+
+    async def updateEpicComment(
+        self, comment_public_id: int, epic_public_id: int, text: str
+    ) -> ThreadedComment:
+        """
+        This endpoint allows you to update a threaded Comment on an Epic.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param epic_public_id: Required. The ID of the associated Epic.
+        param text: Required. The updated comment text.
+        """
+        return (
+            await self.put(
+                "/epics/{epic_public_id}/comments/{comment_public_id}".format(
+                    comment_public_id=comment_public_id, epic_public_id=epic_public_id
+                ),
+                PrepareLocals({"text": text}),
+            )
+        ).json()
+
+    #########
+    # Files #
+    #########
+
+    async def deleteFile(self, file_public_id: int):
+        """
+        Delete File can be used to delete any previously attached File.
+
+        param file_public_id: Required. The File’s unique ID.
+        """
+        await self.delete(
+            "/files/{file_public_id}".format(file_public_id=file_public_id)
+        )
+
+    async def getFile(self, file_public_id: int) -> File:
+        """
+        Get File returns information about the selected File.
+
+        param file_public_id: Required. The File’s unique ID.
+        """
+        return (
+            await self.get(
+                "/files/{file_public_id}".format(file_public_id=file_public_id)
+            )
+        ).json()
+
+    async def listFiles(self) -> List[File]:
+        """List Files returns a list of all Files and related attributes in your Clubhouse."""
+        return (await self.get("/files")).json()
+
+    async def updateFile(
+        self,
+        file_public_id: int,
+        created_at: datetime = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+        uploader_id: str = Omit,  # type: ignore
+    ) -> File:
+        """
+        Update File can used to update the properties of a file uploaded to Clubhouse.
+
+        param file_public_id: Required. The unique ID assigned to the file in Clubhouse.
+        param created_at: The time/date that the file was uploaded.
+        param description: The description of the file.
+        param external_id: An additional ID that you may wish to assign to the file.
+        param name: The name of the file.
+        param updated_at: The time/date that the file was last updated.
+        param uploader_id: The unique ID assigned to the Member who uploaded the file to Clubhouse.
+        """
+        return (
+            await self.put(
+                "/files/{file_public_id}".format(file_public_id=file_public_id),
+                PrepareLocals(
+                    {
+                        "created_at": created_at,
+                        "description": description,
+                        "external_id": external_id,
+                        "name": name,
+                        "updated_at": updated_at,
+                        "uploader_id": uploader_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def uploadFiles(
+        self,
+        files: List[FileSource],
+        story_id: int = Omit,  # type: ignore
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        progress: Callable[[TransferProgress], None] = None,
+    ) -> List[File]:
+        """
+        Upload one or more Files, which can then be associated to a Story Description, Story Comment, or Epic Comment.
+
+        The files are streamed as multipart/form-data in fixed-size chunks, read off the event loop, so they are never
+        loaded into memory whole. The body is sent with chunked transfer encoding.
+
+        param files: Required. The files to upload. Each is a path, a binary file object or a bytes-like buffer.
+        param story_id: The ID of the Story to associate the Files with.
+        param chunk_size: The number of bytes read and sent at a time.
+        param progress: Called with a TransferProgress, which includes the throughput so far, after every chunk.
+        """
+        parts = [_Part(source) for source in files]
+        fields = PrepareLocals({"story_id": story_id})
+        total = (
+            None
+            if any(part.size is None for part in parts)
+            else sum(part.size for part in parts)
+        )
+        if self.debug:
+            print(
+                "curl -X POST '{}/files?token={}' {}".format(
+                    self.apiURL,
+                    self.token,
+                    " ".join(
+                        "-F 'file{}=@{}'".format(i, part.filename)
+                        for i, part in enumerate(parts)
+                    ),
+                )
+            )
+
+        def form() -> "aiohttp.FormData":
+            started = time.monotonic()
+            counts = {"sent": 0}
+
+            def sent(size: int) -> None:
+                counts["sent"] += size
+                if progress is not None:
+                    progress(
+                        TransferProgress(
+                            counts["sent"], total, time.monotonic() - started
+                        )
+                    )
+
+            data = aiohttp.FormData()
+            for name, value in fields.items():
+                data.add_field(name, str(value))
+            for i, part in enumerate(parts):
+                data.add_field(
+                    "file{}".format(i),
+                    IterPartAsync(part, chunk_size, sent),
+                    filename=part.filename,
+                    content_type="application/octet-stream",
+                )
+            return data
+
+        return (await self.request("POST", "/files", form=form)).json()
+
+    ##########
+    # Groups #
+    ##########
+
+    async def createGroup(
+        self,
+        mention_name: str,
+        name: str,
+        description: str = Omit,  # type: ignore
+        display_icon_id: str = Omit,  # type: ignore
+        member_ids: List[str] = Omit,  # type: ignore
+    ) -> Group:
+        """
+        param mention_name: Required. The mention name of this Group.
+        param name: Required. The name of this Group.
+        param description: The description of the Group.
+        param display_icon_id: The Icon id for the avatar of this Group.
+        param member_ids: The Member ids to add to this Group.
+        """
+        return (
+            await self.post(
+                "/groups",
+                PrepareLocals(
+                    {
+                        "mention_name": mention_name,
+                        "name": name,
+                        "description": description,
+                        "display_icon_id": display_icon_id,
+                        "member_ids": member_ids,
+                    }
+                ),
+            )
+        ).json()
+
+    async def getGroup(self, group_public_id: str) -> Group:
+        """param group_public_id: Required. The unique ID of the Group."""
+        return (
+            await self.get(
+                "/groups/{group_public_id}".format(group_public_id=group_public_id)
+            )
+        ).json()
+
+    async def listGroups(self) -> List[Group]:
+        return (await self.get("/groups")).json()
+
+    async def updateGroup(
+        self,
+        group_public_id: str,
+        archived: Optional[bool] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        display_icon_id: Optional[str] = Omit,  # type: ignore
+        member_ids: List[str] = Omit,  # type: ignore
+        mention_name: str = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+    ) -> Group:
+        """
+        param group_public_id: Required. The unique ID of the Group.
+        param archived: Whether or not this Group is archived.
+        param description: The description of this Group.
+        param display_icon_id: The Icon id for the avatar of this Group.
+        param member_ids: The Member ids to add to this Group.
+        param mention_name: The mention name of this Group.
+        param name: The name of this Group.
+        """
+        return (
+            await self.put(
+                "/groups/{group_public_id}".format(group_public_id=group_public_id),
+                PrepareLocals(
+                    {
+                        "archived": archived,
+                        "description": description,
+                        "display_icon_id": display_icon_id,
+                        "member_ids": member_ids,
+                        "mention_name": mention_name,
+                        "name": name,
+                    }
+                ),
+            )
+        ).json()
+
+    ##############
+    # Iterations #
+    ##############
+
+    async def createIteration(
+        self,
+        end_date: str,
+        name: str,
+        start_date: str,
+        description: str = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        labels: List[CreateLabelParams] = Omit,  # type: ignore
+    ) -> Iteration:
+        """
+        param end_date: Required. The date this Iteration ends, e.g. 2019-07-01.
+        param name: Required. The name of this Iteration.
+        param start_date: Required. The date this Iteration begins, e.g. 2019-07-01.
+        param description: The description of the Iteration.
+        param follower_ids: An array of UUIDs for any Members you want to add as Followers.
+        param labels: An array of Labels attached to the Iteration.
+        """
+        return (
+            await self.post(
+                "/iterations",
+                PrepareLocals(
+                    {
+                        "end_date": end_date,
+                        "name": name,
+                        "start_date": start_date,
+                        "description": description,
+                        "follower_ids": follower_ids,
+                        "labels": labels,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteIteration(self, iteration_public_id: int):
+        """param iteration_public_id: Required. The unique ID of the Iteration."""
+        await self.delete(
+            "/iterations/{iteration_public_id}".format(
+                iteration_public_id=iteration_public_id
+            )
+        )
+
+    async def disableIterations(self):
+        """Disables Iterations for the current workspace"""
+        await self.put("/iterations/disable")
+
+    async def enableIterations(self):
+        """Enables Iterations for the current workspace"""
+        await self.put("/iterations/enable")
+
+    async def getIteration(self, iteration_public_id: int) -> Iteration:
+        """param iteration_public_id: Required. The unique ID of the Iteration."""
+        return (
+            await self.get(
+                "/iterations/{iteration_public_id}".format(
+                    iteration_public_id=iteration_public_id
+                )
+            )
+        ).json()
+
+    async def listIterations(self) -> List[IterationSlim]:
+        return (await self.get("/iterations")).json()
+
+    async def updateIteration(
+        self,
+        iteration_public_id: int,
+        description: str = Omit,  # type: ignore
+        end_date: str = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        labels: List[CreateLabelParams] = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        start_date: str = Omit,  # type: ignore
+    ) -> Iteration:
+        """
+        param iteration_public_id: Required. The unique ID of the Iteration.
+        param description: The description of the Iteration.
+        param end_date: The date this Iteration ends, e.g. 2019-07-05.
+        param follower_ids: An array of UUIDs for any Members you want to add as Followers.
+        param labels: An array of Labels attached to the Iteration.
+        param name: The name of this Iteration
+        param start_date: The date this Iteration begins, e.g. 2019-07-01
+        """
+        return (
+            await self.put(
+                "/iterations/{iteration_public_id}".format(
+                    iteration_public_id=iteration_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "description": description,
+                        "end_date": end_date,
+                        "follower_ids": follower_ids,
+                        "labels": labels,
+                        "name": name,
+                        "start_date": start_date,
+                    }
+                ),
+            )
+        ).json()
+
+    ##########
+    # Labels #
+    ##########
+
+    async def createLabel(
+        self,
+        name: str,
+        color: str = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+    ) -> Label:
+        """
+        Create Label allows you to create a new Label in Clubhouse.
+
+        param name: Required. The name of the new Label.
+        param color: The hex color to be displayed with the Label (for example, “#ff0000”).
+        param description: The description of the new Label.
+        param external_id: This field can be set to another unique ID. In the case that the Label has been imported from another tool, the ID in the other tool can be indicated here.
+        """
+        return (
+            await self.post(
+                "/labels",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "color": color,
+                        "description": description,
+                        "external_id": external_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteLabel(self, label_public_id: int):
+        """
+        Delete Label can be used to delete any Label.
+
+        param label_public_id: Required. The unique ID of the Label.
+        """
+        await self.delete(
+            "/labels/{label_public_id}".format(label_public_id=label_public_id)
+        )
+
+    async def getLabel(self, label_public_id: int) -> Label:
+        """
+        Get Label returns information about the selected Label.
+
+        param label_public_id: Required. The unique ID of the Label.
+        """
+        return (
+            await self.get(
+                "/labels/{label_public_id}".format(label_public_id=label_public_id)
+            )
+        ).json()
+
+    async def listLabelEpics(self, label_public_id: int) -> List[EpicSlim]:
+        """
+        List all of the Epics with the Label.
+
+        param label_public_id: Required. The unique ID of the Label.
+        """
+        return (
+            await self.get(
+                "/labels/{label_public_id}/epics".format(
+                    label_public_id=label_public_id
+                )
+            )
+        ).json()
+
+    async def listLabels(self) -> List[Label]:
+        """List Labels returns a list of all Labels and their attributes."""
+        return (await self.get("/labels")).json()
+
+    async def updateLabel(
+        self,
+        label_public_id: int,
+        archived: bool = Omit,  # type: ignore
+        color: Optional[str] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+    ) -> Label:
+        """
+        Update Label allows you to replace a Label name with another name. If you try to name a Label something that already exists, you will receive a 422 response.
+
+        param label_public_id: Required. The unique ID of the Label you wish to update.
+        param archived: A true/false boolean indicating if the Label has been archived.
+        param color: The hex color to be displayed with the Label (for example, “#ff0000”).
+        param description: The new description of the label.
+        param name: The new name of the label.
+        """
+        return (
+            await self.put(
+                "/labels/{label_public_id}".format(label_public_id=label_public_id),
+                PrepareLocals(
+                    {
+                        "archived": archived,
+                        "color": color,
+                        "description": description,
+                        "name": name,
+                    }
+                ),
+            )
+        ).json()
+
+    ################
+    # Linked-Files #
+    ################
+
+    async def createLinkedFile(
+        self,
+        name: str,
+        type: LinkedFileType,
+        url: str,
+        content_type: str = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        size: int = Omit,  # type: ignore
+        story_id: int = Omit,  # type: ignore
+        thumbnail_url: str = Omit,  # type: ignore
+        uploader_id: str = Omit,  # type: ignore
+    ) -> LinkedFile:
+        """
+        Create Linked File allows you to create a new Linked File in Clubhouse.
+
+        param name: Required. The name of the file.
+        param type: Required. The integration type of the file (e.g. google, dropbox, box).
+        param url: Required. The URL of linked file.
+        param content_type: The content type of the image (e.g. txt/plain).
+        param description: The description of the file.
+        param size: The filesize, if the integration provided it.
+        param story_id: The ID of the linked story.
+        param thumbnail_url: The URL of the thumbnail, if the integration provided it.
+        param uploader_id: The UUID of the member that uploaded the file.
+        """
+        return (
+            await self.post(
+                "/linked-files",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "type": type,
+                        "url": url,
+                        "content_type": content_type,
+                        "description": description,
+                        "size": size,
+                        "story_id": story_id,
+                        "thumbnail_url": thumbnail_url,
+                        "uploader_id": uploader_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteLinkedFile(self, linked_file_public_id: int):
+        """
+        Delete Linked File can be used to delete any previously attached Linked-File.
+
+        param linked_file_public_id: Required. The unique identifier of the linked file.
+        """
+        await self.delete(
+            "/linked-files/{linked_file_public_id}".format(
+                linked_file_public_id=linked_file_public_id
+            )
+        )
+
+    async def getLinkedFile(self, linked_file_public_id: int) -> LinkedFile:
+        """
+        Get File returns information about the selected Linked File.
+
+        param linked_file_public_id: Required. The unique identifier of the linked file.
+        """
+        return (
+            await self.get(
+                "/linked-files/{linked_file_public_id}".format(
+                    linked_file_public_id=linked_file_public_id
+                )
+            )
+        ).json()
+
+    async def listLinkedFiles(self) -> List[LinkedFile]:
+        """List Linked Files returns a list of all Linked-Files and their attributes."""
+        return (await self.get("/linked-files")).json()
+
+    async def updateLinkedFile(
+        self,
+        linked_file_public_id: int,
+        description: str = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        size: int = Omit,  # type: ignore
+        story_id: int = Omit,  # type: ignore
+        thumbnail_url: str = Omit,  # type: ignore
+        type: LinkedFileType = Omit,  # type: ignore
+        uploader_id: str = Omit,  # type: ignore
+        url: str = Omit,  # type: ignore
+    ) -> LinkedFile:
+        """
+        Updated Linked File allows you to update properties of a previously attached Linked-File.
+
+        param linked_file_public_id: Required. The unique identifier of the linked file.
+        param description: The description of the file.
+        param name: The name of the file.
+        param size: The filesize, if the integration provided it.
+        param story_id: The ID of the linked story.
+        param thumbnail_url: The URL of the thumbnail, if the integration provided it.
+        param type: The integration type of the file (e.g. google, dropbox, box).
+        param uploader_id: The UUID of the member that uploaded the file.
+        param url: The URL of linked file.
+        """
+        return (
+            await self.put(
+                "/linked-files/{linked_file_public_id}".format(
+                    linked_file_public_id=linked_file_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "description": description,
+                        "name": name,
+                        "size": size,
+                        "story_id": story_id,
+                        "thumbnail_url": thumbnail_url,
+                        "type": type,
+                        "uploader_id": uploader_id,
+                        "url": url,
+                    }
+                ),
+            )
+        ).json()
+
+    ##########
+    # Member #
+    ##########
+
+    async def getCurrentMemberInfo(self) -> MemberInfo:
+        """Returns information about the authenticated member."""
+        return (await self.get("/member")).json()
+
+    ###########
+    # Members #
+    ###########
+
+    async def getMember(
+        self, member_public_id: str, org_public_id: str = Omit  # type: ignore
+    ) -> Member:
+        """
+        Returns information about a Member.
+
+        param member_public_id: Required. The Member’s unique ID.
+        param org_public_id: The unique ID of the Organization to limit the lookup to.
+        """
+        return (
+            await self.get(
+                "/members/{member_public_id}".format(member_public_id=member_public_id),
+                PrepareLocals({"org-public-id": org_public_id}),
+            )
+        ).json()
+
+    async def listMembers(
+        self, org_public_id: str = Omit  # type: ignore
+    ) -> List[Member]:
+        """
+        List Members returns information about members of the organization.
+
+        param org_public_id: The unique ID of the Organization to limit the list to.
+        """
+        return (
+            await self.get("/members", PrepareLocals({"org-public-id": org_public_id}))
+        ).json()
+
+    ##############
+    # Milestones #
+    ##############
+
+    async def createMilestone(
+        self,
+        name: str,
+        categories: List[CreateCategoryParams] = Omit,  # type: ignore
+        completed_at_override: datetime = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        started_at_override: datetime = Omit,  # type: ignore
+        state: MilestoneWorkflowState = Omit,  # type: ignore
+    ) -> Milestone:
+        """
+        Create Milestone allows you to create a new Milestone in Clubhouse.
+
+        param name: Required. The name of the Milestone.
+        param categories: An array of IDs of Categories attached to the Milestone.
+        param completed_at_override: A manual override for the time/date the Milestone was completed.
+        param description: The Milestone’s description.
+        param started_at_override: A manual override for the time/date the Milestone was started.
+        param state: The workflow state that the Milestone is in.
+        """
+        return (
+            await self.post(
+                "/milestones",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "categories": categories,
+                        "completed_at_override": completed_at_override,
+                        "description": description,
+                        "started_at_override": started_at_override,
+                        "state": state,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteMilestone(self, milestone_public_id: int):
+        """
+        Delete Milestone can be used to delete any Milestone.
+
+        param milestone_public_id: Required. The ID of the Milestone.
+        """
+        await self.delete(
+            "/milestones/{milestone_public_id}".format(
+                milestone_public_id=milestone_public_id
+            )
+        )
+
+    async def getMilestone(self, milestone_public_id: int) -> Milestone:
+        """
+        Get Milestone returns information about a chosen Milestone.
+
+        param milestone_public_id: Required. The ID of the Milestone.
+        """
+        return (
+            await self.get(
+                "/milestones/{milestone_public_id}".format(
+                    milestone_public_id=milestone_public_id
+                )
+            )
+        ).json()
+
+    async def listMilestoneEpics(self, milestone_public_id: int) -> List[EpicSlim]:
+        """
+        List all of the Epics within the Milestone.
+
+        param milestone_public_id: Required. The ID of the Milestone.
+        """
+        return (
+            await self.get(
+                "/milestones/{milestone_public_id}/epics".format(
+                    milestone_public_id=milestone_public_id
+                )
+            )
+        ).json()
+
+    async def listMilestones(self) -> List[Milestone]:
+        """List Milestones returns a list of all Milestones and their attributes."""
+        return (await self.get("/milestones")).json()
+
+    async def updateMilestone(
+        self,
+        milestone_public_id: int,
+        after_id: int = Omit,  # type: ignore
+        before_id: int = Omit,  # type: ignore
+        categories: List[CreateCategoryParams] = Omit,  # type: ignore
+        completed_at_override: Optional[datetime] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        started_at_override: Optional[datetime] = Omit,  # type: ignore
+        state: MilestoneWorkflowState = Omit,  # type: ignore
+    ) -> Milestone:
+        """
+        Update Milestone can be used to update Milestone properties.
+
+        param milestone_public_id: Required. The ID of the Milestone.
+        param after_id: The ID of the Milestone we want to move this Milestone after.
+        param before_id: The ID of the Milestone we want to move this Milestone before.
+        param categories: An array of IDs of Categories attached to the Milestone.
+        param completed_at_override: A manual override for the time/date the Milestone was completed.
+        param description: The Milestone’s description.
+        param name: The name of the Milestone.
+        param started_at_override: A manual override for the time/date the Milestone was started.
+        param state: The workflow state that the Milestone is in.
+        """
+        return (
+            await self.put(
+                "/milestones/{milestone_public_id}".format(
+                    milestone_public_id=milestone_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "after_id": after_id,
+                        "before_id": before_id,
+                        "categories": categories,
+                        "completed_at_override": completed_at_override,
+                        "description": description,
+                        "name": name,
+                        "started_at_override": started_at_override,
+                        "state": state,
+                    }
+                ),
+            )
+        ).json()
+
+    ############
+    # Projects #
+    ############
+
+    async def createProject(
+        self,
+        name: str,
+        team_id: int,
+        abbreviation: str = Omit,  # type: ignore
+        color: str = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        iteration_length: int = Omit,  # type: ignore
+        start_time: datetime = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+    ) -> Project:
+        """
+        Create Project is used to create a new Clubhouse Project.
+
+        param name: Required. The name of the Project.
+        param team_id: Required. The ID of the team the project belongs to.
+        param abbreviation: The Project abbreviation used in Story summaries. Should be kept to 3 characters at most.
+        param color: The color you wish to use for the Project in the system.
+        param created_at: Defaults to the time/date it is created but can be set to reflect another date.
+        param description: The Project description.
+        param external_id: This field can be set to another unique ID. In the case that the Project has been imported from another tool, the ID in the other tool can be indicated here.
+        param follower_ids: An array of UUIDs for any members you want to add as Owners on this new Epic.
+        param iteration_length: The number of weeks per iteration in this Project.
+        param start_time: The date at which the Project was started.
+        param updated_at: Defaults to the time/date it is created but can be set to reflect another date.
+        """
+        return (
+            await self.post(
+                "/projects",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "team_id": team_id,
+                        "abbreviation": abbreviation,
+                        "color": color,
+                        "created_at": created_at,
+                        "description": description,
+                        "external_id": external_id,
+                        "follower_ids": follower_ids,
+                        "iteration_length": iteration_length,
+                        "start_time": start_time,
+                        "updated_at": updated_at,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteProject(self, project_public_id: int):
+        """
+        Delete Project can be used to delete a Project. Projects can only be deleted if all associated Stories are moved or deleted. In the case that the Project cannot be deleted, you will receive a 422 response.
+
+        param project_public_id: Required. The unique ID of the Project.
+        """
+        await self.delete(
+            "/projects/{project_public_id}".format(project_public_id=project_public_id)
+        )
+
+    async def getProject(self, project_public_id: int) -> Project:
+        """
+        Get Project returns information about the selected Project.
+
+        param project_public_id: Required. The unique ID of the Project.
+        """
+        return (
+            await self.get(
+                "/projects/{project_public_id}".format(
+                    project_public_id=project_public_id
+                )
+            )
+        ).json()
+
+    async def listProjects(self) -> List[Project]:
+        """List Projects returns a list of all Projects and their attributes."""
+        return (await self.get("/projects")).json()
+
+    async def listStories(self, project_public_id: int) -> List[StorySlim]:
+        """
+        List Stories returns a list of all Stories in a selected Project and their attributes.
+
+        param project_public_id: Required. The unique ID of the Project.
+        """
+        return (
+            await self.get(
+                "/projects/{project_public_id}/stories".format(
+                    project_public_id=project_public_id
+                )
+            )
+        ).json()
+
+    async def updateProject(
+        self,
+        project_public_id: int,
+        abbreviation: str = Omit,  # type: ignore
+        archived: bool = Omit,  # type: ignore
+        color: str = Omit,  # type: ignore
+        days_to_thermometer: int = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        show_thermometer: bool = Omit,  # type: ignore
+        team_id: int = Omit,  # type: ignore
+    ) -> Project:
+        """
+        Update Project can be used to change properties of a Project.
+
+        param project_public_id: Required. The unique ID of the Project.
+        param abbreviation: The Project abbreviation used in Story summaries. Should be kept to 3 characters at most.
+        param archived: A true/false boolean indicating whether the Story is in archived state.
+        param color: The color that represents the Project in the UI.
+        param days_to_thermometer: The number of days before the thermometer appears in the Story summary.
+        param description: The Project’s description.
+        param follower_ids: An array of UUIDs for any Members you want to add as Followers.
+        param name: The Project’s name.
+        param show_thermometer: Configuration to enable or disable thermometers in the Story summary.
+        param team_id: The ID of the team the project belongs to.
+        """
+        return (
+            await self.put(
+                "/projects/{project_public_id}".format(
+                    project_public_id=project_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "abbreviation": abbreviation,
+                        "archived": archived,
+                        "color": color,
+                        "days_to_thermometer": days_to_thermometer,
+                        "description": description,
+                        "follower_ids": follower_ids,
+                        "name": name,
+                        "show_thermometer": show_thermometer,
+                        "team_id": team_id,
+                    }
+                ),
+            )
+        ).json()
+
+    ################
+    # Repositories #
+    ################
+
+    async def getRepository(self, repo_public_id: int) -> Repository:
+        """
+        Get Repository returns information about the selected Repository.
+
+        param repo_public_id: Required. The unique ID of the Repository.
+        """
+        return (
+            await self.get(
+                "/repositories/{repo_public_id}".format(repo_public_id=repo_public_id)
+            )
+        ).json()
+
+    async def listRepositories(self) -> List[Repository]:
+        """List Repositories returns a list of all Repositories and their attributes."""
+        return (await self.get("/repositories")).json()
+
+    ##########
+    # Search #
+    ##########
+
+    async def search(
+        self, query: str, page_size: int = Omit  # type: ignore
+    ) -> SearchResults:
+        """
+        Search lets you search Epics and Stories based on desired parameters. Since ordering of the results can change over time (due to search ranking decay, new Epics and Stories being created), the next value from the previous response can be used as the path and query string for the next page to ensure stable ordering.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to include in a page. Minimum of 1 and maximum of 25.
+        """
+        return (
+            await self.get(
+                "/search", PrepareLocals({"query": query, "page_size": page_size})
+            )
+        ).json()
+
+    async def searchEpics(
+        self, query: str, page_size: int = Omit  # type: ignore
+    ) -> EpicSearchResults:
+        """
+        Search Epics lets you search Epics based on desired parameters. Since ordering of stories can change over time (due to search ranking decay, new Epics being created), the next value from the previous response can be used as the path and query string for the next page to ensure stable ordering.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to include in a page. Minimum of 1 and maximum of 25.
+        """
+        return (
+            await self.get(
+                "/search/epics", PrepareLocals({"query": query, "page_size": page_size})
+            )
+        ).json()
+
+    async def searchStories(
+        self, query: str, page_size: int = Omit  # type: ignore
+    ) -> StorySearchResults:
+        """
+        Search Stories lets you search Stories based on desired parameters. Since ordering of stories can change over time (due to search ranking decay, new stories being created), the next value from the previous response can be used as the path and query string for the next page to ensure stable ordering.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to include in a page. Minimum of 1 and maximum of 25.
+        """
+        return (
+            await self.get(
+                "/search/stories",
+                PrepareLocals({"query": query, "page_size": page_size}),
+            )
+        ).json()
+
+    ###########
+    # Stories #
+    ###########
+
+    async def createComment(
+        self,
+        story_public_id: int,
+        text: str,
+        author_id: str = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+    ) -> Comment:
+        """
+        Create Comment allows you to create a Comment on any Story.
+
+        param story_public_id: Required. The ID of the Story that the Comment is in.
+        param text: Required. The comment text.
+        param author_id: The Member ID of the Comment’s author. Defaults to the user identified by the API token.
+        param created_at: Defaults to the time/date the comment is created, but can be set to reflect another date.
+        param external_id: This field can be set to another unique ID. In the case that the comment has been imported from another tool, the ID in the other tool can be indicated here.
+        param updated_at: Defaults to the time/date the comment is last updated, but can be set to reflect another date.
+        """
+        return (
+            await self.post(
+                "/stories/{story_public_id}/comments".format(
+                    story_public_id=story_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "text": text,
+                        "author_id": author_id,
+                        "created_at": created_at,
+                        "external_id": external_id,
+                        "updated_at": updated_at,
+                    }
+                ),
+            )
+        ).json()
+
+    async def createMultipleStories(
+        self, stories: List[CreateStoryParams]
+    ) -> List[StorySlim]:
+        """
+        Create Multiple Stories allows you to create multiple stories in a single request using the same syntax as Create Story.
+
+        param stories: Required. An array of stories to be created.
+        """
+        return (
+            await self.post("/stories/bulk", PrepareLocals({"stories": stories}))
+        ).json()
+
+    async def createReaction(
+        self, comment_public_id: int, emoji: str, story_public_id: int
+    ) -> List[Reaction]:
+        """
+        Create a reaction to a comment.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param emoji: Required. The emoji short-code to add / remove. E.g. :thumbsup::skin-tone-4:.
+        param story_public_id: Required. The ID of the Story that the Comment is in.
+        """
+        return (
+            await self.post(
+                "/stories/{story_public_id}/comments/{comment_public_id}/reactions".format(
+                    comment_public_id=comment_public_id, story_public_id=story_public_id
+                ),
+                PrepareLocals({"emoji": emoji}),
+            )
+        ).json()
+
+    async def createStory(
+        self,
+        name: str,
+        project_id: int,
+        archived: bool = Omit,  # type: ignore
+        comments: List[CreateStoryCommentParams] = Omit,  # type: ignore
+        completed_at_override: datetime = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        deadline: Optional[datetime] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        epic_id: Optional[int] = Omit,  # type: ignore
+        estimate: Optional[int] = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        external_tickets: List[CreateExternalTicketParams] = Omit,  # type: ignore
+        file_ids: List[int] = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        iteration_id: Optional[int] = Omit,  # type: ignore
+        labels: List[CreateLabelParams] = Omit,  # type: ignore
+        linked_file_ids: List[int] = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+        requested_by_id: str = Omit,  # type: ignore
+        started_at_override: datetime = Omit,  # type: ignore
+        story_links: List[CreateStoryLinkParams] = Omit,  # type: ignore
+        story_type: StoryType = Omit,  # type: ignore
+        tasks: List[CreateTaskParams] = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+        workflow_state_id: int = Omit,  # type: ignore
+    ) -> Story:
+        """
+        Create Story is used to add a new story to your Clubhouse.
+
+        param name: Required. The name of the story.
+        param project_id: Required. The ID of the project the story belongs to.
+        param archived: Controls the story’s archived state.
+        param comments: An array of comments to add to the story.
+        param completed_at_override: A manual override for the time/date the Story was completed.
+        param created_at: The time/date the Story was created.
+        param deadline: The due date of the story.
+        param description: The description of the story.
+        param epic_id: The ID of the epic the story belongs to.
+        param estimate: The numeric point estimate of the story. Can also be null, which means unestimated.
+        param external_id: This field can be set to another unique ID. In the case that the Story has been imported from another tool, the ID in the other tool can be indicated here.
+        param external_tickets: An array of External Tickets associated with this story. These External Tickets must have unquie external id. Duplicated External Tickets will be removed.
+        param file_ids: An array of IDs of files attached to the story.
+        param follower_ids: An array of UUIDs of the followers of this story.
+        param iteration_id: The ID of the iteration the story belongs to.
+        param labels: An array of labels attached to the story.
+        param linked_file_ids: An array of IDs of linked files attached to the story.
+        param owner_ids: An array of UUIDs of the owners of this story.
+        param requested_by_id: The ID of the member that requested the story.
+        param started_at_override: A manual override for the time/date the Story was started.
+        param story_links: An array of story links attached to the story.
+        param story_type: The type of story (feature, bug, chore).
+        param tasks: An array of tasks connected to the story.
+        param updated_at: The time/date the Story was updated.
+        param workflow_state_id: The ID of the workflow state the story is currently in.
+        """
+        return (
+            await self.post(
+                "/stories",
+                PrepareLocals(
+                    {
+                        "name": name,
+                        "project_id": project_id,
+                        "archived": archived,
+                        "comments": comments,
+                        "completed_at_override": completed_at_override,
+                        "created_at": created_at,
+                        "deadline": deadline,
+                        "description": description,
+                        "epic_id": epic_id,
+                        "estimate": estimate,
+                        "external_id": external_id,
+                        "external_tickets": external_tickets,
+                        "file_ids": file_ids,
+                        "follower_ids": follower_ids,
+                        "iteration_id": iteration_id,
+                        "labels": labels,
+                        "linked_file_ids": linked_file_ids,
+                        "owner_ids": owner_ids,
+                        "requested_by_id": requested_by_id,
+                        "started_at_override": started_at_override,
+                        "story_links": story_links,
+                        "story_type": story_type,
+                        "tasks": tasks,
+                        "updated_at": updated_at,
+                        "workflow_state_id": workflow_state_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def createTask(
+        self,
+        description: str,
+        story_public_id: int,
+        complete: bool = Omit,  # type: ignore
+        created_at: datetime = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+        updated_at: datetime = Omit,  # type: ignore
+    ) -> Task:
+        """
+        Create Task is used to create a new task in a Story.
+
+        param description: Required. The Task description.
+        param story_public_id: Required. The ID of the Story that the Task will be in.
+        param complete: True/false boolean indicating whether the Task is completed. Defaults to false.
+        param created_at: Defaults to the time/date the Task is created but can be set to reflect another creation time/date.
+        param external_id: This field can be set to another unique ID. In the case that the Task has been imported from another tool, the ID in the other tool can be indicated here.
+        param owner_ids: An array of UUIDs for any members you want to add as Owners on this new Task.
+        param updated_at: Defaults to the time/date the Task is created in Clubhouse but can be set to reflect another time/date.
+        """
+        return (
+            await self.post(
+                "/stories/{story_public_id}/tasks".format(
+                    story_public_id=story_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "description": description,
+                        "complete": complete,
+                        "created_at": created_at,
+                        "external_id": external_id,
+                        "owner_ids": owner_ids,
+                        "updated_at": updated_at,
+                    }
+                ),
+            )
+        ).json()
+
+    async def deleteComment(self, comment_public_id: int, story_public_id: int):
+        """
+        Delete a Comment from any story.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param story_public_id: Required. The ID of the Story that the Comment is in.
+        """
+        await self.delete(
+            "/stories/{story_public_id}/comments/{comment_public_id}".format(
+                comment_public_id=comment_public_id, story_public_id=story_public_id
+            )
+        )
+
+    async def deleteMultipleStories(self, story_ids: List[int]):
+        """
+        Delete Multiple Stories allows you to delete multiple archived stories at once.
+
+        param story_ids: Required. An array of IDs of Stories to delete.
+        """
+        await self.delete("/stories/bulk", PrepareLocals({"story_ids": story_ids}))
+
+    async def deleteReaction(
+        self, comment_public_id: int, emoji: str, story_public_id: int
+    ):
+        """
+        Delete a Reaction from any comment.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param emoji: Required. The emoji short-code to add / remove. E.g. :thumbsup::skin-tone-4:.
+        param story_public_id: Required. The ID of the Story that the Comment is in.
+        """
+        await self.delete(
+            "/stories/{story_public_id}/comments/{comment_public_id}/reactions".format(
+                comment_public_id=comment_public_id, story_public_id=story_public_id
+            ),
+            PrepareLocals({"emoji": emoji}),
+        )
+
+    async def deleteStory(self, story_public_id: int):
+        """
+        Delete Story can be used to delete any Story.
+
+        param story_public_id: Required. The ID of the Story.
+        """
+        await self.delete(
+            "/stories/{story_public_id}".format(story_public_id=story_public_id)
+        )
+
+    async def deleteTask(self, story_public_id: int, task_public_id: int):
+        """
+        Delete Task can be used to delete any previously created Task on a Story.
+
+        param story_public_id: Required. The unique ID of the Story this Task is associated with.
+        param task_public_id: Required. The unique ID of the Task.
+        """
+        await self.delete(
+            "/stories/{story_public_id}/tasks/{task_public_id}".format(
+                story_public_id=story_public_id, task_public_id=task_public_id
+            )
+        )
+
+    async def getComment(self, comment_public_id: int, story_public_id: int) -> Comment:
+        """
+        Get Comment is used to get Comment information.
+
+        param comment_public_id: Required. The ID of the Comment.
+        param story_public_id: Required. The ID of the Story that the Comment is in.
+        """
+        return (
+            await self.get(
+                "/stories/{story_public_id}/comments/{comment_public_id}".format(
+                    comment_public_id=comment_public_id, story_public_id=story_public_id
+                )
+            )
+        ).json()
+
+    async def getStory(self, story_public_id: int) -> Story:
+        """
+        Get Story returns information about a chosen Story.
+
+        param story_public_id: Required. The ID of the Story.
+        """
+        return (
+            await self.get(
+                "/stories/{story_public_id}".format(story_public_id=story_public_id)
+            )
+        ).json()
+
+    async def getTask(self, story_public_id: int, task_public_id: int) -> Task:
+        """
+        Returns information about a chosen Task.
+
+        param story_public_id: Required. The unique ID of the Story this Task is associated with.
+        param task_public_id: Required. The unique ID of the Task.
+        """
+        return (
+            await self.get(
+                "/stories/{story_public_id}/tasks/{task_public_id}".format(
+                    story_public_id=story_public_id, task_public_id=task_public_id
+                )
+            )
+        ).json()
+
+    async def searchStoriesOld(
+        self,
+        archived: bool = Omit,  # type: ignore
+        completed_at_end: datetime = Omit,  # type: ignore
+        completed_at_start: datetime = Omit,  # type: ignore
+        created_at_end: datetime = Omit,  # type: ignore
+        created_at_start: datetime = Omit,  # type: ignore
+        deadline_end: datetime = Omit,  # type: ignore
+        deadline_start: datetime = Omit,  # type: ignore
+        epic_id: Optional[int] = Omit,  # type: ignore
+        epic_ids: List[int] = Omit,  # type: ignore
+        estimate: int = Omit,  # type: ignore
+        external_id: str = Omit,  # type: ignore
+        iteration_id: Optional[int] = Omit,  # type: ignore
+        iteration_ids: List[int] = Omit,  # type: ignore
+        label_ids: List[int] = Omit,  # type: ignore
+        label_name: str = Omit,  # type: ignore
+        owner_id: Optional[str] = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+        project_id: int = Omit,  # type: ignore
+        project_ids: List[int] = Omit,  # type: ignore
+        requested_by_id: str = Omit,  # type: ignore
+        story_type: StoryType = Omit,  # type: ignore
+        updated_at_end: datetime = Omit,  # type: ignore
+        updated_at_start: datetime = Omit,  # type: ignore
+        workflow_state_id: int = Omit,  # type: ignore
+        workflow_state_types: List[WorkflowStateTypes] = Omit,  # type: ignore
+    ) -> List[StorySlim]:
+        """
+        Search Stories lets you search Stories based on desired parameters.
+
+        param archived: A true/false boolean indicating whether the Story is in archived state.
+        param completed_at_end: Stories should have been completed before this date.
+        param completed_at_start: Stories should have been competed after this date.
+        param created_at_end: Stories should have been created before this date.
+        param created_at_start: Stories should have been created after this date.
+        param deadline_end: Stories should have a deadline before this date.
+        param deadline_start: Stories should have a deadline after this date.
+        param epic_id: The Epic IDs that may be associated with the Stories.
+        param epic_ids: The Epic IDs that may be associated with the Stories.
+        param estimate: The number of estimate points associate with the Stories.
+        param external_id: An ID or URL that references an external resource. Useful during imports.
+        param iteration_id: The Iteration ID that may be associated with the Stories.
+        param iteration_ids: The Iteration IDs that may be associated with the Stories.
+        param label_ids: The Label IDs that may be associated with the Stories.
+        param label_name: The name of any associated Labels.
+        param owner_id: An array of UUIDs for any Users who may be Owners of the Stories.
+        param owner_ids: An array of UUIDs for any Users who may be Owners of the Stories.
+        param project_id: The IDs for the Projects the Stories may be assigned to.
+        param project_ids: The IDs for the Projects the Stories may be assigned to.
+        param requested_by_id: The UUID of any Users who may have requested the Stories.
+        param story_type: The type of Stories that you want returned.
+        param updated_at_end: Stories should have been updated before this date.
+        param updated_at_start: Stories should have been updated after this date.
+        param workflow_state_id: The unique IDs of the specific Workflow States that the Stories should be in.
+        param workflow_state_types: The type of Workflow State the Stories may be in.
+        """
+        return (
+            await self.post(
+                "/stories/search",
+                PrepareLocals(
+                    {
+                        "archived": archived,
+                        "completed_at_end": completed_at_end,
+                        "completed_at_start": completed_at_start,
+                        "created_at_end": created_at_end,
+                        "created_at_start": created_at_start,
+                        "deadline_end": deadline_end,
+                        "deadline_start": deadline_start,
+                        "epic_id": epic_id,
+                        "epic_ids": epic_ids,
+                        "estimate": estimate,
+                        "external_id": external_id,
+                        "iteration_id": iteration_id,
+                        "iteration_ids": iteration_ids,
+                        "label_ids": label_ids,
+                        "label_name": label_name,
+                        "owner_id": owner_id,
+                        "owner_ids": owner_ids,
+                        "project_id": project_id,
+                        "project_ids": project_ids,
+                        "requested_by_id": requested_by_id,
+                        "story_type": story_type,
+                        "updated_at_end": updated_at_end,
+                        "updated_at_start": updated_at_start,
+                        "workflow_state_id": workflow_state_id,
+                        "workflow_state_types": workflow_state_types,
+                    }
+                ),
+            )
+        ).json()
+
+    async def updateComment(
+        self, comment_public_id: int, story_public_id: int, text: str
+    ) -> Comment:
+        """
+        Update Comment replaces the text of the existing Comment.
+
+        param comment_public_id: Required. The ID of the Comment
+        param story_public_id: Required. The ID of the Story that the Comment is in.
+        param text: Required. The updated comment text.
+        """
+        return (
+            await self.put(
+                "/stories/{story_public_id}/comments/{comment_public_id}".format(
+                    comment_public_id=comment_public_id, story_public_id=story_public_id
+                ),
+                PrepareLocals({"text": text}),
+            )
+        ).json()
+
+    async def updateMultipleStories(
+        self,
+        story_ids: List[int],
+        after_id: int = Omit,  # type: ignore
+        archived: bool = Omit,  # type: ignore
+        before_id: int = Omit,  # type: ignore
+        deadline: Optional[datetime] = Omit,  # type: ignore
+        epic_id: Optional[int] = Omit,  # type: ignore
+        estimate: Optional[int] = Omit,  # type: ignore
+        follower_ids_add: List[str] = Omit,  # type: ignore
+        follower_ids_remove: List[str] = Omit,  # type: ignore
+        iteration_id: Optional[int] = Omit,  # type: ignore
+        labels_add: List[CreateLabelParams] = Omit,  # type: ignore
+        labels_remove: List[CreateLabelParams] = Omit,  # type: ignore
+        owner_ids_add: List[str] = Omit,  # type: ignore
+        owner_ids_remove: List[str] = Omit,  # type: ignore
+        project_id: int = Omit,  # type: ignore
+        requested_by_id: str = Omit,  # type: ignore
+        story_type: StoryType = Omit,  # type: ignore
+        workflow_state_id: int = Omit,  # type: ignore
+    ) -> List[StorySlim]:
+        """
+        Update Multiple Stories allows you to make changes to numerous stories at once.
+
+        param story_ids: Required. The unique IDs of the Stories you wish to update.
+        param after_id: The ID of the story that the stories are to be moved below.
+        param archived: If the Stories should be archived or not.
+        param before_id: The ID of the story that the stories are to be moved before.
+        param deadline: The due date of the story.
+        param epic_id: The ID of the epic the story belongs to.
+        param estimate: The numeric point estimate of the story. Can also be null, which means unestimated.
+        param follower_ids_add: The UUIDs of the new followers to be added.
+        param follower_ids_remove: The UUIDs of the followers to be removed.
+        param iteration_id: The ID of the iteration the story belongs to.
+        param labels_add: An array of labels to be added.
+        param labels_remove: An array of labels to be removed.
+        param owner_ids_add: The UUIDs of the new owners to be added.
+        param owner_ids_remove: The UUIDs of the owners to be removed.
+        param project_id: The ID of the Project the Stories should belong to.
+        param requested_by_id: The ID of the member that requested the story.
+        param story_type: The type of story (feature, bug, chore).
+        param workflow_state_id: The ID of the workflow state the story is currently in.
+        """
+        return (
+            await self.put(
+                "/stories/bulk",
+                PrepareLocals(
+                    {
+                        "story_ids": story_ids,
+                        "after_id": after_id,
+                        "archived": archived,
+                        "before_id": before_id,
+                        "deadline": deadline,
+                        "epic_id": epic_id,
+                        "estimate": estimate,
+                        "follower_ids_add": follower_ids_add,
+                        "follower_ids_remove": follower_ids_remove,
+                        "iteration_id": iteration_id,
+                        "labels_add": labels_add,
+                        "labels_remove": labels_remove,
+                        "owner_ids_add": owner_ids_add,
+                        "owner_ids_remove": owner_ids_remove,
+                        "project_id": project_id,
+                        "requested_by_id": requested_by_id,
+                        "story_type": story_type,
+                        "workflow_state_id": workflow_state_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def updateStory(
+        self,
+        story_public_id: int,
+        after_id: int = Omit,  # type: ignore
+        archived: bool = Omit,  # type: ignore
+        before_id: int = Omit,  # type: ignore
+        branch_ids: List[int] = Omit,  # type: ignore
+        commit_ids: List[int] = Omit,  # type: ignore
+        completed_at_override: Optional[datetime] = Omit,  # type: ignore
+        deadline: Optional[datetime] = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        epic_id: Optional[int] = Omit,  # type: ignore
+        estimate: Optional[int] = Omit,  # type: ignore
+        file_ids: List[int] = Omit,  # type: ignore
+        follower_ids: List[str] = Omit,  # type: ignore
+        iteration_id: Optional[int] = Omit,  # type: ignore
+        labels: List[CreateLabelParams] = Omit,  # type: ignore
+        linked_file_ids: List[int] = Omit,  # type: ignore
+        name: str = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+        project_id: int = Omit,  # type: ignore
+        pull_request_ids: List[int] = Omit,  # type: ignore
+        requested_by_id: str = Omit,  # type: ignore
+        started_at_override: Optional[datetime] = Omit,  # type: ignore
+        story_type: StoryType = Omit,  # type: ignore
+        workflow_state_id: int = Omit,  # type: ignore
+    ) -> Story:
+        """
+        Update Story can be used to update Story properties.
+
+        param story_public_id: Required. The unique identifier of this story.
+        param after_id: The ID of the story we want to move this story after.
+        param archived: True if the story is archived, otherwise false.
+        param before_id: The ID of the story we want to move this story before.
+        param branch_ids: An array of IDs of Branches attached to the story.
+        param commit_ids: An array of IDs of Commits attached to the story.
+        param completed_at_override: A manual override for the time/date the Story was completed.
+        param deadline: The due date of the story.
+        param description: The description of the story.
+        param epic_id: The ID of the epic the story belongs to.
+        param estimate: The numeric point estimate of the story. Can also be null, which means unestimated.
+        param file_ids: An array of IDs of files attached to the story.
+        param follower_ids: An array of UUIDs of the followers of this story.
+        param iteration_id: The ID of the iteration the story belongs to.
+        param labels: An array of labels attached to the story.
+        param linked_file_ids: An array of IDs of linked files attached to the story.
+        param name: The title of the story.
+        param owner_ids: An array of UUIDs of the owners of this story.
+        param project_id: The ID of the project the story belongs to.
+        param pull_request_ids: An array of IDs of Pull/Merge Requests attached to the story.
+        param requested_by_id: The ID of the member that requested the story.
+        param started_at_override: A manual override for the time/date the Story was started.
+        param story_type: The type of story (feature, bug, chore).
+        param workflow_state_id: The ID of the workflow state the story is currently in.
+        """
+        return (
+            await self.put(
+                "/stories/{story_public_id}".format(story_public_id=story_public_id),
+                PrepareLocals(
+                    {
+                        "after_id": after_id,
+                        "archived": archived,
+                        "before_id": before_id,
+                        "branch_ids": branch_ids,
+                        "commit_ids": commit_ids,
+                        "completed_at_override": completed_at_override,
+                        "deadline": deadline,
+                        "description": description,
+                        "epic_id": epic_id,
+                        "estimate": estimate,
+                        "file_ids": file_ids,
+                        "follower_ids": follower_ids,
+                        "iteration_id": iteration_id,
+                        "labels": labels,
+                        "linked_file_ids": linked_file_ids,
+                        "name": name,
+                        "owner_ids": owner_ids,
+                        "project_id": project_id,
+                        "pull_request_ids": pull_request_ids,
+                        "requested_by_id": requested_by_id,
+                        "started_at_override": started_at_override,
+                        "story_type": story_type,
+                        "workflow_state_id": workflow_state_id,
+                    }
+                ),
+            )
+        ).json()
+
+    async def updateTask(
+        self,
+        story_public_id: int,
+        task_public_id: int,
+        after_id: int = Omit,  # type: ignore
+        before_id: int = Omit,  # type: ignore
+        complete: bool = Omit,  # type: ignore
+        description: str = Omit,  # type: ignore
+        owner_ids: List[str] = Omit,  # type: ignore
+    ) -> Task:
+        """
+        Update Task can be used to update Task properties.
+
+        param story_public_id: Required. The unique identifier of the parent Story.
+        param task_public_id: Required. The unique identifier of the Task you wish to update.
+        param after_id: Move task after this task ID.
+        param before_id: Move task before this task ID.
+        param complete: A true/false boolean indicating whether the task is complete.
+        param description: The Task’s description.
+        param owner_ids: An array of UUIDs of the owners of this story.
+        """
+        return (
+            await self.put(
+                "/stories/{story_public_id}/tasks/{task_public_id}".format(
+                    story_public_id=story_public_id, task_public_id=task_public_id
+                ),
+                PrepareLocals(
+                    {
+                        "after_id": after_id,
+                        "before_id": before_id,
+                        "complete": complete,
+                        "description": description,
+                        "owner_ids": owner_ids,
+                    }
+                ),
+            )
+        ).json()
+
+    ###############
+    # Story-Links #
+    ###############
+
+    async def createStoryLink(
+        self, object_id: int, subject_id: int, verb: StoryLinkVerb
+    ) -> StoryLink:
+        """
+        Story Links (called Story Relationships in the UI) allow you create semantic relationships between two stories. The parameters read like an active voice grammatical sentence: subject -> verb -> object.
+        The subject story acts on the object Story; the object story is the direct object of the sentence.
+        The subject story “blocks”, “duplicates”, or “relates to” the object story. Examples:
+        “story 5 blocks story 6” – story 6 is now “blocked” until story 5 is moved to a Done workflow state.
+        “story 2 duplicates story 1” – Story 2 represents the same body of work as Story 1 (and should probably be archived).
+        “story 7 relates to story 3”
+
+        param object_id: Required. The ID of the object Story.
+        param subject_id: Required. The ID of the subject Story.
+        param verb: Required. The type of link.
+        """
+        return (
+            await self.post(
+                "/story-links",
+                PrepareLocals(
+                    {"object_id": object_id, "subject_id": subject_id, "verb": verb}
+                ),
+            )
+        ).json()
+
+    async def deleteStoryLink(self, story_link_public_id: int):
+        """
+        Delete Story Link can be used to delete any Story Link.
+
+        param story_link_public_id: Required. The unique ID of the Story Link.
+        """
+        await self.delete(
+            "/story-links/{story_link_public_id}".format(
+                story_link_public_id=story_link_public_id
+            )
+        )
+
+    async def getStoryLink(self, story_link_public_id: int) -> StoryLink:
+        """
+        Returns information about the selected Story Link.
+
+        param story_link_public_id: Required. The unique ID of the Story Link.
+        """
+        return (
+            await self.get(
+                "/story-links/{story_link_public_id}".format(
+                    story_link_public_id=story_link_public_id
+                )
+            )
+        ).json()
+
+    async def updateStoryLink(
+        self, story_link_public_id: int, verb: StoryLinkVerb
+    ) -> StoryLink:
+        """
+        Update the relationship for the Story Link.
+
+        param story_link_public_id: Required. The unique ID of the Story Link.
+        param verb: Required. The type of link.
+        """
+        return (
+            await self.put(
+                "/story-links/{story_link_public_id}".format(
+                    story_link_public_id=story_link_public_id
+                ),
+                PrepareLocals({"verb": verb}),
+            )
+        ).json()
+
+    #########
+    # Teams #
+    #########
+
+    async def getTeam(self, team_public_id: int) -> Team:
+        """
+        Get Team is used to get Team information.
+
+        param team_public_id: Required. The ID of the team.
+        """
+        return (
+            await self.get(
+                "/teams/{team_public_id}".format(team_public_id=team_public_id)
+            )
+        ).json()
+
+    async def listTeams(self) -> List[Team]:
+        """List Teams returns a list of all Teams in the organization."""
+        return (await self.get("/teams")).json()
+
+    #############
+    # Workflows #
+    #############
+
+    async def listWorkflows(self) -> List[Workflow]:
+        """List Workflows returns a list of all Workflows in the organization."""
+        return (await self.get("/workflows")).json()
@@ -0,0 +1,61 @@
+"""Helpers for fetching many resources concurrently."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, NamedTuple, Optional
+
+
+class BatchResult(NamedTuple):
+    """The outcome of fetching a single id as part of a batch; exactly one of result and error is set."""
+
+    result: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def FetchMany(
+    fetch: Callable[[Any], Any], ids: Iterable[Hashable], max_workers: int = 8
+) -> Dict[Any, BatchResult]:
+    """
+    Call fetch once for every distinct id using a bounded thread pool.
+
+    param fetch: Fetches the resource for a single id.
+    param ids: The ids to fetch. Repeated ids are only fetched once.
+    param max_workers: The maximum number of fetches in flight at once.
+
+    Returns a dict keyed by id, in the order each id first appeared, of BatchResults. Errors raised by fetch are
+    captured in the BatchResult rather than propagated, so one missing resource does not fail the whole batch.
+    """
+    unique = list(dict.fromkeys(ids))
+    results: Dict[Any, BatchResult] = {}
+    if not unique:
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+        futures = [(i, pool.submit(fetch, i)) for i in unique]
+        for i, future in futures:
+            error = future.exception()
+            results[i] = BatchResult(
+                None if error is not None else future.result(), error
+            )
+    return results
+
+
+async def FetchManyAsync(
+    fetch: Callable[[Any], Any], ids: Iterable[Hashable], max_concurrency: int = 50
+) -> Dict[Any, BatchResult]:
+    """The asyncio counterpart to FetchMany; fetch must be a coroutine function."""
+    unique = list(dict.fromkeys(ids))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(i) -> BatchResult:
+        async with semaphore:
+            try:
+                return BatchResult(await fetch(i), None)
+            except Exception as e:
+                return BatchResult(None, e)
+
+    outcomes = await asyncio.gather(*(bounded(i) for i in unique))
+    return dict(zip(unique, outcomes))
@@ -0,0 +1,154 @@
+"""Chunked, concurrent execution of the bulk story endpoints."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import requests
+
+from .batch import BatchResult
+from .ratelimit import RequestScheduler
+from .serializer import JSONSerializer
+
+# The largest number of stories the /stories/bulk endpoints accept in one request
+BULK_CHUNK_SIZE = 100
+
+
+class BulkProgress(NamedTuple):
+    """A snapshot of a bulk job, handed to progress callbacks after every chunk."""
+
+    completed: int  # Items in chunks which succeeded.
+    failed: int  # Items in chunks which failed after every attempt.
+    total: int  # Items in the whole job.
+    elapsed: float  # Seconds since the job started.
+
+    @property
+    def rate(self) -> float:
+        """Items processed per second so far."""
+        return (self.completed + self.failed) / self.elapsed if self.elapsed else 0.0
+
+
+class UpdatePlanStep(NamedTuple):
+    """A set of stories which all receive the same changes in a single request."""
+
+    story_ids: List[int]
+    changes: dict
+
+
+def PlanUpdates(
+    edits: Iterable[Tuple[int, dict]], chunk_size: int = BULK_CHUNK_SIZE
+) -> List[UpdatePlanStep]:
+    """
+    Group per-story edits into as few Update Multiple Stories requests as possible.
+
+    Edits to the same story are merged in order, so later values win. Stories whose merged changes are identical are
+    then grouped together and each group is split into chunks of at most chunk_size stories.
+
+    param edits: Required. (story_id, changes) pairs, where changes are Update Multiple Stories parameters.
+    param chunk_size: The largest number of stories in a single step.
+    """
+    merged: Dict[int, dict] = {}
+    for story_id, changes in edits:
+        merged.setdefault(story_id, {}).update(changes)
+    encode = JSONSerializer().dumps
+    groups: Dict[bytes, UpdatePlanStep] = {}
+    for story_id, changes in merged.items():
+        if not changes:
+            continue
+        key = encode(sorted(changes.items()))
+        groups.setdefault(key, UpdatePlanStep([], changes)).story_ids.append(story_id)
+    return [
+        UpdatePlanStep(story_ids, step.changes)
+        for step in groups.values()
+        for story_ids in Chunk(step.story_ids, chunk_size)
+    ]
+
+
+def IsTransient(error: Exception) -> bool:
+    """Whether a failed chunk is worth retrying: connection problems and server errors are, client errors are not."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def Chunk(items: Sequence, size: int) -> List[list]:
+    """Split items into consecutive lists of at most size items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def RunChunks(
+    func: Callable[[Any], Any],
+    chunks: Sequence,
+    max_workers: int = 4,
+    max_attempts: int = 3,
+    progress: Optional[Callable[[BulkProgress], None]] = None,
+    size: Callable[[Any], int] = len,
+    scheduler: Optional[RequestScheduler] = None,
+) -> List[BatchResult]:
+    """
+    Call func on every chunk over a bounded thread pool, retrying chunks which fail transiently.
+
+    Every attempt at a chunk gets the scheduler's own retries as well, which it only makes for idempotent verbs. Pick
+    max_attempts accordingly: the bulk endpoints retry POST chunks here but leave PUT and DELETE to the scheduler.
+
+    param func: Processes a single chunk.
+    param chunks: The chunks to process, e.g. as produced by Chunk.
+    param max_workers: The maximum number of chunks in flight at once.
+    param max_attempts: The number of times a chunk is tried before its error is recorded, backing off in between.
+    param progress: Called with a BulkProgress after every chunk finishes.
+    param size: Returns the number of items in a chunk, for progress reporting.
+    param scheduler: The scheduler func's requests go through, whose backoff is used between attempts.
+
+    Returns one BatchResult per chunk, in the order of chunks.
+    """
+    total = sum(size(chunk) for chunk in chunks)
+    started = time.monotonic()
+    counts = {"completed": 0, "failed": 0}
+
+    backoff = (scheduler or RequestScheduler(rate=None)).backoff
+
+    def attempt(chunk) -> Any:
+        for i in range(max_attempts):
+            try:
+                return func(chunk)
+            except Exception as e:
+                if i + 1 >= max_attempts or not IsTransient(e):
+                    raise
+            time.sleep(backoff(i))
+
+    if not chunks:
+        return []
+    results: List[Optional[BatchResult]] = [None] * len(chunks)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+        futures = {pool.submit(attempt, chunk): i for i, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            index = futures[future]
+            error = future.exception()
+            results[index] = BatchResult(
+                None if error is not None else future.result(), error
+            )
+            counts["failed" if error is not None else "completed"] += size(
+                chunks[index]
+            )
+            if progress is not None:
+                progress(
+                    BulkProgress(
+                        counts["completed"],
+                        counts["failed"],
+                        total,
+                        time.monotonic() - started,
+                    )
+                )
+    return results  # type: ignore
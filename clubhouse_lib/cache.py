@@ -0,0 +1,179 @@
+"""Response caching for read-only Clubhouse endpoints."""
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+from urllib.parse import parse_qsl
+
+import requests
+
+# Reference data which rarely changes. Keys match an endpoint and everything beneath it.
+DEFAULT_TTLS = {
+    "/categories": 300.0,
+    "/epic-workflow": 300.0,
+    "/labels": 300.0,
+    "/members": 300.0,
+    "/teams": 300.0,
+    "/workflows": 300.0,
+}
+
+
+def Segments(endpoint: str) -> Tuple[str, ...]:
+    return tuple(s for s in endpoint.split("?")[0].strip("/").split("/") if s)
+
+
+def Validators(response: requests.Response) -> Dict[str, str]:
+    """The conditional request headers which ask whether a response has changed, from its ETag and Last-Modified."""
+    headers = {}
+    if response.headers.get("ETag"):
+        headers["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
+
+
+class ResponseCache:
+    """
+    A thread-safe LRU cache of GET responses with per-endpoint time to live.
+
+    Entries are keyed on the endpoint and query parameters, never the API token. A mutating request on the same client
+    invalidates every entry whose endpoint mentions the resource family it touched, e.g. updating /labels/5 drops
+    /labels and /labels/5/epics.
+
+    With revalidate, responses carrying an ETag or Last-Modified header are kept past their time to live, on any
+    endpoint. Once expired they are revalidated with a conditional request, and a 304 Not Modified answer serves the
+    cached body again without downloading it; bytes_saved counts what that avoided.
+
+    param maxsize: The maximum number of responses kept.
+    param maxbytes: The maximum total size of the response bodies kept. None leaves it unbounded.
+    param ttls: Seconds to keep responses for, keyed by endpoint prefix. Defaults to DEFAULT_TTLS.
+    param default_ttl: Seconds to keep responses of endpoints not listed in ttls. 0 disables caching them.
+    param revalidate: Keep responses which have validators and revalidate them once they expire.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        maxbytes: Optional[int] = 64 * 1024 * 1024,
+        ttls: Dict[str, float] = None,
+        default_ttl: float = 0.0,
+        revalidate: bool = False,
+    ) -> None:
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.revalidate = revalidate
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+        # key -> (expiry, endpoint segments, response), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl(self, endpoint: str) -> float:
+        """The number of seconds responses from an endpoint are cached for, using the longest matching prefix in ttls."""
+        segments = Segments(endpoint)
+        for i in range(len(segments), 0, -1):
+            prefix = "/" + "/".join(segments[:i])
+            if prefix in self.ttls:
+                return self.ttls[prefix]
+        return self.default_ttl
+
+    def cacheable(self, endpoint: str) -> bool:
+        """Whether responses from an endpoint can be kept at all, so lookups for those which cannot are not misses."""
+        return self.revalidate or self.ttl(endpoint) > 0
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[dict]) -> Hashable:
+        # A query string in the endpoint itself counts as much as params do
+        items = parse_qsl(endpoint.partition("?")[2], keep_blank_values=True)
+        if params is not None:
+            items += params.items()
+        return (
+            "/" + "/".join(Segments(endpoint)),
+            tuple(sorted((k, str(v)) for k, v in items if k != "token")),
+        )
+
+    def get(self, key: Hashable) -> Optional[requests.Response]:
+        response, fresh = self.lookup(key)
+        return response if fresh else None
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[requests.Response], bool]:
+        """The cached response for a key, if any, and whether it is still fresh or must be revalidated before use."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2], True
+            self.misses += 1
+            if entry is None:
+                return None, False
+            if self.revalidate and Validators(entry[2]):
+                self._entries.move_to_end(key)
+                return entry[2], False
+            self._drop(key)
+            return None, False
+
+    def set(self, key: Hashable, endpoint: str, response: requests.Response) -> None:
+        ttl = self.ttl(endpoint)
+        if ttl <= 0 and not (self.revalidate and Validators(response)):
+            return
+        ttl = max(ttl, 0.0)
+        size = len(response.content)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, Segments(endpoint), response)
+            self.size += size
+            while len(self._entries) > self.maxsize or (
+                self.maxbytes is not None and self.size > self.maxbytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def revalidated(
+        self, key: Hashable, endpoint: str, response: requests.Response
+    ) -> None:
+        """Record that the server answered 304 Not Modified for a cached response, making it fresh again."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is response:
+                self._entries[key] = (
+                    time.monotonic() + max(self.ttl(endpoint), 0.0),
+                    entry[1],
+                    response,
+                )
+                self._entries.move_to_end(key)
+            self.not_modified += 1
+            self.bytes_saved += len(response.content)
+
+    def _drop(self, key: Hashable) -> None:
+        self.size -= len(self._entries.pop(key)[2].content)
+
+    def invalidate(self, endpoint: str) -> int:
+        """Drop every cached response belonging to the resource family of an endpoint, returning how many were dropped."""
+        segments = Segments(endpoint)
+        if not segments:
+            return 0
+        family = segments[0]
+        with self._lock:
+            stale = [k for k, v in self._entries.items() if family in v[1]]
+            for key in stale:
+                self._drop(key)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
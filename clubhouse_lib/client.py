@@ -1,8 +1,36 @@
-from datetime import datetime
-import json
+from datetime import date, datetime
+import inspect
+import os
+import time
 import requests
-from typing import List, Optional
-
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from .batch import BatchResult, FetchMany
+from .bulk import (
+    BULK_CHUNK_SIZE,
+    BulkProgress,
+    Chunk,
+    PlanUpdates,
+    RunChunks,
+    UpdatePlanStep,
+)
+from .cache import ResponseCache, Validators
+from .endpoints import ENDPOINT_TEMPLATES
+from .events import Emit, EndpointTemplates, RequestEvent
+from .files import (
+    DownloadTo,
+    FileSource,
+    MultipartEncoder,
+    TRANSFER_CHUNK_SIZE,
+    TransferProgress,
+)
+from .ratelimit import RequestScheduler
+from .search import IterPages, IterSharded
+from .serializer import DefaultSerializer, InterningSerializer
+from .singleflight import SingleFlight
+from .stream import IterJSONArray
+from .transport import ClubhouseResponse, CreateSession, GzipBody, TransferStats
 from .type import (
     Category,
     CategoryType,
@@ -80,6 +108,10 @@ def PrepareLocals(data: dict) -> dict:
     return data
 
 
+# Labels request events with the template of their endpoint rather than the endpoint itself
+TEMPLATES = EndpointTemplates(ENDPOINT_TEMPLATES)
+
+
 class ClubhouseClient:
     def __init__(
         self,
@@ -87,21 +119,173 @@ class ClubhouseClient:
         baseURL: str = "https://api.clubhouse.io",
         version: str = "v3",
         debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        pool_idle_timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        cache: Optional[ResponseCache] = None,
+        serializer=None,
+        intern_strings: bool = False,
+        singleflight: Optional[SingleFlight] = None,
+        compress_threshold: Optional[int] = None,
+        sinks: Iterable[Callable[[RequestEvent], None]] = (),
     ) -> None:
+        """
+        param token: Required. The Clubhouse API token used to authenticate every request.
+        param baseURL: The root URL of the Clubhouse API.
+        param version: The API version to target.
+        param debug: Print an equivalent curl command for every request.
+        param pool_connections: The number of per-host connection pools to keep around.
+        param pool_maxsize: The maximum number of connections kept alive for any one host.
+        param keep_alive: When false, connections are closed after every request instead of being reused.
+        param pool_idle_timeout: Seconds the pool may sit unused before its connections are discarded. None keeps them forever.
+        param session: A preconfigured requests.Session to use instead of building one from the pool settings.
+        param scheduler: Paces and retries requests. Defaults to a RequestScheduler matching the Clubhouse rate limit.
+        param cache: Caches responses of read-only endpoints, and revalidates them with conditional requests if so configured. Responses are not cached by default.
+        param serializer: Encodes request bodies and decodes responses. Defaults to orjson when installed, json otherwise.
+        param intern_strings: Intern the UUIDs, entity types and label names of decoded responses, and turn Enum fields into Enums, to save memory on large responses.
+        param singleflight: Coalesces identical GET requests made concurrently, e.g. from many threads, into one. GETs are not coalesced by default.
+        param compress_threshold: Gzip the bodies of requests which are at least this many bytes, e.g. bulk story creates and updates. Bodies are sent uncompressed by default.
+        param sinks: Called with a RequestEvent after every request, and every response served from the cache, e.g. a LatencyHistogram or OpenTelemetrySink. More can be appended to client.sinks later.
+        """
         self.token = token
         self.baseURL = baseURL
         self.version = version
         self.debug = debug
         self.apiURL = baseURL.rstrip("/") + "/api/" + version
+        if session is None:
+            session = CreateSession(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                keep_alive=keep_alive,
+                pool_idle_timeout=pool_idle_timeout,
+            )
+        self.session = session
+        if scheduler is None:
+            scheduler = RequestScheduler()
+        self.scheduler = scheduler
+        self.cache = cache
+        self.singleflight = singleflight
+        if serializer is None:
+            serializer = DefaultSerializer()
+        if intern_strings:
+            serializer = InterningSerializer(serializer)
+        self.serializer = serializer
+        self.compress_threshold = compress_threshold
+        self.transfer = TransferStats()
+        self.sinks = list(sinks)
+
+    def close(self) -> None:
+        """Release every pooled connection held by the client."""
+        self.session.close()
+
+    def __enter__(self) -> "ClubhouseClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     ############
     # Requests #
     ############
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the session under the scheduler's rate limit and retry policy, reporting it to the sinks."""
+        attempts = 0
+
+        def request() -> requests.Response:
+            nonlocal attempts
+            attempts += 1
+            return self.session.request(method, url, **kwargs)
+
+        started = time.time()
+        start = time.perf_counter()
+        data = kwargs.get("data")
+        r = None
+        received = 0
+        try:
+            r = self.scheduler.send(method, request)
+            if not kwargs.get("stream"):
+                received = self.transfer.received(r)
+            r.raise_for_status()
+        except Exception as e:
+            self.record(
+                method,
+                url,
+                started,
+                start,
+                status=None if r is None else r.status_code,
+                bytes_sent=0 if data is None else len(data),
+                bytes_received=received,
+                retries=max(attempts - 1, 0),
+                error=e,
+            )
+            raise
+        self.record(
+            method,
+            url,
+            started,
+            start,
+            status=r.status_code,
+            bytes_sent=0 if data is None else len(data),
+            bytes_received=received,
+            retries=attempts - 1,
+        )
+        return ClubhouseResponse.adopt(r, self.serializer)
+
+    def record(
+        self, method: str, url: str, started: float, start: float, **fields
+    ) -> None:
+        """Hand a RequestEvent for a request to the sinks, if there are any."""
+        if not self.sinks:
+            return
+        path = urlsplit(url).path
+        api_path = urlsplit(self.apiURL).path
+        if path.startswith(api_path):
+            path = path[len(api_path) :]
+        Emit(
+            self.sinks,
+            RequestEvent(
+                method=method,
+                endpoint=TEMPLATES(path),
+                latency=time.perf_counter() - start,
+                started=started,
+                **fields,
+            ),
+        )
+
+    def compress(self, body: bytes, headers: dict) -> bytes:
+        """Gzip a request body if it is at least compress_threshold bytes, marking it in headers, and count its bytes."""
+        size = len(body)
+        if self.compress_threshold is not None and size >= self.compress_threshold:
+            body = GzipBody(body)
+            headers["Content-Encoding"] = "gzip"
+        self.transfer.sent(size, len(body))
+        return body
+
     def get(self, endpoint: str, params: dict = None) -> requests.Response:
         if params is None:
             params = {}
+        key = ResponseCache.key(endpoint, params)
+        cached = None
+        if self.cache is not None and self.cache.cacheable(endpoint):
+            cached, fresh = self.cache.lookup(key)
+            if fresh:
+                self.record(
+                    "GET",
+                    endpoint,
+                    time.time(),
+                    time.perf_counter(),
+                    status=cached.status_code,
+                    cache_hit=True,
+                )
+                return cached
         params["token"] = self.token
         headers = {"Content-Type": "application/json"}
+        if cached is not None:
+            # Ask the server whether the stale cached response is still current
+            headers.update(Validators(cached))
         if self.debug:
             print(
                 "curl -X GET -H \"Content-Type: application/json\" '{}/{}?{}'".format(
@@ -110,48 +294,67 @@ class ClubhouseClient:
                     "&".join("{}={}".format(k, v) for k, v in params.items()),
                 )
             )
-        r = requests.get(
-            "{}/{}".format(self.apiURL, endpoint.lstrip("/")),
-            params=params,
-            headers=headers,
-        )
-        r.raise_for_status()
-        return r
+
+        def fetch() -> requests.Response:
+            r = self.send(
+                "GET",
+                "{}/{}".format(self.apiURL, endpoint.lstrip("/")),
+                params=params,
+                headers=headers,
+            )
+            if r.status_code == 304 and cached is not None:
+                self.cache.revalidated(key, endpoint, cached)
+                return cached
+            if self.cache is not None:
+                self.cache.set(key, endpoint, r)
+            return r
+
+        if self.singleflight is None:
+            return fetch()
+        return self.singleflight.do(key, fetch)
 
     def put(self, endpoint: str, data: dict = None) -> requests.Response:
         if data is None:
             data = {}
         headers = {"Content-Type": "application/json"}
+        body = self.serializer.dumps(data)
         if self.debug:
             print(
                 "curl -X PUT -H \"Content-Type: application/json\" '{}/{}?token={}' --data '{}'".format(
-                    self.apiURL, endpoint.lstrip("/"), self.token, json.dumps(data)
+                    self.apiURL, endpoint.lstrip("/"), self.token, body.decode("utf-8")
                 )
             )
-        r = requests.put(
+        body = self.compress(body, headers)
+        r = self.send(
+            "PUT",
             "{}/{}?token={}".format(self.apiURL, endpoint.lstrip("/"), self.token),
-            data=json.dumps(data),
+            data=body,
             headers=headers,
         )
-        r.raise_for_status()
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
         return r
 
     def post(self, endpoint: str, data: dict = None) -> requests.Response:
         if data is None:
             data = {}
         headers = {"Content-Type": "application/json"}
+        body = self.serializer.dumps(data)
         if self.debug:
             print(
                 "curl -X POST -H \"Content-Type: application/json\" '{}/{}?token={}' --data '{}'".format(
-                    self.apiURL, endpoint.lstrip("/"), self.token, json.dumps(data)
+                    self.apiURL, endpoint.lstrip("/"), self.token, body.decode("utf-8")
                 )
             )
-        r = requests.post(
+        body = self.compress(body, headers)
+        r = self.send(
+            "POST",
             "{}/{}?token={}".format(self.apiURL, endpoint.lstrip("/"), self.token),
-            data=json.dumps(data),
+            data=body,
             headers=headers,
         )
-        r.raise_for_status()
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
         return r
 
     def delete(self, endpoint: str, data: dict = None) -> requests.Response:
@@ -164,15 +367,452 @@ class ClubhouseClient:
             )
         pass_data = data
         if pass_data is not None:
-            pass_data = (json.dumps(data),)
-        r = requests.delete(
+            pass_data = self.compress(self.serializer.dumps(data), headers)
+        r = self.send(
+            "DELETE",
             "{}/{}?token={}".format(self.apiURL, endpoint.lstrip("/"), self.token),
             data=pass_data,
             headers=headers,
         )
-        r.raise_for_status()
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
         return r
 
+    def stream(
+        self, endpoint: str, params: dict = None, chunk_size: int = 64 * 1024
+    ) -> Iterator[Any]:
+        """
+        Make a GET request whose response is a JSON array and yield its elements as they are parsed off the socket.
+
+        param endpoint: Required. The endpoint to request.
+        param params: The query parameters of the request.
+        param chunk_size: The number of bytes read from the socket at a time.
+        """
+        params = dict(params or {})
+        params["token"] = self.token
+        if self.debug:
+            print(
+                "curl -X GET -H \"Content-Type: application/json\" '{}/{}?{}'".format(
+                    self.apiURL,
+                    endpoint.lstrip("/"),
+                    "&".join("{}={}".format(k, v) for k, v in params.items()),
+                )
+            )
+        r = self.send(
+            "GET",
+            "{}/{}".format(self.apiURL, endpoint.lstrip("/")),
+            params=params,
+            headers={"Content-Type": "application/json"},
+            stream=True,
+        )
+        decoded = 0
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal decoded
+            for chunk in r.iter_content(chunk_size):
+                decoded += len(chunk)
+                yield chunk
+
+        items = IterJSONArray(chunks(), r.encoding or "utf-8")
+        # Elements are decoded here rather than by the serializer, so apply its interning to them too
+        if isinstance(self.serializer, InterningSerializer):
+            items = map(self.serializer.intern, items)
+        try:
+            yield from items
+        finally:
+            self.transfer.received(r, decoded)
+            r.close()
+
+    ###########
+    # Batches #
+    ###########
+
+    def getStories(
+        self, story_public_ids: Iterable[int], max_workers: int = 8
+    ) -> Dict[int, BatchResult]:
+        """
+        Get Stories fetches many Stories concurrently, returning a BatchResult holding the Story or error for each id.
+
+        param story_public_ids: Required. The IDs of the Stories. Repeated IDs are only fetched once.
+        param max_workers: The maximum number of requests in flight at once.
+        """
+        return FetchMany(self.getStory, story_public_ids, max_workers)
+
+    def getEpics(
+        self, epic_public_ids: Iterable[int], max_workers: int = 8
+    ) -> Dict[int, BatchResult]:
+        """
+        Get Epics fetches many Epics concurrently, returning a BatchResult holding the Epic or error for each id.
+
+        param epic_public_ids: Required. The IDs of the Epics. Repeated IDs are only fetched once.
+        param max_workers: The maximum number of requests in flight at once.
+        """
+        return FetchMany(self.getEpic, epic_public_ids, max_workers)
+
+    def getMembers(
+        self,
+        member_public_ids: Iterable[str],
+        org_public_id: str = Omit,  # type: ignore
+        max_workers: int = 8,
+    ) -> Dict[str, BatchResult]:
+        """
+        Get Members fetches many Members concurrently, returning a BatchResult holding the Member or error for each id.
+
+        param member_public_ids: Required. The IDs of the Members. Repeated IDs are only fetched once.
+        param org_public_id: The unique ID of the Organization to limit the lookup to.
+        param max_workers: The maximum number of requests in flight at once.
+        """
+        return FetchMany(
+            lambda member_public_id: self.getMember(member_public_id, org_public_id),
+            member_public_ids,
+            max_workers,
+        )
+
+    def createStories(
+        self,
+        stories: Iterable[CreateStoryParams],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: int = 4,
+        max_attempts: int = 3,
+        progress: Callable[[BulkProgress], None] = None,
+    ) -> List[BatchResult]:
+        """
+        Create Stories creates any number of stories by splitting them into Create Multiple Stories requests which are sent concurrently.
+
+        Returns one BatchResult per input story, in input order, holding the created StorySlim or the error of its chunk.
+        Chunks failing with a server or connection error are retried. Such a chunk may in fact have been created, so give
+        stories an external_id to be able to find any duplicates afterwards.
+
+        param stories: Required. The stories to be created.
+        param chunk_size: The number of stories sent per request.
+        param max_workers: The maximum number of requests in flight at once.
+        param max_attempts: The number of times a chunk is tried before giving up on it, backing off in between.
+        param progress: Called with a BulkProgress after every chunk.
+        """
+        stories = list(stories)
+        chunks = Chunk(stories, chunk_size)
+        outcomes = RunChunks(
+            self.createMultipleStories,
+            chunks,
+            max_workers,
+            max_attempts,
+            progress,
+            scheduler=self.scheduler,
+        )
+        results: List[BatchResult] = []
+        for requested, outcome in zip(chunks, outcomes):
+            if not outcome.ok:
+                results.extend(BatchResult(None, outcome.error) for _ in requested)
+                continue
+            created = outcome.result
+            by_external_id = {
+                s["external_id"]: s for s in created if s.get("external_id")
+            }
+            for position, story in enumerate(requested):
+                match = by_external_id.get(story.get("external_id"))
+                if match is None and position < len(created):
+                    match = created[position]
+                results.append(
+                    BatchResult(match, None)
+                    if match is not None
+                    else BatchResult(
+                        None, LookupError("Story missing from bulk response")
+                    )
+                )
+        return results
+
+    def deleteStories(
+        self,
+        story_ids: Iterable[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: int = 4,
+        max_attempts: int = 1,
+        progress: Callable[[BulkProgress], None] = None,
+    ) -> Dict[int, BatchResult]:
+        """
+        Delete Stories deletes any number of stories by splitting them into concurrent Delete Multiple Stories requests.
+
+        Returns a BatchResult per distinct story id; its error is set when the request deleting it failed.
+
+        param story_ids: Required. The IDs of the Stories to delete.
+        param chunk_size: The number of stories deleted per request.
+        param max_workers: The maximum number of requests in flight at once.
+        param max_attempts: The number of times a chunk is tried before giving up on it. Each try already includes the scheduler's retries, as Delete Multiple Stories is idempotent.
+        param progress: Called with a BulkProgress, which includes the throughput so far, after every chunk.
+        """
+        chunks = Chunk(list(dict.fromkeys(story_ids)), chunk_size)
+        outcomes = RunChunks(
+            self.deleteMultipleStories,
+            chunks,
+            max_workers,
+            max_attempts,
+            progress,
+            scheduler=self.scheduler,
+        )
+        return {
+            story_id: BatchResult(None, outcome.error)
+            for chunk, outcome in zip(chunks, outcomes)
+            for story_id in chunk
+        }
+
+    def updateStories(
+        self,
+        edits: Iterable[tuple],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_workers: int = 4,
+        max_attempts: int = 1,
+        progress: Callable[[BulkProgress], None] = None,
+    ) -> Dict[int, BatchResult]:
+        """
+        Update Stories applies per-story edits with as few requests as possible, grouping stories that receive identical changes into concurrent Update Multiple Stories requests.
+
+        A story with a unique change set is updated through Update Story when its changes are expressible there. Returns
+        a BatchResult per story id, holding the updated StorySlim or Story, or the error of its request.
+
+        param edits: Required. (story_id, changes) pairs, where changes are keyword arguments of Update Multiple Stories, e.g. (12, {"workflow_state_id": 500}).
+        param chunk_size: The largest number of stories updated per request.
+        param max_workers: The maximum number of requests in flight at once.
+        param max_attempts: The number of times a request is tried before giving up on it. Each try already includes the scheduler's retries, as the update endpoints are idempotent.
+        param progress: Called with a BulkProgress after every request.
+        """
+        single = set(inspect.signature(self.updateStory).parameters)
+
+        def apply(step: UpdatePlanStep) -> list:
+            if len(step.story_ids) == 1 and single.issuperset(step.changes):
+                return [self.updateStory(step.story_ids[0], **step.changes)]
+            return self.updateMultipleStories(step.story_ids, **step.changes)
+
+        plan = PlanUpdates(edits, chunk_size)
+        outcomes = RunChunks(
+            apply,
+            plan,
+            max_workers,
+            max_attempts,
+            progress,
+            size=lambda step: len(step.story_ids),
+            scheduler=self.scheduler,
+        )
+        results: Dict[int, BatchResult] = {}
+        for step, outcome in zip(plan, outcomes):
+            updated = {s["id"]: s for s in outcome.result or ()}
+            for story_id in step.story_ids:
+                if not outcome.ok:
+                    results[story_id] = BatchResult(None, outcome.error)
+                elif story_id in updated:
+                    results[story_id] = BatchResult(updated[story_id], None)
+                else:
+                    results[story_id] = BatchResult(
+                        None, LookupError("Story missing from bulk response")
+                    )
+        return results
+
+    ##############
+    # Pagination #
+    ##############
+
+    def iterSearchEpics(
+        self, query: str, page_size: int = 25, prefetch: bool = False
+    ) -> Iterator[Epic]:
+        """
+        Iter Search Epics lazily yields every Epic matching a search, fetching further pages only as they are needed.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to fetch per page. Minimum of 1 and maximum of 25.
+        param prefetch: Fetch the next page in the background while the current one is being consumed.
+        """
+        for page in IterPages(
+            lambda endpoint, params: self.get(endpoint, params).json(),
+            "/search/epics",
+            {"query": query, "page_size": page_size},
+            self.apiURL,
+            prefetch,
+        ):
+            yield from page["data"]
+
+    def iterSearchStories(
+        self, query: str, page_size: int = 25, prefetch: bool = False
+    ) -> Iterator[Story]:
+        """
+        Iter Search Stories lazily yields every Story matching a search, fetching further pages only as they are needed.
+
+        param query: Required. See our help center article on search operators
+        param page_size: The number of search results to fetch per page. Minimum of 1 and maximum of 25.
+        param prefetch: Fetch the next page in the background while the current one is being consumed.
+        """
+        for page in IterPages(
+            lambda endpoint, params: self.get(endpoint, params).json(),
+            "/search/stories",
+            {"query": query, "page_size": page_size},
+            self.apiURL,
+            prefetch,
+        ):
+            yield from page["data"]
+
+    def iterSearchEpicsSharded(
+        self,
+        query: str,
+        start: date = date(2014, 1, 1),
+        end: date = None,
+        field: str = "created",
+        max_workers: int = 4,
+    ) -> Iterator[Epic]:
+        """
+        Iter Search Epics Sharded yields every Epic matching a search, even past the 1000 result limit, by splitting the query into disjoint date windows which are searched concurrently.
+
+        param query: Required. See our help center article on search operators
+        param start: The first day of the range to search.
+        param end: The last day of the range to search. Defaults to today.
+        param field: The date search operator used to split the query, created or updated.
+        param max_workers: The maximum number of requests in flight at once.
+        """
+        return IterSharded(
+            lambda endpoint, params: self.get(endpoint, params).json(),
+            "/search/epics",
+            query,
+            start,
+            end or date.today(),
+            self.apiURL,
+            field,
+            max_workers,
+        )
+
+    def iterSearchStoriesSharded(
+        self,
+        query: str,
+        start: date = date(2014, 1, 1),
+        end: date = None,
+        field: str = "created",
+        max_workers: int = 4,
+    ) -> Iterator[Story]:
+        """
+        Iter Search Stories Sharded yields every Story matching a search, even past the 1000 result limit, by splitting the query into disjoint date windows which are searched concurrently.
+
+        param query: Required. See our help center article on search operators
+        param start: The first day of the range to search.
+        param end: The last day of the range to search. Defaults to today.
+        param field: The date search operator used to split the query, created or updated.
+        param max_workers: The maximum number of requests in flight at once.
+        """
+        return IterSharded(
+            lambda endpoint, params: self.get(endpoint, params).json(),
+            "/search/stories",
+            query,
+            start,
+            end or date.today(),
+            self.apiURL,
+            field,
+            max_workers,
+        )
+
+    #############
+    # Streaming #
+    #############
+
+    def iterListEpics(self) -> Iterator[EpicSlim]:
+        """Iter List Epics yields every Epic as it is parsed from the response, without holding the whole list in memory."""
+        return self.stream("/epics")
+
+    def iterListFiles(self) -> Iterator[File]:
+        """Iter List Files yields every File as it is parsed from the response, without holding the whole list in memory."""
+        return self.stream("/files")
+
+    def iterListLinkedFiles(self) -> Iterator[LinkedFile]:
+        """Iter List Linked Files yields every Linked File as it is parsed from the response, without holding the whole list in memory."""
+        return self.stream("/linked-files")
+
+    def iterListStories(self, project_public_id: int) -> Iterator[StorySlim]:
+        """
+        Iter List Stories yields every Story in a Project as it is parsed from the response, without holding the whole list in memory.
+
+        param project_public_id: Required. The unique ID of the Project.
+        """
+        return self.stream(
+            "/projects/{project_public_id}/stories".format(
+                project_public_id=project_public_id
+            )
+        )
+
+    #############
+    # Transfers #
+    #############
+    def downloadFile(
+        self,
+        file_public_id: int,
+        dest: str,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        progress: Callable[[TransferProgress], None] = None,
+        max_attempts: int = 3,
+        file: File = None,
+    ) -> str:
+        """
+        Download File streams the contents of a File to disk, resuming a download that was interrupted and checking the result against the File's size.
+
+        param file_public_id: Required. The File’s unique ID.
+        param dest: Required. The path to write the contents to. If it is a directory the File's filename is used inside it.
+        param chunk_size: The number of bytes read and written at a time.
+        param progress: Called with a TransferProgress after every chunk.
+        param max_attempts: The number of times a dropped connection is resumed before its error is raised.
+        param file: The File, if it is already at hand, which saves looking it up.
+
+        Returns the path the contents were written to.
+        """
+        if file is None:
+            file = self.getFile(file_public_id)
+        if not file.get("url"):
+            raise ValueError("File {} has no URL to download".format(file_public_id))
+        if os.path.isdir(dest):
+            dest = os.path.join(dest, os.path.basename(file["filename"]))
+        if self.debug:
+            print("curl -o '{}' '{}'".format(dest, file["url"]))
+        return DownloadTo(
+            self.session,
+            file["url"],
+            dest,
+            file.get("size"),
+            chunk_size,
+            progress,
+            max_attempts,
+        )
+
+    def downloadFiles(
+        self,
+        dest_dir: str,
+        files: Iterable[File] = None,
+        max_workers: int = 4,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        max_attempts: int = 3,
+    ) -> Dict[int, BatchResult]:
+        """
+        Download Files mirrors the contents of many Files into a directory concurrently, returning a BatchResult holding the path or error for each File.
+
+        Each File is written to "<id>_<filename>", and Files already present there with the expected size are skipped,
+        so running it again only fetches what is new or was interrupted.
+
+        param dest_dir: Required. The directory to write the Files to. It is created if it does not exist.
+        param files: The Files to download. Defaults to every File in the workspace, from listFiles.
+        param max_workers: The maximum number of downloads in flight at once.
+        param chunk_size: The number of bytes read and written at a time.
+        param max_attempts: The number of times a dropped connection is resumed before its error is raised.
+        """
+        if files is None:
+            files = self.listFiles()
+        by_id = {file["id"]: file for file in files}
+        os.makedirs(dest_dir, exist_ok=True)
+
+        def download(file_public_id: int) -> str:
+            file = by_id[file_public_id]
+            dest = os.path.join(
+                dest_dir,
+                "{}_{}".format(file_public_id, os.path.basename(file["filename"])),
+            )
+            if os.path.isfile(dest) and os.path.getsize(dest) == file.get("size"):
+                return dest
+            return self.downloadFile(
+                file_public_id, dest, chunk_size, None, max_attempts, file
+            )
+
+        return FetchMany(download, by_id, max_workers)
+
     ##############
     # Categories #
     ##############
@@ -677,9 +1317,46 @@ class ClubhouseClient:
             ),
         ).json()
 
-    def uploadFiles(self) -> List[File]:
-        """Upload one or more Files, which can then be associated to a Story Description, Story Comment, or Epic Comment."""
-        return self.post("/files").json()
+    def uploadFiles(
+        self,
+        files: List[FileSource],
+        story_id: int = Omit,  # type: ignore
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        progress: Callable[[TransferProgress], None] = None,
+    ) -> List[File]:
+        """
+        Upload one or more Files, which can then be associated to a Story Description, Story Comment, or Epic Comment.
+
+        The files are streamed as multipart/form-data in fixed-size chunks, so they are never loaded into memory whole.
+
+        param files: Required. The files to upload. Each is a path, a binary file object or a bytes-like buffer.
+        param story_id: The ID of the Story to associate the Files with.
+        param chunk_size: The number of bytes read and sent at a time.
+        param progress: Called with a TransferProgress, which includes the throughput so far, after every chunk.
+        """
+        body = MultipartEncoder(
+            PrepareLocals({"story_id": story_id}), files, None, chunk_size, progress
+        )
+        if self.debug:
+            print(
+                "curl -X POST '{}/files?token={}' {}".format(
+                    self.apiURL,
+                    self.token,
+                    " ".join(
+                        "-F '{}=@{}'".format(name, part.filename)
+                        for name, _, part in body.files
+                    ),
+                )
+            )
+        r = self.send(
+            "POST",
+            "{}/files?token={}".format(self.apiURL, self.token),
+            data=body,
+            headers={"Content-Type": body.content_type},
+        )
+        if self.cache is not None:
+            self.cache.invalidate("/files")
+        return r.json()
 
     ##########
     # Groups #
@@ -0,0 +1,57 @@
+"""The URL templates of every Clubhouse API endpoint, generated by the API builder with --templates."""
+
+ENDPOINT_TEMPLATES = (
+    "/categories",
+    "/categories/{category_public_id}",
+    "/categories/{category_public_id}/milestones",
+    "/entity-templates",
+    "/entity-templates/disable",
+    "/entity-templates/enable",
+    "/entity-templates/{entity_template_public_id}",
+    "/epic-workflow",
+    "/epics",
+    "/epics/{epic_public_id}",
+    "/epics/{epic_public_id}/comments",
+    "/epics/{epic_public_id}/comments/{comment_public_id}",
+    "/files",
+    "/files/{file_public_id}",
+    "/groups",
+    "/groups/{group_public_id}",
+    "/iterations",
+    "/iterations/disable",
+    "/iterations/enable",
+    "/iterations/{iteration_public_id}",
+    "/labels",
+    "/labels/{label_public_id}",
+    "/labels/{label_public_id}/epics",
+    "/linked-files",
+    "/linked-files/{linked_file_public_id}",
+    "/member",
+    "/members",
+    "/members/{member_public_id}",
+    "/milestones",
+    "/milestones/{milestone_public_id}",
+    "/milestones/{milestone_public_id}/epics",
+    "/projects",
+    "/projects/{project_public_id}",
+    "/projects/{project_public_id}/stories",
+    "/repositories",
+    "/repositories/{repo_public_id}",
+    "/search",
+    "/search/epics",
+    "/search/stories",
+    "/stories",
+    "/stories/bulk",
+    "/stories/search",
+    "/stories/{story_public_id}",
+    "/stories/{story_public_id}/comments",
+    "/stories/{story_public_id}/comments/{comment_public_id}",
+    "/stories/{story_public_id}/comments/{comment_public_id}/reactions",
+    "/stories/{story_public_id}/tasks",
+    "/stories/{story_public_id}/tasks/{task_public_id}",
+    "/story-links",
+    "/story-links/{story_link_public_id}",
+    "/teams",
+    "/teams/{team_public_id}",
+    "/workflows",
+)
@@ -0,0 +1,337 @@
+"""Per-request instrumentation events, and sinks which aggregate or export them."""
+
+import bisect
+import re
+import threading
+import warnings
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    from opentelemetry import trace
+except ImportError:  # opentelemetry is an optional dependency, see the "otel" extra
+    trace = None
+
+# Upper bounds, in seconds, of the buckets request latencies are counted in
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Path segments which look like ids, for endpoints without a known template
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I
+)
+
+
+class RequestEvent(NamedTuple):
+    """A request made by a client, or answered from its cache, handed to every sink once it completes."""
+
+    method: str  # The HTTP verb.
+    endpoint: str  # The endpoint template, e.g. /stories/{story_public_id}.
+    status: Optional[int]  # The final status code, or None if no response was received.
+    latency: float  # Seconds until the final response, including retries and rate limiting waits.
+    started: float  # When the request started, in seconds since the epoch.
+    bytes_sent: int = 0  # Request body bytes, as sent over the wire.
+    # Response body bytes, as received over the wire. 0 for streamed responses.
+    bytes_received: int = 0
+    retries: int = 0  # Attempts made after the first.
+    # Whether the response came from the client's cache without a request.
+    cache_hit: bool = False
+    error: Optional[BaseException] = None  # The exception the request raised, if any.
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class EndpointTemplates:
+    """
+    Maps endpoints back to the templates they were formatted from, e.g. /stories/123 to /stories/{story_public_id}, so
+    requests for different ids are aggregated together.
+
+    Endpoints matching no template have their numeric and UUID segments replaced with {id}.
+
+    param templates: Required. Endpoint templates with {name} placeholders, e.g. endpoints.ENDPOINT_TEMPLATES.
+    """
+
+    def __init__(self, templates: Iterable[str]) -> None:
+        self._static = set()
+        # (segment count, first segment) -> [(pattern, template)], to only try templates of the right shape
+        self._patterns: Dict[Tuple[int, str], List[Tuple["re.Pattern", str]]] = {}
+        for template in sorted(set(templates), key=lambda t: t.count("{")):
+            if "{" not in template:
+                self._static.add(template)
+                continue
+            segments = template.strip("/").split("/")
+            pattern = re.compile(
+                "^/"
+                + re.sub(r"\\{\w+\\}", "[^/]+", re.escape(template.strip("/")))
+                + "$"
+            )
+            shape = (len(segments), segments[0])
+            self._patterns.setdefault(shape, []).append((pattern, template))
+
+    def __call__(self, endpoint: str) -> str:
+        endpoint = "/" + endpoint.split("?")[0].strip("/")
+        if endpoint in self._static:
+            return endpoint
+        segments = endpoint[1:].split("/")
+        for pattern, template in self._patterns.get((len(segments), segments[0]), ()):
+            if pattern.match(endpoint):
+                return template
+        return "/" + "/".join("{id}" if ID_SEGMENT.match(s) else s for s in segments)
+
+
+def Emit(sinks: Iterable[Callable[[RequestEvent], None]], event: RequestEvent) -> None:
+    """Hand an event to every sink. A failing sink is reported as a warning rather than failing the request."""
+    for sink in sinks:
+        try:
+            sink(event)
+        except Exception as e:
+            warnings.warn("Request event sink {!r} failed: {!r}".format(sink, e))
+
+
+class _Series:
+    """The aggregated events of one verb and endpoint template."""
+
+    __slots__ = (
+        "buckets",
+        "count",
+        "sum",
+        "statuses",
+        "errors",
+        "retries",
+        "cache_hits",
+        "bytes_sent",
+        "bytes_received",
+    )
+
+    def __init__(self, buckets: int) -> None:
+        # The last bucket counts latencies above every bound
+        self.buckets = [0] * (buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.statuses: Dict[Optional[int], int] = {}
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def copy(self) -> "_Series":
+        series = _Series(0)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            setattr(series, name, value.copy() if hasattr(value, "copy") else value)
+        return series
+
+
+class LatencyHistogram:
+    """
+    A sink aggregating request events per verb and endpoint template: a latency histogram, status codes, errors,
+    retries, cache hits and bytes in each direction.
+
+    Thread-safe, so one histogram can be shared by every client of a process.
+
+    param buckets: Ascending upper bounds, in seconds, of the latency buckets.
+    """
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = tuple(buckets)
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        bucket = bisect.bisect_left(self.bounds, event.latency)
+        with self._lock:
+            series = self._series.get((event.method, event.endpoint))
+            if series is None:
+                series = self._series[event.method, event.endpoint] = _Series(
+                    len(self.bounds)
+                )
+            series.buckets[bucket] += 1
+            series.count += 1
+            series.sum += event.latency
+            series.statuses[event.status] = series.statuses.get(event.status, 0) + 1
+            series.errors += not event.ok
+            series.retries += event.retries
+            series.cache_hits += event.cache_hit
+            series.bytes_sent += event.bytes_sent
+            series.bytes_received += event.bytes_received
+
+    def snapshot(self) -> Dict[Tuple[str, str], _Series]:
+        """A consistent copy of every series, keyed by (verb, endpoint template)."""
+        with self._lock:
+            return {key: series.copy() for key, series in self._series.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def quantile(self, q: float, method: str, endpoint: str) -> Optional[float]:
+        """
+        Estimate a latency quantile of one endpoint by interpolating within its buckets, as Prometheus does.
+
+        param q: Required. The quantile, between 0 and 1, e.g. 0.95.
+        param method: Required. The HTTP verb.
+        param endpoint: Required. The endpoint template, e.g. /stories/{story_public_id}.
+        """
+        series = self.snapshot().get((method, endpoint))
+        return None if series is None else self._quantile(q, series)
+
+    def _quantile(self, q: float, series: _Series) -> Optional[float]:
+        if not series.count:
+            return None
+        rank = q * series.count
+        seen = 0
+        for i, count in enumerate(series.buckets):
+            if count and seen + count >= rank:
+                if i == len(self.bounds):
+                    # Latencies above every bound can only be placed at the highest one
+                    return self.bounds[-1] if self.bounds else series.sum / series.count
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return None
+
+    def summary(self) -> List[dict]:
+        """One row per verb and endpoint template with its request count, latency percentiles and error rate, slowest in total first."""
+        rows = []
+        for (method, endpoint), series in self.snapshot().items():
+            rows.append(
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": series.count,
+                    "total": series.sum,
+                    "mean": series.sum / series.count,
+                    "p50": self._quantile(0.5, series),
+                    "p95": self._quantile(0.95, series),
+                    "p99": self._quantile(0.99, series),
+                    "errors": series.errors,
+                    "retries": series.retries,
+                    "cache_hits": series.cache_hits,
+                    "bytes_sent": series.bytes_sent,
+                    "bytes_received": series.bytes_received,
+                }
+            )
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+
+def _Labels(**labels: str) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+
+
+def PrometheusText(histogram: LatencyHistogram, prefix: str = "clubhouse") -> str:
+    """
+    Render a LatencyHistogram in the Prometheus text exposition format, e.g. to serve from a /metrics endpoint or write
+    for the node exporter's textfile collector.
+
+    param histogram: Required. The histogram to render.
+    param prefix: Prepended to every metric name.
+    """
+    series = sorted(histogram.snapshot().items())
+    lines = []
+
+    def family(name: str, kind: str, help: str) -> str:
+        name = "{}_{}".format(prefix, name)
+        lines.append("# HELP {} {}".format(name, help))
+        lines.append("# TYPE {} {}".format(name, kind))
+        return name
+
+    name = family(
+        "request_duration_seconds", "histogram", "Latency of Clubhouse API requests."
+    )
+    for (method, endpoint), s in series:
+        cumulative = 0
+        for bound, count in zip(histogram.bounds + (float("inf"),), s.buckets):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(float(bound))
+            lines.append(
+                "{}_bucket{{{}}} {}".format(
+                    name, _Labels(method=method, endpoint=endpoint, le=le), cumulative
+                )
+            )
+        labels = _Labels(method=method, endpoint=endpoint)
+        lines.append("{}_sum{{{}}} {!r}".format(name, labels, s.sum))
+        lines.append("{}_count{{{}}} {}".format(name, labels, s.count))
+
+    name = family("requests_total", "counter", "Clubhouse API requests by status.")
+    for (method, endpoint), s in series:
+        for status, count in sorted(s.statuses.items(), key=lambda i: str(i[0])):
+            labels = _Labels(
+                method=method,
+                endpoint=endpoint,
+                status="error" if status is None else status,
+            )
+            lines.append("{}{{{}}} {}".format(name, labels, count))
+
+    for metric, attribute, help in (
+        ("request_errors_total", "errors", "Clubhouse API requests which failed."),
+        ("request_retries_total", "retries", "Retried Clubhouse API request attempts."),
+        ("cache_hits_total", "cache_hits", "Requests answered from the client cache."),
+    ):
+        name = family(metric, "counter", help)
+        for (method, endpoint), s in series:
+            labels = _Labels(method=method, endpoint=endpoint)
+            lines.append("{}{{{}}} {}".format(name, labels, getattr(s, attribute)))
+
+    name = family(
+        "request_bytes_total",
+        "counter",
+        "Body bytes of Clubhouse API requests on the wire.",
+    )
+    for (method, endpoint), s in series:
+        for direction, count in (
+            ("sent", s.bytes_sent),
+            ("received", s.bytes_received),
+        ):
+            labels = _Labels(method=method, endpoint=endpoint, direction=direction)
+            lines.append("{}{{{}}} {}".format(name, labels, count))
+    return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySink:
+    """
+    A sink recording every request as an OpenTelemetry client span, named after its verb and endpoint template.
+
+    Spans carry the HTTP semantic convention attributes, and the bytes and cache hits as clubhouse.* attributes. They
+    are recorded in the thread which made the request once it completes, so they nest under whatever span was current
+    there.
+
+    param tracer: The tracer to record spans with. Defaults to the global tracer provider's.
+    """
+
+    def __init__(self, tracer=None) -> None:
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetrySink requires opentelemetry-api; install clubhouse-lib[otel]"
+            )
+        self.tracer = tracer if tracer is not None else trace.get_tracer(__name__)
+
+    def __call__(self, event: RequestEvent) -> None:
+        attributes = {
+            "http.request.method": event.method,
+            "http.route": event.endpoint,
+            "clubhouse.cache_hit": event.cache_hit,
+            "clubhouse.bytes_sent": event.bytes_sent,
+            "clubhouse.bytes_received": event.bytes_received,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.retries:
+            attributes["http.request.resend_count"] = event.retries
+        start = int(event.started * 1e9)
+        span = self.tracer.start_span(
+            "{} {}".format(event.method, event.endpoint),
+            kind=trace.SpanKind.CLIENT,
+            start_time=start,
+            attributes=attributes,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_attribute("error.type", type(event.error).__name__)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start + int(event.latency * 1e9))
@@ -0,0 +1,279 @@
+"""Export of workspace entities to Apache Arrow record batches and Parquet files."""
+
+import functools
+import os
+import typing
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency, see the "arrow" extra
+    pa = pq = None
+
+from .client import ClubhouseClient
+from .record import IsTypedDict, Record
+from .serializer import JSONSerializer
+
+# Rows converted and written at a time, which bounds the memory an export uses
+EXPORT_BATCH_SIZE = 10000
+# Entities exported by ExportWorkspace besides stories, with the list method that fetches them
+EXPORT_ENTITIES = {
+    "epics": "listEpics",
+    "iterations": "listIterations",
+    "labels": "listLabels",
+    "members": "listMembers",
+    "milestones": "listMilestones",
+}
+
+
+def _RequireArrow() -> None:
+    if pa is None:
+        raise ImportError("Exporting requires pyarrow; install clubhouse-lib[arrow]")
+
+
+def _ArrowType(tp: Any, timestamp: "pa.DataType", seen: tuple) -> "pa.DataType":
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        return (
+            _ArrowType(members[0], timestamp, seen)
+            if len(members) == 1
+            else pa.string()
+        )
+    if origin is list:
+        return pa.list_(_ArrowType(args[0], timestamp, seen))
+    if tp is bool:
+        return pa.bool_()
+    if tp is int:
+        return pa.int64()
+    if tp is float:
+        return pa.float64()
+    if tp is datetime:
+        return timestamp
+    if IsTypedDict(tp) and tp not in seen:
+        return pa.struct(
+            [
+                (name, _ArrowType(hint, timestamp, seen + (tp,)))
+                for name, hint in typing.get_type_hints(tp).items()
+            ]
+        )
+    # Strings, Enums, and TypedDicts nested inside themselves, which are stored as JSON
+    return pa.string()
+
+
+@functools.lru_cache(maxsize=None)
+def ArrowSchema(typeddict: type) -> "pa.Schema":
+    """The Arrow schema of a TypedDict from type.py. Timestamps are microseconds in UTC and Enums are strings."""
+    _RequireArrow()
+    return _Schema(typeddict, pa.timestamp("us", tz="UTC"))
+
+
+@functools.lru_cache(maxsize=None)
+def _ParseSchema(typeddict: type) -> "pa.Schema":
+    # Rows are first read with timestamps as strings, then cast, so Arrow parses them rather than Python
+    return _Schema(typeddict, pa.string())
+
+
+def _Schema(typeddict: type, timestamp: "pa.DataType") -> "pa.Schema":
+    return pa.schema(
+        [
+            (name, _ArrowType(hint, timestamp, (typeddict,)))
+            for name, hint in typing.get_type_hints(typeddict).items()
+        ]
+    )
+
+
+def _Preparer(tp: Any, seen: tuple) -> Optional[Callable[[Any], Any]]:
+    """A function turning the TypedDicts nested inside themselves in a value into JSON, or None if there are none."""
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        return _Preparer(members[0], seen) if len(members) == 1 else None
+    if origin is list:
+        item = _Preparer(args[0], seen)
+        if item is None:
+            return None
+        return lambda values: [None if v is None else item(v) for v in values]
+    if not IsTypedDict(tp):
+        return None
+    if tp in seen:
+        encode = JSONSerializer().dumps
+        return lambda value: encode(value).decode("utf-8")
+    fields = {
+        name: prepare
+        for name, prepare in (
+            (name, _Preparer(hint, seen + (tp,)))
+            for name, hint in typing.get_type_hints(tp).items()
+        )
+        if prepare is not None
+    }
+    if not fields:
+        return None
+
+    def prepare(value: dict) -> dict:
+        value = dict(value)
+        for name, field in fields.items():
+            if value.get(name) is not None:
+                value[name] = field(value[name])
+        return value
+
+    return prepare
+
+
+@functools.lru_cache(maxsize=None)
+def _RowPreparer(typeddict: type) -> Optional[Callable[[Any], Any]]:
+    return _Preparer(typeddict, ())
+
+
+def _Row(row: Any) -> Any:
+    if isinstance(row, Record):
+        # Records hold parsed datetimes and Enums; reduce them to the JSON form the parse schema expects
+        return JSONSerializer().loads(JSONSerializer().dumps(row.to_dict()))
+    return row
+
+
+def _Cast(array: "pa.Array", target: "pa.DataType") -> "pa.Array":
+    """
+    Cast an array read with the parse schema to the final schema, parsing its timestamp strings.
+
+    Structs are cast field by field from flattened children, which are null wherever the struct is, since a plain
+    cast would try to parse the empty strings standing in for the fields of null structs.
+    """
+    if array.type == target:
+        return array
+    if pa.types.is_struct(target):
+        return pa.StructArray.from_arrays(
+            [_Cast(child, field.type) for child, field in zip(array.flatten(), target)],
+            fields=list(target),
+            mask=array.is_null(),
+        )
+    if pa.types.is_list(target):
+        return pa.ListArray.from_arrays(
+            array.offsets,
+            _Cast(array.values, target.value_type),
+            type=target,
+            mask=array.is_null(),
+        )
+    return array.cast(target)
+
+
+def IterRecordBatches(
+    typeddict: type, rows: Iterable[Any], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Convert rows into Arrow record batches with the schema of their TypedDict, holding one batch of rows at a time.
+
+    param typeddict: Required. The TypedDict from type.py describing the rows, e.g. StorySlim.
+    param rows: Required. Dicts shaped like typeddict, or records of it. Keys outside the TypedDict are dropped.
+    param batch_size: The number of rows in each batch.
+    """
+    _RequireArrow()
+    schema = ArrowSchema(typeddict)
+    parse_schema = _ParseSchema(typeddict)
+    prepare = _RowPreparer(typeddict)
+    batch = []
+    rows = iter(rows)
+    while True:
+        batch.clear()
+        for row in rows:
+            row = _Row(row)
+            batch.append(row if prepare is None else prepare(row))
+            if len(batch) >= batch_size:
+                break
+        if not batch:
+            return
+        table = pa.Table.from_pylist(batch, schema=parse_schema).combine_chunks()
+        yield pa.RecordBatch.from_arrays(
+            [
+                _Cast(table.column(i).chunk(0), field.type)
+                for i, field in enumerate(schema)
+            ],
+            schema=schema,
+        )
+        if len(batch) < batch_size:
+            return
+
+
+def WriteParquet(
+    typeddict: type,
+    rows: Iterable[Any],
+    path: str,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Stream rows into a Parquet file with the schema of their TypedDict, returning the number of rows written.
+
+    Each batch of rows becomes a row group as soon as it is converted, so memory stays bounded however many rows there
+    are.
+
+    param typeddict: Required. The TypedDict from type.py describing the rows, e.g. StorySlim.
+    param rows: Required. Dicts shaped like typeddict, or records of it, e.g. the result of iterListStories.
+    param path: Required. The Parquet file to write.
+    param batch_size: The number of rows converted and written at a time.
+    param compression: The Parquet compression codec.
+    """
+    _RequireArrow()
+    written = 0
+    with pq.ParquetWriter(
+        path, ArrowSchema(typeddict), compression=compression
+    ) as writer:
+        for batch in IterRecordBatches(typeddict, rows, batch_size):
+            writer.write_batch(batch)
+            written += batch.num_rows
+    return written
+
+
+def _ListedType(client: ClubhouseClient, method: str) -> type:
+    """The TypedDict of the items a list method returns, e.g. EpicSlim for listEpics."""
+    return typing.get_args(typing.get_type_hints(getattr(client, method))["return"])[0]
+
+
+def ExportWorkspace(
+    client: ClubhouseClient,
+    dest_dir: str,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    compression: str = "zstd",
+) -> Dict[str, int]:
+    """
+    Export the stories, epics, iterations, labels, members and milestones of a workspace to one Parquet file each.
+
+    Each file's schema is derived from the TypedDict its list endpoint returns, e.g. stories.parquet from StorySlim.
+    Stories are streamed project by project, so the export never holds more than one batch of them in memory.
+
+    param client: Required. The client used to talk to Clubhouse.
+    param dest_dir: Required. The directory to write the files to. It is created if it does not exist.
+    param batch_size: The number of rows converted and written at a time.
+    param compression: The Parquet compression codec.
+
+    Returns the number of rows written, keyed by entity.
+    """
+    _RequireArrow()
+    os.makedirs(dest_dir, exist_ok=True)
+
+    def stories() -> Iterator[Any]:
+        for project in client.listProjects():
+            yield from client.iterListStories(project["id"])
+
+    counts = {
+        "stories": WriteParquet(
+            _ListedType(client, "iterListStories"),
+            stories(),
+            os.path.join(dest_dir, "stories.parquet"),
+            batch_size,
+            compression,
+        )
+    }
+    for entity, method in EXPORT_ENTITIES.items():
+        counts[entity] = WriteParquet(
+            _ListedType(client, method),
+            getattr(client, method)(),
+            os.path.join(dest_dir, "{}.parquet".format(entity)),
+            batch_size,
+            compression,
+        )
+    return counts
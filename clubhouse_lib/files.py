@@ -0,0 +1,307 @@
+"""Streaming transfer of file contents to and from Clubhouse."""
+
+import asyncio
+import io
+import mmap
+import os
+import tempfile
+import time
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+import uuid
+
+import requests
+
+# Bytes handed to the socket at a time
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+# Local files at least this large are memory-mapped rather than read into buffers
+MMAP_THRESHOLD = 16 * 1024 * 1024
+# Bytes of a non-seekable upload kept in memory, for sending again on a retry, before they are spooled to disk
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+FileSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+
+class TransferProgress(NamedTuple):
+    """A snapshot of an upload or download, handed to progress callbacks after every chunk."""
+
+    transferred: int  # Bytes sent or received so far.
+    total: Optional[int]  # Bytes expected in all, when known.
+    elapsed: float  # Seconds since the transfer started.
+
+    @property
+    def rate(self) -> float:
+        """Bytes transferred per second so far."""
+        return self.transferred / self.elapsed if self.elapsed else 0.0
+
+
+class _Part:
+    """
+    A single file of a multipart body, which can be read from the start any number of times.
+
+    Sources which cannot seek are copied to a spool as they are first read, and read back from it afterwards.
+    """
+
+    def __init__(self, source: FileSource) -> None:
+        self.source = source
+        self.start = 0
+        self._spool: Optional[tempfile.SpooledTemporaryFile] = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.size: Optional[int] = len(source)
+            default = "file"
+        elif isinstance(source, (str, os.PathLike)):
+            self.size = os.path.getsize(source)
+            default = os.path.basename(os.fspath(source))
+        else:
+            self.size = None
+            name = getattr(source, "name", None)
+            # Files opened from a descriptor, e.g. TemporaryFile(), are named by an int
+            if isinstance(name, (str, os.PathLike)) and os.fspath(name):
+                default = os.path.basename(os.fspath(name))
+            else:
+                default = "file"
+            try:
+                self.start = source.tell()
+                self.size = source.seek(0, io.SEEK_END) - self.start
+                source.seek(self.start)
+            except (AttributeError, OSError):
+                pass
+        self.filename = str(default)
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            view = memoryview(self.source)
+            for i in range(0, len(view), chunk_size):
+                yield view[i : i + chunk_size]
+        elif isinstance(self.source, (str, os.PathLike)):
+            with open(self.source, "rb") as f:
+                if self.size and self.size >= MMAP_THRESHOLD:
+                    # Slices are copied out so no view still references the map when it closes
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        for i in range(0, len(mapped), chunk_size):
+                            yield mapped[i : i + chunk_size]
+                else:
+                    yield from iter(lambda: f.read(chunk_size), b"")
+        elif self.size is not None:
+            # Seekable, so a retried request can send the file again
+            self.source.seek(self.start)
+            yield from iter(lambda: self.source.read(chunk_size), b"")
+        else:
+            yield from self._replay(chunk_size)
+
+    def _replay(self, chunk_size: int) -> Iterator[bytes]:
+        if self._spool is None:
+            self._spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        spool = self._spool
+        # What earlier passes read, then the rest of the source, which is kept for the next pass too
+        spool.seek(0)
+        yield from iter(lambda: spool.read(chunk_size), b"")
+        for chunk in iter(lambda: self.source.read(chunk_size), b""):
+            spool.seek(0, io.SEEK_END)
+            spool.write(chunk)
+            yield chunk
+
+
+class MultipartEncoder:
+    """
+    A multipart/form-data request body which streams its files in fixed-size chunks instead of loading them into memory.
+
+    When the size of every file can be determined the body has a length, so it is sent with a Content-Length header;
+    otherwise it is sent with chunked transfer encoding. Iterating the encoder again starts the body over, so requests
+    using it can be retried; files which cannot seek are spooled as they are sent to make that possible.
+
+    param fields: Plain form fields to send before the files.
+    param files: The files to send. Each is a path, a binary file object or a bytes-like buffer.
+    param names: The form field name of each file. Defaults to file0, file1, ...
+    param chunk_size: The number of bytes read and sent at a time.
+    param progress: Called with a TransferProgress after every chunk.
+    """
+
+    def __init__(
+        self,
+        fields: dict,
+        files: List[FileSource],
+        names: List[str] = None,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        progress: Callable[[TransferProgress], None] = None,
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.content_type = "multipart/form-data; boundary={}".format(self.boundary)
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.fields = [
+            self._header(name) + str(value).encode("utf-8") + b"\r\n"
+            for name, value in fields.items()
+        ]
+        self.files = []
+        for i, source in enumerate(files):
+            part = _Part(source)
+            name = names[i] if names is not None else "file{}".format(i)
+            self.files.append((name, self._header(name, part.filename), part))
+        self.closing = "--{}--\r\n".format(self.boundary).encode("ascii")
+
+    def _header(self, name: str, filename: str = None) -> bytes:
+        disposition = 'form-data; name="{}"'.format(name)
+        if filename is None:
+            return "--{}\r\nContent-Disposition: {}\r\n\r\n".format(
+                self.boundary, disposition
+            ).encode("utf-8")
+        return (
+            '--{}\r\nContent-Disposition: {}; filename="{}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n".format(
+                self.boundary, disposition, filename.replace('"', "%22")
+            ).encode("utf-8")
+        )
+
+    @property
+    def length(self) -> Optional[int]:
+        """The size of the whole body in bytes, or None when a file's size cannot be determined up front."""
+        if any(part.size is None for _, _, part in self.files):
+            return None
+        return (
+            sum(len(f) for f in self.fields)
+            + sum(len(header) + part.size + 2 for _, header, part in self.files)
+            + len(self.closing)
+        )
+
+    def __len__(self) -> int:
+        # requests sets Content-Length from len(); 0 makes it fall back to chunked transfer encoding
+        return self.length or 0
+
+    def __bool__(self) -> bool:
+        # Without this a body of unknown length would be falsy, and requests would send no body at all
+        return True
+
+    def _pieces(self) -> Iterator[bytes]:
+        yield from self.fields
+        for _, header, part in self.files:
+            yield header
+            yield from part.chunks(self.chunk_size)
+            yield b"\r\n"
+        yield self.closing
+
+    def __iter__(self) -> Iterator[bytes]:
+        started = time.monotonic()
+        total = self.length
+        sent = 0
+        for piece in self._pieces():
+            # An empty chunk would end a chunked transfer early
+            if not len(piece):
+                continue
+            yield piece
+            sent += len(piece)
+            if self.progress is not None:
+                self.progress(TransferProgress(sent, total, time.monotonic() - started))
+
+
+async def IterPartAsync(
+    part: _Part, chunk_size: int, sent: Callable[[int], None] = None
+) -> AsyncIterator[bytes]:
+    """
+    Yield the chunks of a file to upload, reading them in the default executor so the event loop is never blocked.
+
+    param part: Required. The file to read.
+    param chunk_size: Required. The number of bytes read at a time.
+    param sent: Called with the size of every chunk once it has been handed on.
+    """
+    loop = asyncio.get_event_loop()
+    chunks = part.chunks(chunk_size)
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            if not len(chunk):
+                continue
+            yield bytes(chunk)
+            if sent is not None:
+                sent(len(chunk))
+    finally:
+        chunks.close()
+
+
+def DownloadTo(
+    session: requests.Session,
+    url: str,
+    dest: str,
+    size: Optional[int] = None,
+    chunk_size: int = TRANSFER_CHUNK_SIZE,
+    progress: Callable[[TransferProgress], None] = None,
+    max_attempts: int = 3,
+) -> str:
+    """
+    Stream the content at url to dest, resuming an interrupted download with a Range request.
+
+    Bytes are written to dest + ".part", which is renamed to dest once the download is complete. A ".part" file left
+    behind by an earlier call is resumed rather than started over; if the server ignores the Range header the
+    download starts from the beginning instead.
+
+    param session: The session to download with. No API token is sent, since file URLs are served by a third party.
+    param url: The URL of the content.
+    param dest: The path to write the content to.
+    param size: The expected size in bytes. The download fails if the content does not match it.
+    param chunk_size: The number of bytes read and written at a time.
+    param progress: Called with a TransferProgress after every chunk.
+    param max_attempts: The number of times a dropped connection is resumed before its error is raised.
+    """
+    partial = dest + ".part"
+    started = time.monotonic()
+    # Make sure there is a partial file to measure, even for empty content
+    open(partial, "ab").close()
+    for attempt in range(max_attempts):
+        offset = os.path.getsize(partial)
+        if size is not None and offset > size:
+            offset = 0
+        try:
+            if size is None or offset < size:
+                # The content must arrive unencoded, so its bytes match size and Range offsets count what is on disk
+                headers = {"Accept-Encoding": "identity"}
+                if offset:
+                    headers["Range"] = "bytes={}-".format(offset)
+                with session.get(url, headers=headers, stream=True) as r:
+                    if r.status_code == 416:
+                        # The partial file is not a prefix of this content, so start over
+                        open(partial, "wb").close()
+                        continue
+                    r.raise_for_status()
+                    if r.status_code != 206:
+                        offset = 0
+                    transferred = offset
+                    with open(partial, "ab" if offset else "wb") as f:
+                        for chunk in r.iter_content(chunk_size):
+                            f.write(chunk)
+                            transferred += len(chunk)
+                            if progress is not None:
+                                progress(
+                                    TransferProgress(
+                                        transferred, size, time.monotonic() - started
+                                    )
+                                )
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ):
+            if attempt + 1 >= max_attempts:
+                raise
+            continue
+        received = os.path.getsize(partial)
+        if size is None or received == size:
+            os.replace(partial, dest)
+            return dest
+        if received > size:
+            # Longer than expected, so resuming cannot help
+            break
+    raise IOError(
+        "Downloaded {} bytes of {} but expected {}".format(
+            os.path.getsize(partial), url, size
+        )
+    )
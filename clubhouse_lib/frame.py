@@ -0,0 +1,421 @@
+"""Columnar storage of Stories for vectorized reporting."""
+
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, see the "frame" extra
+    np = None
+
+from .timestamps import TimestampArray
+
+# The columns of a StoryFrame and how each is stored:
+#   int       int64
+#   float     float64, with NaN where the Story has no value (nullable ids and estimates)
+#   bool      bool
+#   time      datetime64[us] in UTC, with NaT where the Story has no value
+#   category  Categorical, a dictionary-encoded column
+#   multi     MultiCategorical, a dictionary-encoded column holding any number of values per Story
+#   object    object, the values as they are
+COLUMNS = {
+    "id": "int",
+    "project_id": "int",
+    "position": "int",
+    "epic_id": "float",
+    "estimate": "float",
+    "iteration_id": "float",
+    "archived": "bool",
+    "blocked": "bool",
+    "blocker": "bool",
+    "completed": "bool",
+    "started": "bool",
+    "created_at": "time",
+    "updated_at": "time",
+    "moved_at": "time",
+    "started_at": "time",
+    "completed_at": "time",
+    "deadline": "time",
+    "story_type": "category",
+    "workflow_state_id": "category",
+    "requested_by_id": "category",
+    "owner_ids": "multi",
+    "follower_ids": "multi",
+    "label_ids": "multi",
+    "name": "object",
+}
+
+
+def _RequireNumpy() -> None:
+    if np is None:
+        raise ImportError("StoryFrame requires numpy; install clubhouse-lib[frame]")
+
+
+def _Plain(value: Any) -> Any:
+    """Reduce the values records hold to their JSON form, so dict and record responses build the same columns."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat()
+    return value
+
+
+def _Gather(
+    offsets: "np.ndarray", rows: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """The offsets and code positions of the selected rows of a ragged column."""
+    lengths = offsets[1:][rows] - offsets[:-1][rows]
+    new_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+    positions = np.repeat(offsets[:-1][rows] - new_offsets[:-1], lengths) + np.arange(
+        new_offsets[-1]
+    )
+    return new_offsets, positions
+
+
+class Categorical:
+    """
+    A dictionary-encoded column: each row holds a code into categories, or -1 where the Story has no value.
+
+    Comparing the column to a value gives a boolean mask, e.g. frame["story_type"] == "bug".
+    """
+
+    def __init__(self, codes: "np.ndarray", categories: List[Hashable]) -> None:
+        self.codes = codes
+        self.categories = categories
+        self._index = {value: code for code, value in enumerate(categories)}
+
+    def code(self, value: Hashable) -> int:
+        """The code of a value, or -1 if no row holds it."""
+        return self._index.get(_Plain(value), -1)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, rows: Any) -> Any:
+        if isinstance(rows, (int, np.integer)):
+            code = self.codes[rows]
+            return None if code < 0 else self.categories[code]
+        return Categorical(self.codes[rows], self.categories)
+
+    def __eq__(self, value: Any) -> "np.ndarray":  # type: ignore
+        code = self.code(value)
+        return self.codes == code if code >= 0 else np.zeros(len(self), dtype=bool)
+
+    def __ne__(self, value: Any) -> "np.ndarray":  # type: ignore
+        return ~(self == value)
+
+    __hash__ = None  # type: ignore
+
+    def isin(self, values: Iterable[Hashable]) -> "np.ndarray":
+        codes = [c for c in (self.code(v) for v in values) if c >= 0]
+        return np.isin(self.codes, codes)
+
+    def isnull(self) -> "np.ndarray":
+        return self.codes < 0
+
+    def counts(self) -> Dict[Hashable, int]:
+        """The number of rows holding each value."""
+        counts = np.bincount(
+            self.codes[self.codes >= 0], minlength=len(self.categories)
+        )
+        return {self.categories[c]: int(n) for c, n in enumerate(counts) if n}
+
+    def tolist(self) -> list:
+        return [None if c < 0 else self.categories[c] for c in self.codes.tolist()]
+
+
+class MultiCategorical:
+    """
+    A dictionary-encoded column holding any number of values per row, e.g. owner_ids.
+
+    The codes of row i are codes[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(
+        self, offsets: "np.ndarray", codes: "np.ndarray", categories: List[Hashable]
+    ) -> None:
+        self.offsets = offsets
+        self.codes = codes
+        self.categories = categories
+        self._index = {value: code for code, value in enumerate(categories)}
+
+    def code(self, value: Hashable) -> int:
+        """The code of a value, or -1 if no row holds it."""
+        return self._index.get(_Plain(value), -1)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, rows: Any) -> Any:
+        if isinstance(rows, (int, np.integer)):
+            codes = self.codes[self.offsets[rows] : self.offsets[rows + 1]]
+            return [self.categories[c] for c in codes.tolist()]
+        rows = np.arange(len(self))[rows]
+        offsets, positions = _Gather(self.offsets, rows)
+        return MultiCategorical(offsets, self.codes[positions], self.categories)
+
+    def rows(self) -> "np.ndarray":
+        """The row of every code, i.e. the column exploded to one (row, code) pair per value."""
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+    def contains(self, value: Hashable) -> "np.ndarray":
+        """A mask of the rows holding value, e.g. the Stories owned by a Member."""
+        mask = np.zeros(len(self), dtype=bool)
+        code = self.code(value)
+        if code >= 0:
+            mask[self.rows()[self.codes == code]] = True
+        return mask
+
+    def lengths(self) -> "np.ndarray":
+        return np.diff(self.offsets)
+
+    def counts(self) -> Dict[Hashable, int]:
+        """The number of rows holding each value."""
+        counts = np.bincount(self.codes, minlength=len(self.categories))
+        return {self.categories[c]: int(n) for c, n in enumerate(counts) if n}
+
+    def tolist(self) -> List[list]:
+        return [self[i] for i in range(len(self))]
+
+
+Column = Union["np.ndarray", Categorical, MultiCategorical]
+
+
+class StoryFrame:
+    """
+    Stories held column by column, for reporting without a Python loop per Story.
+
+    Columns are listed in COLUMNS. Reading a column gives a numpy array, or a Categorical or MultiCategorical for
+    dictionary-encoded ones. Indexing with a boolean mask or an array of positions gives a new frame of those
+    Stories, and groupby aggregates a column per value of another.
+
+    Build one with StoryFrame.from_stories.
+    """
+
+    def __init__(self, columns: Dict[str, Column]) -> None:
+        _RequireNumpy()
+        self.columns = columns
+
+    @classmethod
+    def from_stories(cls, stories: Iterable[Any]) -> "StoryFrame":
+        """
+        Build a frame from Stories, e.g. the result of listStories or searchStories.
+
+        param stories: Required. StorySlim or Story dicts, or records of either.
+        """
+        _RequireNumpy()
+        values: Dict[str, list] = {name: [] for name in COLUMNS}
+        for story in stories:
+            for name, kind in COLUMNS.items():
+                if name == "label_ids" and story.get("label_ids") is None:
+                    value = [label["id"] for label in story.get("labels") or ()]
+                else:
+                    value = story.get(name)
+                if kind == "multi":
+                    value = [_Plain(v) for v in value or ()]
+                else:
+                    value = _Plain(value)
+                values[name].append(value)
+        columns: Dict[str, Column] = {}
+        # Every timestamp column is parsed in one pass, so an instant shared by several is parsed once
+        times = [name for name, kind in COLUMNS.items() if kind == "time"]
+        parsed = TimestampArray([v for name in times for v in values[name]])
+        count = len(values["id"])
+        timestamps = {
+            name: parsed[i * count : (i + 1) * count] for i, name in enumerate(times)
+        }
+        for name, kind in COLUMNS.items():
+            column = values[name]
+            if kind == "int":
+                columns[name] = np.array(
+                    [0 if v is None else v for v in column], dtype=np.int64
+                )
+            elif kind == "float":
+                columns[name] = np.array(
+                    [np.nan if v is None else v for v in column], dtype=np.float64
+                )
+            elif kind == "bool":
+                columns[name] = np.array([bool(v) for v in column], dtype=bool)
+            elif kind == "time":
+                columns[name] = timestamps[name]
+            elif kind == "category":
+                index: Dict[Hashable, int] = {}
+                codes = [
+                    -1 if v is None else index.setdefault(v, len(index)) for v in column
+                ]
+                columns[name] = Categorical(
+                    np.array(codes, dtype=np.int32), list(index)
+                )
+            elif kind == "multi":
+                index = {}
+                offsets = np.zeros(len(column) + 1, dtype=np.int64)
+                np.cumsum([len(v) for v in column], out=offsets[1:])
+                codes = [index.setdefault(v, len(index)) for row in column for v in row]
+                columns[name] = MultiCategorical(
+                    offsets, np.array(codes, dtype=np.int32), list(index)
+                )
+            else:
+                array = np.empty(len(column), dtype=object)
+                array[:] = column
+                columns[name] = array
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, key: Any) -> Any:
+        """A column by name, or a frame of the Stories selected by a boolean mask, slice or array of positions."""
+        if isinstance(key, str):
+            return self.columns[key]
+        return self.take(key)
+
+    def take(self, rows: Any) -> "StoryFrame":
+        rows = np.arange(len(self))[rows]
+        return StoryFrame({name: column[rows] for name, column in self.columns.items()})
+
+    def where(self, **conditions: Any) -> "StoryFrame":
+        """
+        The Stories whose columns equal the given values, e.g. where(story_type="bug", completed=False).
+
+        A multi-valued column matches Stories holding the value, e.g. where(owner_ids=member_id).
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in conditions.items():
+            column = self.columns[name]
+            if isinstance(column, MultiCategorical):
+                mask &= column.contains(value)
+            else:
+                mask &= column == value
+        return self.take(mask)
+
+    @property
+    def cycle_time(self) -> "np.ndarray":
+        """Seconds from started_at to completed_at, NaN for Stories which are not both started and completed."""
+        return self._elapsed("started_at", "completed_at")
+
+    @property
+    def lead_time(self) -> "np.ndarray":
+        """Seconds from created_at to completed_at, NaN for Stories which are not completed."""
+        return self._elapsed("created_at", "completed_at")
+
+    def _elapsed(self, start: str, end: str) -> "np.ndarray":
+        delta = self.columns[end] - self.columns[start]
+        seconds = delta.astype("timedelta64[ms]").astype(np.float64) / 1000.0
+        seconds[np.isnat(delta)] = np.nan
+        return seconds
+
+    def groupby(self, key: str) -> "GroupBy":
+        """Group the Stories by the values of a column. Grouping by a multi-valued column counts a Story once per value."""
+        return GroupBy(self, key)
+
+    def to_dicts(self) -> List[dict]:
+        """The frame's columns as one dict per Story."""
+        lists = {}
+        for name, column in self.columns.items():
+            if isinstance(column, (Categorical, MultiCategorical)):
+                lists[name] = column.tolist()
+            elif column.dtype.kind == "M":
+                lists[name] = [
+                    None if np.isnat(v) else v.item().replace(tzinfo=timezone.utc)
+                    for v in column
+                ]
+            elif column.dtype.kind == "f":
+                lists[name] = [None if v != v else v for v in column.tolist()]
+            else:
+                lists[name] = column.tolist()
+        return [dict(zip(lists, row)) for row in zip(*lists.values())]
+
+
+class GroupBy:
+    """The Stories of a StoryFrame grouped by one column, with vectorized aggregates keyed by group value."""
+
+    def __init__(self, frame: StoryFrame, key: str) -> None:
+        column = frame.columns[key]
+        if isinstance(column, MultiCategorical):
+            self.rows = column.rows()
+            self.codes = column.codes.astype(np.int64)
+            self.keys = list(column.categories)
+        elif isinstance(column, Categorical):
+            present = column.codes >= 0
+            self.rows = np.flatnonzero(present)
+            self.codes = column.codes[present].astype(np.int64)
+            self.keys = list(column.categories)
+        else:
+            present = (
+                ~np.isnan(column)
+                if column.dtype.kind == "f"
+                else np.ones(len(column), dtype=bool)
+            )
+            self.rows = np.flatnonzero(present)
+            unique, self.codes = np.unique(column[present], return_inverse=True)
+            self.keys = unique.tolist()
+        self.frame = frame
+
+    def _values(self, column: Union[str, "np.ndarray"]) -> "np.ndarray":
+        values = self.frame.columns[column] if isinstance(column, str) else column
+        return np.asarray(values, dtype=np.float64)[self.rows]
+
+    def _result(
+        self, values: "np.ndarray", keep: "np.ndarray"
+    ) -> Dict[Hashable, float]:
+        return {self.keys[i]: values[i].item() for i in np.flatnonzero(keep)}
+
+    def count(self) -> Dict[Hashable, int]:
+        """The number of Stories in each group."""
+        counts = np.bincount(self.codes, minlength=len(self.keys))
+        return {self.keys[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def sum(self, column: Union[str, "np.ndarray"]) -> Dict[Hashable, float]:
+        """The sum of a numeric column, or array such as cycle_time, per group, skipping NaN."""
+        values = self._values(column)
+        valid = ~np.isnan(values)
+        sums = np.bincount(self.codes[valid], values[valid], minlength=len(self.keys))
+        return self._result(sums, np.bincount(self.codes, minlength=len(self.keys)) > 0)
+
+    def mean(self, column: Union[str, "np.ndarray"]) -> Dict[Hashable, float]:
+        """The mean of a numeric column, or array such as cycle_time, per group, skipping NaN."""
+        values = self._values(column)
+        valid = ~np.isnan(values)
+        counts = np.bincount(self.codes[valid], minlength=len(self.keys))
+        sums = np.bincount(self.codes[valid], values[valid], minlength=len(self.keys))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._result(sums / counts, counts > 0)
+
+    def _reduce(
+        self, column: Union[str, "np.ndarray"], reduce: Callable
+    ) -> Dict[Hashable, float]:
+        values = self._values(column)
+        valid = ~np.isnan(values)
+        codes, values = self.codes[valid], values[valid]
+        order = np.lexsort((values, codes))
+        codes, values = codes[order], values[order]
+        starts = (
+            np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            if len(codes)
+            else np.array([], dtype=np.int64)
+        )
+        ends = np.r_[starts[1:], len(codes)]
+        return {
+            self.keys[codes[s]]: float(reduce(values, s, e))
+            for s, e in zip(starts, ends)
+        }
+
+    def min(self, column: Union[str, "np.ndarray"]) -> Dict[Hashable, float]:
+        return self._reduce(column, lambda values, s, e: values[s])
+
+    def max(self, column: Union[str, "np.ndarray"]) -> Dict[Hashable, float]:
+        return self._reduce(column, lambda values, s, e: values[e - 1])
+
+    def median(self, column: Union[str, "np.ndarray"]) -> Dict[Hashable, float]:
+        """The median of a numeric column, or array such as cycle_time, per group, skipping NaN."""
+        return self._reduce(
+            column,
+            lambda values, s, e: (
+                values[s + (e - s - 1) // 2] + values[s + (e - s) // 2]
+            )
+            / 2,
+        )
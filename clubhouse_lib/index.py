@@ -0,0 +1,274 @@
+"""In-process full-text search over the stories and epics of a WorkspaceMirror."""
+
+from collections import Counter
+from datetime import datetime, timezone
+from enum import Enum
+import itertools
+import math
+import re
+import shlex
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .mirror import WorkspaceMirror
+
+TOKEN = re.compile(r"\w+")
+# Search operators which filter rather than rank, e.g. owner:jdoe or !label:"tech debt"
+OPERATORS = ("type", "owner", "label", "state", "is", "epic", "project")
+# Free text found in a name counts for this many occurrences elsewhere
+NAME_WEIGHT = 2
+
+
+def Tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN.findall(text.lower()) if text else []
+
+
+class ParsedQuery(NamedTuple):
+    """A search query split into the terms which rank results and the operators which filter them."""
+
+    terms: List[str]
+    include: List[Tuple[str, str]]  # (operator, value) pairs every result must match
+    exclude: List[Tuple[str, str]]  # (operator, value) pairs no result may match
+
+
+def ParseQuery(query: str) -> ParsedQuery:
+    """
+    Parse a Clubhouse style search query, e.g. 'login bug owner:jdoe !label:"tech debt" is:done'.
+
+    Operators not in OPERATORS are treated as free text.
+    """
+    terms: List[str] = []
+    include: List[Tuple[str, str]] = []
+    exclude: List[Tuple[str, str]] = []
+    try:
+        words = shlex.split(query)
+    except ValueError:  # An unbalanced quote
+        words = query.split()
+    for word in words:
+        negated = word[:1] in ("!", "-")
+        operator, colon, value = word.lstrip("!-").partition(":")
+        operator = operator.lower()
+        if colon and operator in OPERATORS and value:
+            (exclude if negated else include).append((operator, value.lower()))
+        else:
+            terms.extend(Tokenize(word))
+    return ParsedQuery(terms, include, exclude)
+
+
+class _Corpus:
+    """The inverted index of one kind of document, ranked with Okapi BM25."""
+
+    def __init__(self, k1: float, b: float) -> None:
+        self.k1 = k1
+        self.b = b
+        self.docs: Dict[Any, dict] = {}
+        self.lengths: Dict[Any, int] = {}
+        # term -> {doc id: term frequency}
+        self.postings: Dict[str, Dict[Any, int]] = {}
+        # (operator, value) -> doc ids
+        self.facets: Dict[Tuple[str, str], Set[Any]] = {}
+
+    def add(
+        self, doc: dict, text: Iterable[str], facets: Iterable[Tuple[str, str]]
+    ) -> None:
+        id = doc["id"]
+        self.docs[id] = doc
+        counts = Counter(itertools.chain.from_iterable(Tokenize(t) for t in text))
+        self.lengths[id] = sum(counts.values())
+        for term, count in counts.items():
+            self.postings.setdefault(term, {})[id] = count
+        for operator, value in facets:
+            if isinstance(value, Enum):
+                value = value.value
+            self.facets.setdefault((operator, str(value).lower()), set()).add(id)
+
+    def search(self, query: ParsedQuery, limit: Optional[int]) -> List[dict]:
+        candidates: Optional[Set[Any]] = None
+        for facet in query.include:
+            matched = self.facets.get(facet, set())
+            candidates = set(matched) if candidates is None else candidates & matched
+        # Every free text term must match, as on Clubhouse
+        terms = list(dict.fromkeys(query.terms))
+        for term in terms:
+            matched = self.postings.get(term, {}).keys()
+            candidates = set(matched) if candidates is None else candidates & matched
+        if candidates is None:
+            candidates = set(self.docs)
+        for facet in query.exclude:
+            candidates -= self.facets.get(facet, set())
+        if terms:
+            scores = self._scores(terms, candidates)
+            ranked = sorted(candidates, key=lambda id: (-scores[id], id))
+        else:
+            # Without text to rank by, the most recently updated come first
+            ranked = sorted(
+                candidates,
+                key=lambda id: (self.docs[id].get("updated_at") or "", id),
+                reverse=True,
+            )
+        return [self.docs[id] for id in ranked[:limit]]
+
+    def _scores(self, terms: List[str], candidates: Set[Any]) -> Dict[Any, float]:
+        count = len(self.docs)
+        average = sum(self.lengths.values()) / count if count else 0.0
+        scores = dict.fromkeys(candidates, 0.0)
+        for term in terms:
+            postings = self.postings.get(term, {})
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for id in candidates:
+                tf = postings.get(id, 0)
+                if tf:
+                    norm = self.k1 * (1 - self.b + self.b * self.lengths[id] / average)
+                    scores[id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+
+class LocalSearch:
+    """
+    Answers Clubhouse search queries from a WorkspaceMirror in memory, falling back to the API when it is stale.
+
+    Stories and epics are indexed by their name, label names and owners' mention names, and ranked with BM25. Their
+    descriptions and comments are only indexed when the mirror was created with hydrate, since slim documents have
+    neither. Queries support free text and the operators type:, owner:, label:, state:, epic:, project: and is: (done,
+    started, unstarted, archived, blocked), each of which can be negated with ! or -. Operator values are matched case-insensitively against names, e.g. state:"In Progress", or ids.
+
+    The index is rebuilt whenever the mirror has been refreshed since it was built, as told by its generation.
+
+    param mirror: Required. The mirror to search.
+    param max_age: Seconds after the mirror's last refresh beyond which searches go to the API instead. None never
+                   falls back.
+    param k1: BM25 term frequency saturation.
+    param b: BM25 document length normalization.
+    """
+
+    def __init__(
+        self,
+        mirror: WorkspaceMirror,
+        max_age: Optional[float] = 900.0,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        self.mirror = mirror
+        self.max_age = max_age
+        self.k1 = k1
+        self.b = b
+        self.generation: Optional[int] = None
+        self._corpora: Dict[str, _Corpus] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the mirror has never been refreshed, or not within max_age seconds."""
+        refreshed = self.mirror.last_refreshed
+        if refreshed is None:
+            return True
+        if self.max_age is None:
+            return False
+        age = datetime.now(timezone.utc) - datetime.strptime(
+            refreshed, "%Y-%m-%dT%H:%M:%SZ"
+        ).replace(tzinfo=timezone.utc)
+        return age.total_seconds() > self.max_age
+
+    def build(self) -> None:
+        """Index the mirror's current contents, replacing the previous index."""
+        with self._lock:
+            self._build()
+
+    def _build(self) -> None:
+        generation = self.mirror.generation
+        mentions = {}
+        for member in self.mirror.iter("members"):
+            profile = member.get("profile") or {}
+            mentions[member["id"]] = profile.get("mention_name")
+        states = {}
+        for workflow in self.mirror.iter("workflows"):
+            for state in workflow.get("states") or ():
+                states[state["id"]] = state
+        epics = {epic["id"]: epic for epic in self.mirror.iter("epics")}
+        projects = {p["id"]: p.get("name") for p in self.mirror.iter("projects")}
+
+        def people(owner_ids: Iterable[str]) -> List[Tuple[str, str]]:
+            facets = []
+            for owner_id in owner_ids or ():
+                facets.append(("owner", owner_id))
+                if mentions.get(owner_id):
+                    facets.append(("owner", mentions[owner_id]))
+            return facets
+
+        def common(doc: dict) -> Tuple[List[str], List[Tuple[str, str]]]:
+            labels = doc.get("labels") or ()
+            text = [doc.get("name")] * NAME_WEIGHT + [doc.get("description")]
+            text += [comment.get("text") for comment in doc.get("comments") or ()]
+            text += [label.get("name") for label in labels]
+            text += [mentions.get(o) for o in doc.get("owner_ids") or ()]
+            facets = people(doc.get("owner_ids"))
+            for label in labels:
+                facets += [("label", label.get("name")), ("label", label.get("id"))]
+            for flag in ("archived", "blocked"):
+                if doc.get(flag):
+                    facets.append(("is", flag))
+            return text, facets
+
+        stories = _Corpus(self.k1, self.b)
+        for story in self.mirror.iter("stories"):
+            text, facets = common(story)
+            facets.append(("type", story.get("story_type")))
+            state = states.get(story.get("workflow_state_id")) or {}
+            facets += [("state", state.get("name")), ("state", state.get("id"))]
+            if state.get("type"):
+                facets.append(("is", state["type"]))
+            elif story.get("completed"):
+                facets.append(("is", "done"))
+            epic = epics.get(story.get("epic_id")) or {}
+            facets += [("epic", epic.get("name")), ("epic", epic.get("id"))]
+            project = story.get("project_id")
+            facets += [("project", projects.get(project)), ("project", project)]
+            stories.add(story, text, [f for f in facets if f[1] is not None])
+
+        epics_corpus = _Corpus(self.k1, self.b)
+        for epic in epics.values():
+            text, facets = common(epic)
+            facets.append(("state", epic.get("state")))
+            if epic.get("completed") or epic.get("state") == "done":
+                facets.append(("is", "done"))
+            elif epic.get("started"):
+                facets.append(("is", "started"))
+            else:
+                facets.append(("is", "unstarted"))
+            epics_corpus.add(epic, text, [f for f in facets if f[1] is not None])
+
+        self._corpora = {"stories": stories, "epics": epics_corpus}
+        self.generation = generation
+
+    def _local(self, entity: str, query: str, limit: Optional[int]) -> List[dict]:
+        with self._lock:
+            if not self._corpora or self.generation != self.mirror.generation:
+                self._build()
+            corpus = self._corpora[entity]
+        return corpus.search(ParseQuery(query), limit)
+
+    def searchStories(self, query: str, limit: Optional[int] = 25) -> List[dict]:
+        """
+        Search Stories returns the Stories matching a query, best matches first.
+
+        param query: Required. Free text and search operators, e.g. 'login owner:jdoe is:done'.
+        param limit: The maximum number of Stories to return. None returns every match.
+        """
+        if self.stale:
+            return list(
+                itertools.islice(self.mirror.client.iterSearchStories(query), limit)
+            )
+        return self._local("stories", query, limit)
+
+    def searchEpics(self, query: str, limit: Optional[int] = 25) -> List[dict]:
+        """
+        Search Epics returns the Epics matching a query, best matches first.
+
+        param query: Required. Free text and search operators, e.g. 'billing !is:done'.
+        param limit: The maximum number of Epics to return. None returns every match.
+        """
+        if self.stale:
+            return list(
+                itertools.islice(self.mirror.client.iterSearchEpics(query), limit)
+            )
+        return self._local("epics", query, limit)
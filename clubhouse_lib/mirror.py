@@ -0,0 +1,215 @@
+"""A local SQLite copy of a Clubhouse workspace which can be refreshed incrementally."""
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from .client import ClubhouseClient
+from .type import StorySlim
+
+# Reference data is small enough to be listed in full on every refresh
+REFERENCE_ENTITIES = {
+    "epics": "listEpics",
+    "iterations": "listIterations",
+    "labels": "listLabels",
+    "members": "listMembers",
+    "milestones": "listMilestones",
+    "projects": "listProjects",
+    "workflows": "listWorkflows",
+}
+ENTITIES = ("stories",) + tuple(REFERENCE_ENTITIES)
+
+
+class WorkspaceMirror:
+    """
+    Persists the stories and reference data of a workspace to an on-disk SQLite database.
+
+    The first refresh downloads every story project by project. Later refreshes only ask Clubhouse for stories updated
+    since the most recent updated_at already mirrored, so the cost of a refresh is proportional to what changed. Stories
+    deleted upstream are only dropped by a full refresh.
+
+    Listing endpoints return StorySlim and EpicSlim documents, which have no description or comments. With hydrate,
+    every story and epic which changed is fetched again in full, at the cost of a request each.
+
+    param client: Required. The client used to talk to Clubhouse.
+    param path: The SQLite database file. Defaults to an in-memory database.
+    param hydrate: Store full Story and Epic documents instead of the slim ones listed.
+    """
+
+    def __init__(
+        self, client: ClubhouseClient, path: str = ":memory:", hydrate: bool = False
+    ) -> None:
+        self.client = client
+        self.path = path
+        self.hydrate = hydrate
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self.db:
+            for entity in ENTITIES:
+                self.db.execute(
+                    "CREATE TABLE IF NOT EXISTS {} (id PRIMARY KEY, updated_at TEXT, data TEXT NOT NULL)".format(
+                        entity
+                    )
+                )
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "WorkspaceMirror":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    #########
+    # State #
+    #########
+
+    def _state(self, key: str) -> Optional[str]:
+        row = self.db.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _setState(self, key: str, value: Optional[str]) -> None:
+        self.db.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def stories_cursor(self) -> Optional[str]:
+        """The latest updated_at of any mirrored story; the next refresh asks for stories updated since then."""
+        return self._state("stories_cursor")
+
+    @property
+    def last_refreshed(self) -> Optional[str]:
+        """The ISO 8601 time the mirror was last refreshed, or None if it never has been."""
+        return self._state("last_refreshed")
+
+    @property
+    def generation(self) -> int:
+        """The number of refreshes the mirror has seen, which unlike last_refreshed changes with every one of them."""
+        return int(self._state("generation") or 0)
+
+    ###########
+    # Refresh #
+    ###########
+
+    def _upsert(self, entity: str, rows: List[dict]) -> None:
+        self.db.executemany(
+            "INSERT OR REPLACE INTO {} (id, updated_at, data) VALUES (?, ?, ?)".format(
+                entity
+            ),
+            ((r["id"], r.get("updated_at"), json.dumps(r)) for r in rows),
+        )
+
+    def _replace(self, entity: str, rows: List[dict]) -> None:
+        self.db.execute("DELETE FROM {}".format(entity))
+        self._upsert(entity, rows)
+
+    def _hydrate(self, entity: str, rows: List[dict], fetch: Any) -> List[dict]:
+        # Keep what is already hydrated for rows which have not changed since
+        stored = {
+            id: (updated_at, json.loads(data))
+            for id, updated_at, data in self.db.execute(
+                "SELECT id, updated_at, data FROM {}".format(entity)
+            )
+        }
+        full = {}
+        stale = []
+        for row in rows:
+            updated_at, doc = stored.get(row["id"], (None, None))
+            if (
+                doc is not None
+                and "description" in doc
+                and updated_at == row.get("updated_at")
+            ):
+                full[row["id"]] = doc
+            else:
+                stale.append(row["id"])
+        for id, result in fetch(stale).items():
+            # A row which could not be fetched in full keeps its slim listing
+            if result.ok:
+                full[id] = result.result
+        return [full.get(row["id"], row) for row in rows]
+
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the mirror up to date, returning the number of rows written per entity.
+
+        param full: Re-download every story, dropping those deleted upstream, instead of only fetching changes.
+        """
+        with self._lock:
+            reference = {
+                entity: getattr(self.client, method)()
+                for entity, method in REFERENCE_ENTITIES.items()
+            }
+            cursor = None if full else self.stories_cursor
+            if cursor is None:
+                stories: List[StorySlim] = []
+                for project in reference["projects"]:
+                    stories.extend(self.client.listStories(project["id"]))
+            else:
+                stories = self.client.searchStoriesOld(updated_at_start=cursor)  # type: ignore
+            if self.hydrate:
+                reference["epics"] = self._hydrate(
+                    "epics", reference["epics"], self.client.getEpics
+                )
+                stories = self._hydrate("stories", stories, self.client.getStories)
+            counts = {entity: len(rows) for entity, rows in reference.items()}
+            counts["stories"] = len(stories)
+            with self.db:
+                for entity, rows in reference.items():
+                    self._replace(entity, rows)
+                if cursor is None:
+                    self._replace("stories", stories)
+                else:
+                    self._upsert("stories", stories)
+                (latest,) = self.db.execute(
+                    "SELECT MAX(updated_at) FROM stories"
+                ).fetchone()
+                (now,) = self.db.execute(
+                    "SELECT strftime('%Y-%m-%dT%H:%M:%SZ', 'now')"
+                ).fetchone()
+                self._setState("stories_cursor", latest)
+                self._setState("last_refreshed", now)
+                self._setState("generation", str(self.generation + 1))
+            return counts
+
+    ###########
+    # Queries #
+    ###########
+
+    def get(self, entity: str, id: Any) -> Optional[dict]:
+        """
+        Get a single mirrored resource.
+
+        param entity: Required. One of stories, epics, iterations, labels, members, milestones, projects or workflows.
+        param id: Required. The unique ID of the resource.
+        """
+        if entity not in ENTITIES:
+            raise ValueError("Unknown entity {}".format(entity))
+        row = self.db.execute(
+            "SELECT data FROM {} WHERE id = ?".format(entity), (id,)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def iter(self, entity: str) -> Iterator[dict]:
+        """
+        Iterate over every mirrored resource of a kind.
+
+        param entity: Required. One of stories, epics, iterations, labels, members, milestones, projects or workflows.
+        """
+        if entity not in ENTITIES:
+            raise ValueError("Unknown entity {}".format(entity))
+        for (data,) in self.db.execute(
+            "SELECT data FROM {} ORDER BY id".format(entity)
+        ):
+            yield json.loads(data)
+
+    def stories(self) -> Iterator[StorySlim]:
+        return self.iter("stories")
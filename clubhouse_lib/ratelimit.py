@@ -0,0 +1,242 @@
+"""Client side rate limiting and retry scheduling for requests made against the Clubhouse API."""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+import requests
+
+# Clubhouse allows 200 requests per minute per token
+DEFAULT_RATE = 200 / 60.0
+DEFAULT_BURST = 200
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+RETRY_STATUSES = frozenset([500, 502, 503, 504])
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. Tokens are reserved up front, so concurrent callers are queued fairly instead of racing for the next free token.
+
+    param rate: Tokens added to the bucket per second.
+    param capacity: The maximum number of tokens the bucket can hold, i.e. the largest burst allowed.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket, returning how many seconds the caller must wait before using them."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def drain(self, seconds: float) -> None:
+        """
+        Empty the bucket so that no further tokens are handed out for at least the given number of seconds.
+
+        Pauses overlap rather than add up, so many requests throttled at once hold the bucket for the longest of them.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    @property
+    def available(self) -> float:
+        """The number of tokens currently available. Negative when callers are queued for future tokens."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+def ParseRetryAfter(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header, given either in seconds or as an HTTP date, into a number of seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestScheduler:
+    """
+    Paces requests through a token bucket and retries those which fail transiently.
+
+    Rate limited (429) responses are retried for every verb, as the server did not act on them, after waiting out the
+    Retry-After header when one is given. Server errors and connection failures are only retried for idempotent verbs.
+    Retries back off exponentially with full jitter.
+
+    param rate: Requests allowed per second. None disables client side throttling.
+    param burst: The number of requests which may be made back to back before throttling kicks in.
+    param max_retries: The maximum number of times a single request is retried.
+    param backoff_base: The backoff ceiling, in seconds, for the first retry. It doubles with every further retry.
+    param backoff_max: The largest backoff ceiling, in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+    ) -> None:
+        self.bucket = None if rate is None else TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0
+        self.throttled = 0
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def budget(self) -> Optional[float]:
+        """The number of requests which can be made right now without waiting. None when throttling is disabled."""
+        if self.bucket is None:
+            return None
+        return max(0.0, self.bucket.available)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests currently waiting for a token or a retry."""
+        return self._waiting
+
+    def _adjust_waiting(self, delta: int) -> None:
+        with self._lock:
+            self._waiting += delta
+
+    def backoff(self, attempt: int) -> float:
+        """The jittered delay before the given retry attempt, counting from zero."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * (2**attempt))
+        )
+
+    def retry_delay(self, method: str, attempt: int, response=None) -> Optional[float]:
+        """
+        Decide whether a request should be retried, returning the seconds to wait first or None to give up.
+
+        param method: The HTTP verb of the request.
+        param attempt: The number of retries already made for the request.
+        param response: The response received, or None when the request raised a connection error.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is not None and response.status_code == 429:
+            with self._lock:
+                self.throttled += 1
+            delay = ParseRetryAfter(response.headers.get("Retry-After"))
+            if delay is None:
+                return self.backoff(attempt)
+            # Hold back every other request sharing this scheduler as well
+            if self.bucket is not None:
+                self.bucket.drain(delay)
+            return delay
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return None
+        if response is None or response.status_code in RETRY_STATUSES:
+            return self.backoff(attempt)
+        return None
+
+    def send(
+        self,
+        method: str,
+        send: Callable,
+        exceptions: Tuple = (requests.ConnectionError, requests.Timeout),
+    ):
+        """
+        Call send() once a token is available, retrying it as needed, and return the final response.
+
+        param method: The HTTP verb of the request.
+        param send: Performs the request and returns a response with status_code and headers.
+        param exceptions: Connection level errors raised by send() which may be retried.
+        """
+        attempt = 0
+        while True:
+            self._wait(self.bucket.reserve() if self.bucket is not None else 0.0)
+            try:
+                response = send()
+            except exceptions:
+                delay = self.retry_delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry_delay(method, attempt, response)
+                if delay is None:
+                    return response
+                # Hand the connection back to the pool rather than holding it through the wait
+                if hasattr(response, "close"):
+                    response.close()
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            self._wait(delay)
+
+    async def send_async(self, method: str, send: Callable, exceptions: Tuple = ()):
+        """The asyncio counterpart to send(); send() must return an awaitable."""
+        attempt = 0
+        while True:
+            await self._wait_async(
+                self.bucket.reserve() if self.bucket is not None else 0.0
+            )
+            try:
+                response = await send()
+            except exceptions:
+                delay = self.retry_delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry_delay(method, attempt, response)
+                if delay is None:
+                    return response
+                # aiohttp responses hold their connection until released
+                if hasattr(response, "release"):
+                    await response.release()
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            await self._wait_async(delay)
+
+    def _wait(self, delay: float) -> None:
+        if delay <= 0:
+            return
+        self._adjust_waiting(1)
+        try:
+            time.sleep(delay)
+        finally:
+            self._adjust_waiting(-1)
+
+    async def _wait_async(self, delay: float) -> None:
+        if delay <= 0:
+            return
+        self._adjust_waiting(1)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._adjust_waiting(-1)
@@ -0,0 +1,269 @@
+"""Compact, attribute-access record classes generated from the response TypedDicts."""
+
+import collections.abc
+from datetime import datetime
+from enum import Enum
+import functools
+import inspect
+import typing
+from typing import Any, Callable, FrozenSet, Optional, Tuple, Type, Union
+
+from .timestamps import DEFAULT_TIMESTAMP_CACHE
+
+
+def ParseEnum(enum: Type[Enum]) -> Callable[[Any], Any]:
+    """Look values up in an Enum, keeping values it does not know about, e.g. ones added to the API since, as they are."""
+
+    def parse(value: Any) -> Any:
+        try:
+            return enum(value)
+        except ValueError:
+            return value
+
+    return parse
+
+
+def IsTypedDict(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, dict) and hasattr(tp, "__total__")
+
+
+def Converter(tp: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Build a function converting a decoded JSON value into the type an annotation describes: TypedDicts become records,
+    datetimes are parsed and Enum values looked up. Returns None when values of the type are used as they are.
+    """
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        return Converter(members[0]) if len(members) == 1 else None
+    if origin is list:
+        item = Converter(args[0]) if args else None
+        if item is None:
+            return None
+        return lambda values: [None if v is None else item(v) for v in values]
+    if origin in (collections.abc.Iterator, collections.abc.Iterable):
+        item = Converter(args[0]) if args else None
+        if item is None:
+            return None
+        return lambda values: (None if v is None else item(v) for v in values)
+    if tp is datetime:
+        return DEFAULT_TIMESTAMP_CACHE.parse
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return ParseEnum(tp)
+    if IsTypedDict(tp):
+        # Resolved on first use, so TypedDicts which refer to each other do not recurse
+        return lambda value: RecordType(tp)(value)
+    return None
+
+
+def IsList(tp: Any) -> bool:
+    """Whether an annotation is a List, or an Optional List."""
+    if typing.get_origin(tp) is Union:
+        members = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+        return len(members) == 1 and IsList(members[0])
+    return typing.get_origin(tp) is list
+
+
+def _TupleSetter(member: Any) -> Callable[[Any, Any], None]:
+    def set_raw(obj: Any, value: Any) -> None:
+        member.__set__(obj, value if value is None else tuple(value))
+
+    return set_raw
+
+
+def _Then(
+    first: Callable[[Any], Any], then: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    return lambda value: then(first(value))
+
+
+class _LazyField:
+    """A record field whose raw JSON value is converted the first time it is read, then kept in its slot."""
+
+    __slots__ = ("member", "bit", "convert")
+
+    def __init__(self, member: Any, bit: int, convert: Callable[[Any], Any]) -> None:
+        self.member = member
+        self.bit = bit
+        self.convert = convert
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = self.member.__get__(obj, owner)
+        if obj._pending & self.bit:
+            if value is not None:
+                value = self.convert(value)
+                self.member.__set__(obj, value)
+            obj._pending &= ~self.bit
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.member.__set__(obj, value)
+        obj._pending &= ~self.bit
+
+
+class Record:
+    """
+    The base of the record classes built by RecordType.
+
+    A record holds the same fields as its TypedDict in __slots__ rather than a dict, which takes a fraction of the
+    memory, and holds list fields as tuples. Fields are read as attributes, or by key for code written against the
+    dict responses. Fields which the response omitted are None. Nested objects, timestamps and Enum values are only
+    converted when first read. to_dict turns a record back into a dict.
+    """
+
+    __slots__ = ("_pending", "_extra")
+    _fields: Tuple[str, ...] = ()
+    _names: FrozenSet[str] = frozenset()
+    _setters: Tuple[Tuple[str, Callable[[Any, Any], None]], ...] = ()
+    _lazy: int = 0
+
+    def __init__(self, data: dict) -> None:
+        for name, set_raw in self._setters:
+            set_raw(self, data.get(name))
+        self._pending = self._lazy
+        # Keys added to the API since the TypedDict was generated are kept rather than lost
+        self._extra = {k: v for k, v in data.items() if k not in self._names} or None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._names:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def to_dict(self) -> dict:
+        """The record as a plain dict shaped like its TypedDict, with nested records converted too."""
+
+        def plain(value: Any) -> Any:
+            if isinstance(value, Record):
+                return value.to_dict()
+            if isinstance(value, (list, tuple)):
+                return [plain(v) for v in value]
+            return value
+
+        data = {name: plain(getattr(self, name)) for name in self._fields}
+        if self._extra is not None:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields = (
+            "{}={!r}".format(name, getattr(self, name))
+            for name in self._fields
+            if getattr(self, name) is not None
+        )
+        return "{}({})".format(type(self).__name__, ", ".join(fields))
+
+
+@functools.lru_cache(maxsize=None)
+def RecordType(typeddict: type) -> Type[Record]:
+    """Build the record class for a TypedDict from type.py, e.g. RecordType(StorySlim). Classes are built once and reused."""
+    hints = typing.get_type_hints(typeddict)
+    fields = tuple(hints)
+    cls = type(
+        typeddict.__name__,
+        (Record,),
+        {"__slots__": fields, "__doc__": typeddict.__doc__, "__module__": __name__},
+    )
+    setters = []
+    lazy = 0
+    for i, name in enumerate(fields):
+        member = cls.__dict__[name]
+        convert = Converter(hints[name])
+        if IsList(hints[name]):
+            # Lists are held as tuples: an empty tuple is shared, and records are not meant to be mutated in place
+            if convert is None:
+                setters.append((name, _TupleSetter(member)))
+            else:
+                setters.append((name, member.__set__))
+                convert = _Then(convert, tuple)
+        else:
+            setters.append((name, member.__set__))
+        if convert is not None:
+            setattr(cls, name, _LazyField(member, 1 << i, convert))
+            lazy |= 1 << i
+    cls._fields = fields
+    cls._names = frozenset(fields)
+    cls._setters = tuple(setters)
+    cls._lazy = lazy
+    return cls
+
+
+class RecordClient:
+    """
+    A view of a ClubhouseClient or AsyncClubhouseClient whose methods return records instead of dicts.
+
+    Every method of the wrapped client is available. Those whose return type mentions a TypedDict, e.g. List[StorySlim]
+    or Iterator[Story], have their results converted to records; everything else is passed through unchanged.
+
+    param client: The client to wrap.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.client, name)
+        if not inspect.ismethod(attr):
+            return attr
+        try:
+            returns = typing.get_type_hints(attr).get("return")
+        except Exception:  # Annotations which cannot be resolved are left alone
+            returns = None
+        if inspect.isasyncgenfunction(attr):
+            # AsyncIterator[X] converts each X as it is yielded
+            args = typing.get_args(returns)
+            convert = Converter(args[0]) if args else None
+        else:
+            convert = Converter(returns)
+        if convert is None:
+            method = attr
+        elif inspect.isasyncgenfunction(attr):
+
+            @functools.wraps(attr)
+            async def method(*args, **kwargs):
+                async for value in attr(*args, **kwargs):
+                    yield None if value is None else convert(value)
+
+        elif inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            async def method(*args, **kwargs):
+                return convert(await attr(*args, **kwargs))
+
+        else:
+
+            @functools.wraps(attr)
+            def method(*args, **kwargs):
+                return convert(attr(*args, **kwargs))
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, method)
+        return method
+
+
+def Records(typeddict: type, values: Any) -> Any:
+    """Convert decoded JSON, e.g. the result of listStories, into records of a TypedDict or lists of them."""
+    convert = Converter(typeddict)
+    if convert is None:
+        raise TypeError("{!r} does not describe records".format(typeddict))
+    if isinstance(values, list):
+        return [None if v is None else convert(v) for v in values]
+    return convert(values)
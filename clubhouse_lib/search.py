@@ -0,0 +1,174 @@
+"""Pagination helpers for the Clubhouse search endpoints."""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from typing import AsyncIterator, Callable, Iterator, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+import warnings
+
+# Only the first 1000 matches of a search can be paged through, see MaxSearchResultsExceededError
+MAX_SEARCH_RESULTS = 1000
+
+
+def SplitNext(next: str, apiURL: str) -> Tuple[str, dict]:
+    """
+    Split the next value of a search response into an endpoint and query parameters that can be handed to get().
+
+    param next: The URL path and query string for the next page of search results, e.g. /api/v3/search/stories?query=...&next=...
+    param apiURL: The API URL of the client, whose path prefix is stripped from the endpoint.
+    """
+    parts = urlsplit(next)
+    prefix = urlsplit(apiURL).path.rstrip("/")
+    endpoint = parts.path
+    if prefix and endpoint.startswith(prefix + "/"):
+        endpoint = endpoint[len(prefix) :]
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    # The client appends its own token, so never forward one echoed back by the server
+    params.pop("token", None)
+    return endpoint, params
+
+
+def IterPages(
+    fetch: Callable[[str, Optional[dict]], dict],
+    endpoint: str,
+    params: dict,
+    apiURL: str,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """
+    Yield every page of a paginated search, following the next value of each page until it runs out.
+
+    param fetch: Returns the decoded page for an endpoint and its query parameters.
+    param endpoint: The endpoint of the first page.
+    param params: The query parameters of the first page.
+    param apiURL: The API URL of the client, used to resolve next values.
+    param prefetch: Fetch the following page in the background while the caller processes the current one.
+    """
+    pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+    try:
+        page = fetch(endpoint, params)
+        while True:
+            if prefetch and page.get("next"):
+                pending = pool.submit(fetch, *SplitNext(page["next"], apiURL))
+            yield page
+            if not page.get("next"):
+                return
+            if pending is not None:
+                page, pending = pending.result(), None
+            else:
+                page = fetch(*SplitNext(page["next"], apiURL))
+    finally:
+        # Stopping early abandons the page being prefetched rather than waiting on it
+        if pending is not None:
+            pending.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+async def IterPagesAsync(
+    fetch: Callable,
+    endpoint: str,
+    params: dict,
+    apiURL: str,
+    prefetch: bool = False,
+) -> AsyncIterator[dict]:
+    """The asyncio counterpart to IterPages; fetch must be a coroutine function."""
+    pending = None
+    try:
+        page = await fetch(endpoint, params)
+        while True:
+            if prefetch and page.get("next"):
+                pending = asyncio.ensure_future(fetch(*SplitNext(page["next"], apiURL)))
+            yield page
+            if not page.get("next"):
+                return
+            if pending is not None:
+                page, pending = await pending, None
+            else:
+                page = await fetch(*SplitNext(page["next"], apiURL))
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def IterSharded(
+    fetch: Callable[[str, Optional[dict]], dict],
+    endpoint: str,
+    query: str,
+    start: date,
+    end: date,
+    apiURL: str,
+    field: str = "created",
+    max_workers: int = 4,
+    page_size: int = 25,
+    limit: int = MAX_SEARCH_RESULTS,
+) -> Iterator[dict]:
+    """
+    Yield every match of a search, however many there are, by splitting it into date windows small enough to be paged through.
+
+    The [start, end] window is bisected until each shard matches no more than limit results, then the shards are paged
+    through concurrently. Results are yielded shard by shard, as each one completes, with duplicates removed by id.
+
+    param fetch: Returns the decoded page for an endpoint and its query parameters.
+    param endpoint: The search endpoint, /search/stories or /search/epics.
+    param query: Required. See our help center article on search operators
+    param start: The first day to include.
+    param end: The last day to include.
+    param apiURL: The API URL of the client, used to resolve next values.
+    param field: The date search operator used to shard the query, e.g. created or updated.
+    param max_workers: The maximum number of requests in flight at once.
+    param page_size: The number of search results to fetch per page. Minimum of 1 and maximum of 25.
+    param limit: The largest number of matches a single shard may have.
+    """
+
+    def window(lo: date, hi: date) -> str:
+        return "{} {}:{}..{}".format(query, field, lo.isoformat(), hi.isoformat())
+
+    def count(lo: date, hi: date) -> int:
+        return fetch(endpoint, {"query": window(lo, hi), "page_size": 1}).get(
+            "total", 0
+        )
+
+    def collect(lo: date, hi: date) -> list:
+        params = {"query": window(lo, hi), "page_size": page_size}
+        return [
+            item
+            for page in IterPages(fetch, endpoint, params, apiURL)
+            for item in page["data"]
+        ]
+
+    seen = set()
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {pool.submit(count, start, end): (count, start, end)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                task, lo, hi = pending.pop(future)
+                if task is collect:
+                    for item in future.result():
+                        if item["id"] not in seen:
+                            seen.add(item["id"])
+                            yield item
+                    continue
+                total = future.result()
+                if total == 0:
+                    continue
+                if total <= limit or lo >= hi:
+                    if total > limit:
+                        warnings.warn(
+                            "{} matches more than {} results on {} alone; only the first {} are returned".format(
+                                query, limit, lo.isoformat(), limit
+                            )
+                        )
+                    pending[pool.submit(collect, lo, hi)] = (collect, lo, hi)
+                    continue
+                mid = lo + (hi - lo) // 2
+                for shard in ((lo, mid), (mid + timedelta(days=1), hi)):
+                    pending[pool.submit(count, *shard)] = (count,) + shard
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
@@ -0,0 +1,156 @@
+"""JSON encoding and decoding backends for request and response bodies."""
+
+from datetime import date, datetime, time
+from enum import Enum
+import functools
+import json
+import sys
+import typing
+from typing import Any, Dict, FrozenSet, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, see the "fast" extra
+    orjson = None
+
+# Strings interned wherever these keys appear, besides the member and group UUID fields found in type.py
+INTERNED_FIELDS = frozenset({"entity_type", "color"})
+# String ids which are unique to one entity, so interning them saves nothing
+NOT_INTERNED_FIELDS = frozenset({"external_id"})
+# Strings interned only inside objects listed under these keys, e.g. the names of a Story's labels
+INTERNED_NESTED_FIELDS = {"labels": frozenset({"name"})}
+
+
+def EncodeDefault(obj: Any) -> Any:
+    """Convert the values json cannot serialize by itself: datetimes become ISO 8601 strings and Enums their values."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(type(obj).__name__)
+    )
+
+
+class JSONSerializer:
+    """The standard library json backend; always available."""
+
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(
+            data, default=EncodeDefault, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonSerializer:
+    """The orjson backend, which encodes datetimes and Enums natively and decodes straight from the response bytes."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "OrjsonSerializer requires orjson; install clubhouse-lib[fast]"
+            )
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, default=EncodeDefault)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+def DefaultSerializer():
+    """The fastest serializer available: orjson when it is installed, the standard library otherwise."""
+    if orjson is not None:
+        return OrjsonSerializer()
+    return JSONSerializer()
+
+
+@functools.lru_cache(maxsize=None)
+def _InternPlan() -> Tuple[FrozenSet[str], Dict[str, Type[Enum]]]:
+    """
+    Read type.py for the fields worth interning: those holding member or group UUIDs (str fields named *_id and
+    List[str] fields named *_ids) and those whose annotation is always the same Enum, e.g. story_type and verb.
+    """
+    from . import type as types
+
+    strings = set(INTERNED_FIELDS)
+    enums: Dict[str, set] = {}
+    for value in vars(types).values():
+        if not (isinstance(value, type) and issubclass(value, dict)):
+            continue
+        for name, hint in typing.get_type_hints(value).items():
+            # Optional[X] is Union[X, None]; look at X
+            members = (
+                typing.get_args(hint) if typing.get_origin(hint) is Union else (hint,)
+            )
+            if name not in NOT_INTERNED_FIELDS and (
+                (name.endswith("_id") and str in members)
+                or (name.endswith("_ids") and typing.List[str] in members)
+            ):
+                strings.add(name)
+            for member in members:
+                if isinstance(member, type) and issubclass(member, Enum):
+                    enums.setdefault(name, set()).add(member)
+    return (
+        frozenset(strings),
+        {name: kinds.pop() for name, kinds in enums.items() if len(kinds) == 1},
+    )
+
+
+class InterningSerializer:
+    """
+    Wraps another serializer so that decoded responses share their repeated strings.
+
+    Member and group UUIDs, entity types and label names are interned, so every copy of one is the same object and
+    compares by identity. Values of Enum fields, e.g. story_type and verb, become the members of their Enum in type.py,
+    which are str subclasses and so still compare equal to the plain strings. Values an Enum does not know are kept as
+    strings.
+
+    param serializer: The serializer which does the encoding and decoding. Defaults to DefaultSerializer().
+    """
+
+    def __init__(self, serializer=None) -> None:
+        self.serializer = DefaultSerializer() if serializer is None else serializer
+        self.name = "interning-" + self.serializer.name
+        self.strings, enums = _InternPlan()
+        self.enums = {name: enum._value2member_map_ for name, enum in enums.items()}
+
+    def dumps(self, data: Any) -> bytes:
+        return self.serializer.dumps(data)
+
+    def loads(self, content: bytes) -> Any:
+        return self.intern(self.serializer.loads(content))
+
+    def intern(self, value: Any, nested: FrozenSet[str] = frozenset()) -> Any:
+        """Intern the strings of a decoded value in place, returning it."""
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, (dict, list)):
+                    self.intern(item, nested)
+            return value
+        if not isinstance(value, dict):
+            return value
+        for key, item in value.items():
+            if isinstance(item, str):
+                if key in self.enums:
+                    value[key] = self.enums[key].get(item, item)
+                elif key in self.strings or key in nested:
+                    value[key] = sys.intern(item)
+            elif isinstance(item, list):
+                if key in self.strings:
+                    value[key] = [
+                        sys.intern(v) if isinstance(v, str) else v for v in item
+                    ]
+                else:
+                    self.intern(item, INTERNED_NESTED_FIELDS.get(key, frozenset()))
+            elif isinstance(item, dict):
+                self.intern(item, INTERNED_NESTED_FIELDS.get(key, frozenset()))
+        return value
@@ -0,0 +1,67 @@
+"""Coalescing of identical concurrent requests."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """A call in flight, which callers arriving after it started wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Lets concurrent callers asking for the same key share a single call instead of each making their own.
+
+    The first caller for a key makes the call, and every caller arriving while it is in flight waits for it and gets
+    the same result, or the same exception. Once the call finishes the next caller starts a new one, so results are
+    never reused after the fact; pair with a ResponseCache for that.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Call func, unless a call for key is already in flight, in which case wait for that call's outcome instead.
+
+        param key: Required. Identifies calls which are interchangeable.
+        param func: Required. Makes the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of distinct calls currently in flight."""
+        return len(self._calls)
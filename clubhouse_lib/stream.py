@@ -0,0 +1,78 @@
+"""Incremental parsing of JSON array responses."""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+WHITESPACE = re.compile(r"\s*")
+# Characters which can legally follow a number inside an array
+NUMBER_TERMINATORS = frozenset(",] \t\r\n")
+
+
+def IterJSONArray(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array one at a time as its bytes arrive, holding at most one element plus one chunk in memory.
+
+    param chunks: The raw bytes of the array, split arbitrarily, e.g. a response's iter_content().
+    param encoding: The text encoding of the bytes.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> None:
+        nonlocal buffer, pos, eof
+        chunk = next(chunks, None)
+        if chunk is None:
+            buffer, pos, eof = buffer[pos:] + text.decode(b"", final=True), 0, True
+        else:
+            buffer, pos = buffer[pos:] + text.decode(chunk), 0
+
+    def skip() -> str:
+        """Advance past whitespace, returning the next character or an empty string at the end of the input."""
+        nonlocal pos
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos : pos + 1]
+            fill()
+
+    if skip() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    first = True
+    while True:
+        char = skip()
+        if char == "]":
+            return
+        if not first:
+            if char != ",":
+                raise ValueError(
+                    "Expected ',' or ']' but found {!r}".format(char or "end of input")
+                )
+            pos += 1
+            skip()
+        first = False
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            # A number cut off by the end of the buffer, e.g. 12 of 12.5, may continue in the next chunk
+            if (
+                not eof
+                and isinstance(value, (int, float))
+                and (end == len(buffer) or buffer[end] not in NUMBER_TERMINATORS)
+            ):
+                fill()
+                continue
+            break
+        pos = end
+        yield value
@@ -0,0 +1,167 @@
+"""Fast decoding of the ISO 8601 timestamps in responses."""
+
+from datetime import datetime, timedelta, timezone
+import typing
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, see the "frame" extra
+    np = None
+
+# Distinct timestamps remembered by a TimestampCache before it starts over
+TIMESTAMP_CACHE_SIZE = 65536
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def ParseTimestamp(value: str) -> datetime:
+    """Parse a Clubhouse timestamp, e.g. 2019-08-20T17:38:20.123Z, into an aware datetime."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Older Pythons only accept 3 or 6 digits of fractional seconds
+        head, dot, tail = value.partition(".")
+        if not dot:
+            raise
+        digits = len(tail) - len(tail.lstrip("0123456789"))
+        fraction = (tail[:digits] + "000000")[:6]
+        return datetime.fromisoformat(head + "." + fraction + tail[digits:])
+
+
+def _HasOffset(value: str) -> bool:
+    # The date part has dashes too, so only look after the time
+    return len(value) > 19 and ("+" in value[19:] or "-" in value[19:])
+
+
+class TimestampCache:
+    """
+    Memoizes parsed timestamps, since the same instants recur across a response: Stories created or moved together,
+    and the same Iteration or Epic dates repeated on every Story in it.
+
+    The cache starts over once it holds maxsize timestamps, which keeps its memory bounded without the bookkeeping of
+    an LRU.
+
+    param maxsize: The maximum number of distinct timestamps remembered.
+    """
+
+    def __init__(self, maxsize: int = TIMESTAMP_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._datetimes: Dict[str, datetime] = {}
+
+    def parse(self, value: str) -> datetime:
+        """The aware datetime of a timestamp."""
+        parsed = self._datetimes.get(value)
+        if parsed is not None:
+            self.hits += 1
+            return parsed
+        self.misses += 1
+        parsed = ParseTimestamp(value)
+        if len(self._datetimes) >= self.maxsize:
+            self._datetimes.clear()
+        self._datetimes[value] = parsed
+        return parsed
+
+    def micros(self, value: str) -> int:
+        """Microseconds since the Unix epoch of a timestamp."""
+        return (self.parse(value) - EPOCH) // MICROSECOND
+
+    def clear(self) -> None:
+        self._datetimes.clear()
+
+    def __len__(self) -> int:
+        return len(self._datetimes)
+
+
+# Shared by the record classes, so a timestamp repeated across records is parsed once
+DEFAULT_TIMESTAMP_CACHE = TimestampCache()
+
+
+def _DatetimeMicros(value: datetime) -> int:
+    # Records hold aware datetimes; naive ones are taken to be in UTC, as Clubhouse timestamps are
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // MICROSECOND
+
+
+def EpochMicros(
+    values: Iterable[Optional[str]], cache: TimestampCache = None
+) -> List[Optional[int]]:
+    """Microseconds since the Unix epoch of each timestamp, or None where there is none. Does not need numpy."""
+    cache = DEFAULT_TIMESTAMP_CACHE if cache is None else cache
+    return [None if v is None else cache.micros(v) for v in values]
+
+
+def TimestampArray(values: Sequence[Union[str, datetime, None]]) -> "np.ndarray":
+    """
+    Parse timestamps into a datetime64[us] array in UTC, with NaT where there is none.
+
+    Each distinct timestamp is parsed once, by numpy's own ISO 8601 parser, however often it occurs.
+
+    param values: Required. ISO 8601 strings, datetimes already parsed by a record, or None, e.g. the created_at of
+                  every Story in a response.
+    """
+    if np is None:
+        raise ImportError("TimestampArray requires numpy; install clubhouse-lib[frame]")
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (-1 if v is None else index.setdefault(v, len(index)) for v in values),
+        dtype=np.int64,
+        count=len(values),
+    )
+    unique = list(index)
+    parsed = np.empty(len(unique) + 1, dtype="datetime64[us]")
+    parsed[-1] = np.datetime64("NaT")
+    # numpy parses naive and UTC timestamps itself; ones with another offset go through Python
+    plain = []
+    for i, value in enumerate(unique):
+        if isinstance(value, datetime):
+            parsed[i] = np.datetime64(_DatetimeMicros(value), "us")
+        elif _HasOffset(value):
+            parsed[i] = np.datetime64(DEFAULT_TIMESTAMP_CACHE.micros(value), "us")
+        else:
+            plain.append(i)
+    parsed[plain] = np.array(
+        [unique[i].rstrip("Z") for i in plain], dtype="datetime64[us]"
+    )
+    return parsed[codes]
+
+
+def TimestampFields(typeddict: type) -> List[str]:
+    """The fields of a TypedDict annotated as datetime or Optional[datetime], e.g. created_at and completed_at."""
+    fields = []
+    for name, hint in typing.get_type_hints(typeddict).items():
+        if typing.get_origin(hint) is typing.Union:
+            hint = next(
+                (arg for arg in typing.get_args(hint) if arg is not type(None)), None
+            )
+        if hint is datetime:
+            fields.append(name)
+    return fields
+
+
+def DecodeTimestamps(
+    typeddict: type, rows: Sequence[Any], fields: Sequence[str] = None
+) -> Dict[str, "np.ndarray"]:
+    """
+    Parse every timestamp field of a batch of rows at once, returning a datetime64[us] array per field.
+
+    The columns share one parse, so a timestamp appearing in several fields, e.g. started_at and moved_at, is only
+    parsed once.
+
+    param typeddict: Required. The TypedDict from type.py describing the rows, e.g. StorySlim.
+    param rows: Required. The decoded rows, as dicts or records, e.g. the result of listStories.
+    param fields: The fields to decode. Defaults to every datetime field of typeddict.
+    """
+    fields = TimestampFields(typeddict) if fields is None else list(fields)
+    values = [row.get(name) for name in fields for row in rows]
+    parsed = TimestampArray(values)
+    return {
+        name: parsed[i * len(rows) : (i + 1) * len(rows)]
+        for i, name in enumerate(fields)
+    }
@@ -0,0 +1,144 @@
+"""Connection pooling and compression for the Clubhouse client transport."""
+
+import gzip
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+# Every content coding urllib3 can decode here: gzip and deflate, plus br when brotli is installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+# Compression level of gzipped request bodies, which favours speed since bodies are compressed on every send
+GZIP_LEVEL = 6
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which keeps connections alive between requests and drops them once they have been idle for too long.
+
+    param pool_connections: The number of per-host connection pools to keep around.
+    param pool_maxsize: The maximum number of connections kept alive for any one host.
+    param pool_idle_timeout: Seconds the adapter may sit unused before its pooled connections are discarded. None keeps them forever.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_idle_timeout: Optional[float] = None,
+    ) -> None:
+        self.pool_idle_timeout = pool_idle_timeout
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def send(self, request, **kwargs):
+        self.evict_idle()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self._lock:
+                self._last_used = time.monotonic()
+
+    def evict_idle(self) -> bool:
+        """Discard every pooled connection if the adapter has been idle longer than pool_idle_timeout."""
+        if self.pool_idle_timeout is None:
+            return False
+        with self._lock:
+            if time.monotonic() - self._last_used <= self.pool_idle_timeout:
+                return False
+            self._last_used = time.monotonic()
+        # Connections already checked out by in-flight requests are not affected
+        self.poolmanager.clear()
+        return True
+
+
+def CreateSession(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    keep_alive: bool = True,
+    pool_idle_timeout: Optional[float] = None,
+) -> requests.Session:
+    """
+    Build a requests.Session whose HTTP and HTTPS traffic is served from a shared connection pool.
+
+    param pool_connections: The number of per-host connection pools to keep around.
+    param pool_maxsize: The maximum number of connections kept alive for any one host.
+    param keep_alive: When false, every request asks the server to close the connection afterwards.
+    param pool_idle_timeout: Seconds the pool may sit unused before its connections are discarded.
+    """
+    session = requests.Session()
+    adapter = PooledAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_idle_timeout=pool_idle_timeout,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def GzipBody(body: bytes, level: int = GZIP_LEVEL) -> bytes:
+    return gzip.compress(body, compresslevel=level)
+
+
+class TransferStats:
+    """
+    Counts the bytes a client has sent and received, both as they went over the wire and once decoded.
+
+    The difference between the two is what compression saved; ratio gives the received wire bytes per decoded byte.
+    """
+
+    def __init__(self) -> None:
+        self.sent_bytes = 0
+        self.sent_wire_bytes = 0
+        self.received_bytes = 0
+        self.received_wire_bytes = 0
+        self._lock = threading.Lock()
+
+    def sent(self, decoded: int, wire: int) -> None:
+        with self._lock:
+            self.sent_bytes += decoded
+            self.sent_wire_bytes += wire
+
+    def received(self, response: requests.Response, decoded: int = None) -> int:
+        """Count a response body which has been read, or the decoded bytes read so far of a streamed one, returning its wire bytes."""
+        if decoded is None:
+            decoded = len(response.content or b"")
+        # urllib3 tells how many bytes it read off the socket, before decoding, except of chunked responses where it
+        # always says 0; those are counted as if they were not compressed
+        wire = getattr(response.raw, "tell", lambda: 0)() or decoded
+        with self._lock:
+            self.received_bytes += decoded
+            self.received_wire_bytes += wire
+        return wire
+
+    @property
+    def ratio(self) -> float:
+        with self._lock:
+            if not self.received_bytes:
+                return 1.0
+            return self.received_wire_bytes / self.received_bytes
+
+
+class ClubhouseResponse(requests.Response):
+    """A requests.Response whose json() decodes the body with the serializer of the client that received it."""
+
+    serializer = None
+
+    @classmethod
+    def adopt(cls, response: requests.Response, serializer) -> "ClubhouseResponse":
+        response.__class__ = cls
+        response.serializer = serializer
+        return response
+
+    def json(self, **kwargs):
+        if self.serializer is None or kwargs:
+            return super().json(**kwargs)
+        return self.serializer.loads(self.content)
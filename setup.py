@@ -56,4 +56,12 @@ setup(
     license="MIT",
     packages=find_packages(),
     install_requires=["requests"],
+    extras_require={
+        "arrow": ["pyarrow"],
+        "async": ["aiohttp"],
+        "brotli": ["brotli"],
+        "fast": ["orjson"],
+        "frame": ["numpy"],
+        "otel": ["opentelemetry-api"],
+    },
 )
@@ -0,0 +1,101 @@
+import unittest
+
+import requests
+
+from clubhouse_lib.bulk import PlanUpdates, RunChunks, UpdatePlanStep
+from clubhouse_lib.ratelimit import RequestScheduler
+
+
+def ServerError() -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = 500
+    return requests.HTTPError("500 Server Error", response=response)
+
+
+class RunChunksTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = RequestScheduler(rate=None, backoff_base=0.0)
+        self.calls = []
+
+    def failing(self, chunk):
+        self.calls.append(chunk)
+        raise ServerError()
+
+    def test_chunks_are_tried_max_attempts_times(self):
+        for max_attempts in (1, 3):
+            self.calls.clear()
+            (outcome,) = RunChunks(
+                self.failing,
+                [[1, 2]],
+                max_attempts=max_attempts,
+                scheduler=self.scheduler,
+            )
+            self.assertFalse(outcome.ok)
+            self.assertEqual(len(self.calls), max_attempts)
+
+    def test_retried_chunks_can_succeed(self):
+        def flaky(chunk):
+            self.calls.append(chunk)
+            if len(self.calls) < 2:
+                raise ServerError()
+            return chunk
+
+        (outcome,) = RunChunks(flaky, [[1]], scheduler=self.scheduler)
+        self.assertEqual(outcome.result, [1])
+        self.assertEqual(len(self.calls), 2)
+
+    def test_client_errors_are_not_retried(self):
+        def invalid(chunk):
+            self.calls.append(chunk)
+            response = requests.Response()
+            response.status_code = 400
+            raise requests.HTTPError("400 Client Error", response=response)
+
+        RunChunks(invalid, [[1]], scheduler=self.scheduler)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_results_keep_chunk_order(self):
+        outcomes = RunChunks(sum, [[1, 2], [3], [4, 5, 6]])
+        self.assertEqual([o.result for o in outcomes], [3, 3, 15])
+
+
+class PlanUpdatesTest(unittest.TestCase):
+    def test_identical_changes_are_grouped(self):
+        plan = PlanUpdates(
+            [
+                (1, {"labels_add": [{"name": "bug"}]}),
+                (2, {"workflow_state_id": 5}),
+                (3, {"labels_add": [{"name": "bug"}]}),
+            ]
+        )
+        self.assertEqual(
+            plan,
+            [
+                UpdatePlanStep([1, 3], {"labels_add": [{"name": "bug"}]}),
+                UpdatePlanStep([2], {"workflow_state_id": 5}),
+            ],
+        )
+
+    def test_edits_to_a_story_are_merged_in_order(self):
+        plan = PlanUpdates(
+            [
+                (1, {"workflow_state_id": 5}),
+                (2, {"workflow_state_id": 6, "epic_id": 9}),
+                (1, {"workflow_state_id": 6}),
+                (1, {"epic_id": 9}),
+            ]
+        )
+        self.assertEqual(
+            plan, [UpdatePlanStep([1, 2], {"workflow_state_id": 6, "epic_id": 9})]
+        )
+
+    def test_stories_without_changes_are_left_out(self):
+        self.assertEqual(PlanUpdates([(1, {})]), [])
+
+    def test_groups_are_split_into_chunks(self):
+        plan = PlanUpdates([(i, {"archived": True}) for i in range(5)], chunk_size=2)
+        self.assertEqual([step.story_ids for step in plan], [[0, 1], [2, 3], [4]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import unittest
+
+import requests
+
+from clubhouse_lib.cache import ResponseCache
+from clubhouse_lib.client import ClubhouseClient
+from clubhouse_lib.ratelimit import RequestScheduler
+
+
+class FakeSession:
+    """Answers every request with a JSON body, recording the requests made."""
+
+    def __init__(self):
+        self.requests = []
+        self.etag = None
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        self.requests.append((method, url, dict(params or {}), dict(headers or {})))
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response._content = json.dumps({"n": len(self.requests)}).encode()
+        if self.etag is not None:
+            response.headers["ETag"] = self.etag
+            if headers and headers.get("If-None-Match") == self.etag:
+                response.status_code = 304
+                response._content = b""
+        return response
+
+    def close(self):
+        pass
+
+
+def Client(cache: ResponseCache) -> ClubhouseClient:
+    return ClubhouseClient(
+        "token",
+        session=FakeSession(),
+        scheduler=RequestScheduler(rate=None),
+        cache=cache,
+    )
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_key_includes_the_query_string(self):
+        self.assertNotEqual(
+            ResponseCache.key("/labels?slim=true", {}),
+            ResponseCache.key("/labels", {}),
+        )
+        self.assertEqual(
+            ResponseCache.key("/labels?slim=true", {"token": "t"}),
+            ResponseCache.key("/labels", {"slim": "true"}),
+        )
+
+    def test_uncacheable_endpoints_are_not_misses(self):
+        cache = ResponseCache()
+        client = Client(cache)
+        client.get("stories/1")
+        client.get("stories/1")
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+        self.assertEqual(len(client.session.requests), 2)
+
+    def test_fresh_responses_are_served_from_the_cache(self):
+        cache = ResponseCache()
+        client = Client(cache)
+        first = client.get("labels")
+        self.assertIs(client.get("labels"), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(client.session.requests), 1)
+
+    def test_writes_invalidate_their_resource_family(self):
+        cache = ResponseCache()
+        client = Client(cache)
+        client.get("labels")
+        client.get("members")
+        client.put("labels/5", {"name": "bug"})
+        self.assertEqual(len(cache), 1)
+        client.get("labels")
+        self.assertEqual(
+            [
+                url.split("?")[0].rsplit("/", 1)[1]
+                for _, url, _, _ in client.session.requests
+            ],
+            ["labels", "members", "5", "labels"],
+        )
+
+    def test_expired_responses_are_revalidated(self):
+        cache = ResponseCache(revalidate=True)
+        client = Client(cache)
+        client.session.etag = '"v1"'
+        first = client.get("stories/1")
+        # Expired at once, since stories have no TTL, but kept for its ETag
+        self.assertIs(client.get("stories/1"), first)
+        self.assertEqual(client.session.requests[1][3]["If-None-Match"], '"v1"')
+        self.assertEqual(
+            (cache.not_modified, cache.bytes_saved), (1, len(first.content))
+        )
+
+    def test_changed_responses_replace_the_cached_one(self):
+        cache = ResponseCache(revalidate=True)
+        client = Client(cache)
+        client.session.etag = '"v1"'
+        client.get("stories/1")
+        client.session.etag = '"v2"'
+        second = client.get("stories/1")
+        self.assertEqual(second.json(), {"n": 2})
+        self.assertEqual(cache.not_modified, 0)
+        self.assertIs(client.get("stories/1"), second)
+
+    def test_responses_without_validators_are_not_kept_past_their_ttl(self):
+        cache = ResponseCache(revalidate=True)
+        client = Client(cache)
+        client.get("stories/1")
+        client.get("stories/1")
+        self.assertEqual(len(cache), 0)
+        self.assertNotIn("If-None-Match", client.session.requests[1][3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import os
+import unittest
+
+from clubhouse_lib.endpoints import ENDPOINT_TEMPLATES
+from clubhouse_lib.events import (
+    EndpointTemplates,
+    LatencyHistogram,
+    PrometheusText,
+    RequestEvent,
+)
+
+API_DEF = os.path.join(os.path.dirname(__file__), "..", "api_generator", "api_def")
+
+
+def Event(endpoint, latency, status=200, **fields):
+    return RequestEvent("GET", endpoint, status, latency, 0.0, **fields)
+
+
+class EndpointTemplatesTest(unittest.TestCase):
+    def setUp(self):
+        self.templates = EndpointTemplates(ENDPOINT_TEMPLATES)
+
+    def test_generated_table_is_up_to_date(self):
+        paths = set()
+        for name in os.listdir(API_DEF):
+            if name.endswith(".json"):
+                with open(os.path.join(API_DEF, name)) as f:
+                    paths.add(json.load(f)["url_path"])
+        self.assertEqual(set(ENDPOINT_TEMPLATES), paths)
+
+    def test_maps_endpoints_to_templates(self):
+        self.assertEqual(self.templates("/stories/123"), "/stories/{story_public_id}")
+        self.assertEqual(
+            self.templates("stories/1/tasks/2?token=x"),
+            "/stories/{story_public_id}/tasks/{task_public_id}",
+        )
+
+    def test_prefers_static_endpoints(self):
+        self.assertEqual(self.templates("/stories/bulk"), "/stories/bulk")
+        self.assertEqual(self.templates("/iterations/disable"), "/iterations/disable")
+
+    def test_unknown_endpoints_fall_back_to_id_placeholders(self):
+        self.assertEqual(self.templates("/widgets/42/parts"), "/widgets/{id}/parts")
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_aggregates_per_endpoint(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for latency in (0.05, 0.5, 0.5, 2.0):
+            histogram(Event("/stories/{story_public_id}", latency))
+        histogram(Event("/labels", 0.01, cache_hit=True))
+        slowest, labels = histogram.summary()
+        self.assertEqual(slowest["endpoint"], "/stories/{story_public_id}")
+        self.assertEqual(slowest["count"], 4)
+        self.assertEqual(labels["cache_hits"], 1)
+        self.assertAlmostEqual(
+            histogram.quantile(0.5, "GET", "/stories/{story_public_id}"), 0.55
+        )
+
+    def test_prometheus_text(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        histogram(Event("/labels", 0.5))
+        histogram(Event("/labels", 0.5, status=None, error=IOError()))
+        text = PrometheusText(histogram)
+        self.assertIn(
+            'clubhouse_request_duration_seconds_bucket{method="GET",endpoint="/labels",le="1.0"} 2',
+            text,
+        )
+        self.assertIn(
+            'clubhouse_requests_total{method="GET",endpoint="/labels",status="error"} 1',
+            text,
+        )
+        self.assertIn(
+            'clubhouse_request_errors_total{method="GET",endpoint="/labels"} 1', text
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
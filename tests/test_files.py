@@ -0,0 +1,150 @@
+import io
+import os
+import tempfile
+import shutil
+import unittest
+
+import requests
+
+from clubhouse_lib.files import DownloadTo, MultipartEncoder, _Part
+
+CONTENT = bytes(range(256)) * 4
+
+
+class FakeDownload:
+    """A streamed response for the bytes of CONTENT from an offset, which drops the connection after drop bytes."""
+
+    def __init__(self, status_code, offset=0, drop=None):
+        self.status_code = status_code
+        self.offset = offset
+        self.drop = drop
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(response=self)
+
+    def iter_content(self, chunk_size):
+        body = CONTENT[self.offset :]
+        for i in range(0, len(body), chunk_size):
+            if self.drop is not None and i >= self.drop:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            yield body[i : i + chunk_size]
+
+
+class FakeSession:
+    """Hands out the given responses in turn, recording the headers of every request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def get(self, url, headers=None, stream=False):
+        self.headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+class PartTest(unittest.TestCase):
+    def test_names_file_objects_by_their_path(self):
+        with tempfile.NamedTemporaryFile(suffix=".txt") as f:
+            self.assertEqual(_Part(f).filename, os.path.basename(f.name))
+
+    def test_file_objects_opened_from_a_descriptor_get_a_default_name(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"data")
+            f.seek(0)
+            part = _Part(f)
+            self.assertEqual(part.filename, "file")
+            self.assertEqual(part.size, 4)
+
+    def test_buffers(self):
+        part = _Part(b"abc")
+        self.assertEqual((part.filename, part.size), ("file", 3))
+        self.assertEqual(b"".join(part.chunks(2)), b"abc")
+
+
+class MultipartEncoderTest(unittest.TestCase):
+    def test_length_matches_body(self):
+        body = MultipartEncoder({"story_id": 5}, [b"x" * 1000, io.BytesIO(b"hello")])
+        data = b"".join(body)
+        self.assertEqual(len(body), len(data))
+        self.assertIn(b'name="story_id"\r\n\r\n5\r\n', data)
+
+    def test_iterating_again_starts_over(self):
+        body = MultipartEncoder({}, [io.BytesIO(b"hello")], chunk_size=2)
+        self.assertEqual(b"".join(body), b"".join(body))
+
+    def test_non_seekable_files_are_sent_again_in_full(self):
+        class Pipe(io.RawIOBase):
+            def __init__(self, data):
+                self.data = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                return self.data.readinto(buffer)
+
+        data = os.urandom(10000)
+        body = MultipartEncoder({}, [Pipe(data)], chunk_size=1024)
+        self.assertIsNone(body.length)
+        first = b"".join(body)
+        self.assertIn(data, first)
+        self.assertEqual(b"".join(body), first)
+
+    def test_interrupted_non_seekable_files_resume_from_the_spool(self):
+        body = MultipartEncoder({}, [io.BufferedReader(io.BytesIO(b"x" * 100))])
+        body.files[0][2].size = None  # As for a pipe
+        pieces = iter(body)
+        next(pieces), next(pieces)  # The header, then the first chunk
+        self.assertIn(b"x" * 100, b"".join(body))
+
+
+class DownloadToTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.dest = os.path.join(self.dir, "file")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def read(self):
+        with open(self.dest, "rb") as f:
+            return f.read()
+
+    def test_a_dropped_connection_is_resumed_with_a_range_request(self):
+        session = FakeSession(FakeDownload(200, drop=300), FakeDownload(206, 300))
+        DownloadTo(session, "url", self.dest, size=len(CONTENT), chunk_size=100)
+        self.assertEqual(self.read(), CONTENT)
+        self.assertNotIn("Range", session.headers[0])
+        self.assertEqual(session.headers[1]["Range"], "bytes=300-")
+        self.assertFalse(os.path.exists(self.dest + ".part"))
+
+    def test_a_range_the_server_ignores_starts_over(self):
+        session = FakeSession(FakeDownload(200, drop=300), FakeDownload(200))
+        DownloadTo(session, "url", self.dest, size=len(CONTENT), chunk_size=100)
+        self.assertEqual(self.read(), CONTENT)
+
+    def test_an_unsatisfiable_range_restarts_the_download(self):
+        # A partial file left behind by a download of different content
+        with open(self.dest + ".part", "wb") as f:
+            f.write(b"stale")
+        session = FakeSession(FakeDownload(416), FakeDownload(200))
+        DownloadTo(session, "url", self.dest, chunk_size=100)
+        self.assertEqual(self.read(), CONTENT)
+        self.assertEqual(session.headers[0]["Range"], "bytes=5-")
+        self.assertNotIn("Range", session.headers[1])
+
+    def test_the_error_is_raised_once_attempts_run_out(self):
+        session = FakeSession(*[FakeDownload(200, drop=100)] * 2)
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            DownloadTo(session, "url", self.dest, chunk_size=100, max_attempts=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import math
+import unittest
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from clubhouse_lib.frame import StoryFrame
+
+STORIES = [
+    {
+        "id": 1,
+        "project_id": 10,
+        "story_type": "bug",
+        "estimate": 2,
+        "owner_ids": ["a", "b"],
+        "labels": [{"id": 7, "name": "ui"}],
+        "created_at": "2020-01-01T00:00:00Z",
+        "started_at": "2020-01-02T00:00:00Z",
+        "completed_at": "2020-01-03T00:00:00Z",
+        "completed": True,
+        "name": "Login crash",
+    },
+    {
+        "id": 2,
+        "project_id": 10,
+        "story_type": "feature",
+        "estimate": None,
+        "owner_ids": ["a"],
+        "labels": [],
+        "created_at": "2020-01-01T00:00:00Z",
+        "started_at": "2020-01-01T12:00:00Z",
+        "completed_at": None,
+        "completed": False,
+        "name": "Dark mode",
+    },
+    {
+        "id": 3,
+        "project_id": 11,
+        "story_type": "bug",
+        "estimate": 4,
+        "owner_ids": [],
+        "label_ids": [7, 8],
+        "created_at": "2020-01-01T00:00:00Z",
+        "started_at": "2020-01-01T00:00:00Z",
+        "completed_at": "2020-01-01T06:00:00Z",
+        "completed": True,
+        "name": "Typo",
+    },
+]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class StoryFrameTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = StoryFrame.from_stories(STORIES)
+
+    def test_columns(self):
+        self.assertEqual(len(self.frame), 3)
+        self.assertEqual(self.frame["id"].tolist(), [1, 2, 3])
+        self.assertEqual(self.frame["story_type"].tolist(), ["bug", "feature", "bug"])
+        self.assertEqual(self.frame["owner_ids"].tolist(), [["a", "b"], ["a"], []])
+        # label_ids falls back to the ids of labels when a StorySlim has none
+        self.assertEqual(self.frame["label_ids"].tolist(), [[7], [], [7, 8]])
+        self.assertTrue(math.isnan(self.frame["estimate"][1]))
+
+    def test_where(self):
+        self.assertEqual(self.frame.where(story_type="bug")["id"].tolist(), [1, 3])
+        self.assertEqual(self.frame.where(owner_ids="b")["id"].tolist(), [1])
+        self.assertEqual(
+            self.frame.where(story_type="bug", completed=True, project_id=11)[
+                "id"
+            ].tolist(),
+            [3],
+        )
+
+    def test_cycle_time(self):
+        cycle_time = self.frame.cycle_time
+        self.assertEqual(cycle_time[0], 86400.0)
+        self.assertTrue(math.isnan(cycle_time[1]))
+        self.assertEqual(cycle_time[2], 21600.0)
+
+    def test_groupby(self):
+        by_type = self.frame.groupby("story_type")
+        self.assertEqual(by_type.count(), {"bug": 2, "feature": 1})
+        self.assertEqual(by_type.sum("estimate"), {"bug": 6.0, "feature": 0.0})
+        self.assertEqual(by_type.mean("estimate"), {"bug": 3.0})
+        self.assertEqual(by_type.median(self.frame.cycle_time), {"bug": 54000.0})
+        # A Story is counted once for each of its owners
+        self.assertEqual(self.frame.groupby("owner_ids").count(), {"a": 2, "b": 1})
+        self.assertEqual(
+            self.frame.groupby("project_id").max("estimate"), {10: 2.0, 11: 4.0}
+        )
+
+    def test_to_dicts_round_trips_values(self):
+        first = self.frame.to_dicts()[0]
+        self.assertEqual(first["name"], "Login crash")
+        self.assertEqual(first["owner_ids"], ["a", "b"])
+        self.assertEqual(
+            first["completed_at"], datetime(2020, 1, 3, tzinfo=timezone.utc)
+        )
+        self.assertIsNone(self.frame.to_dicts()[1]["estimate"])
+
+
+if __name__ == "__main__":
+    unittest.main()
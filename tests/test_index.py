@@ -0,0 +1,80 @@
+import unittest
+
+from clubhouse_lib.batch import BatchResult
+from clubhouse_lib.index import LocalSearch
+from clubhouse_lib.mirror import REFERENCE_ENTITIES, WorkspaceMirror
+
+
+class FakeClient:
+    """Serves a fixed workspace, whose stories can be edited between refreshes."""
+
+    def __init__(self):
+        self.hydrated = []
+        self.stories = [
+            {"id": 1, "name": "Login crash", "updated_at": "2020-01-01T00:00:00Z"}
+        ]
+        for method in REFERENCE_ENTITIES.values():
+            setattr(self, method, lambda: [])
+        self.listProjects = lambda: [{"id": 1, "name": "Web"}]
+
+    def listStories(self, project_id):
+        return [dict(story) for story in self.stories]
+
+    def searchStoriesOld(self, updated_at_start):
+        return [dict(s) for s in self.stories if s["updated_at"] >= updated_at_start]
+
+    def getStories(self, story_public_ids):
+        self.hydrated.extend(story_public_ids)
+        return {
+            s["id"]: BatchResult(dict(s, description="Stack trace", comments=[]), None)
+            for s in self.stories
+            if s["id"] in story_public_ids
+        }
+
+    def getEpics(self, epic_public_ids):
+        return {}
+
+
+class LocalSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeClient()
+        self.mirror = WorkspaceMirror(self.client)
+        self.search = LocalSearch(self.mirror, max_age=None)
+
+    def test_searches_the_mirror(self):
+        self.mirror.refresh()
+        self.assertEqual([s["id"] for s in self.search.searchStories("login")], [1])
+
+    def test_rebuilds_after_a_refresh_within_the_same_second(self):
+        self.mirror.refresh()
+        self.assertEqual(self.search.searchStories("renamed"), [])
+        self.client.stories[0].update(name="Renamed", updated_at="2020-01-02T00:00:00Z")
+        self.mirror.refresh()
+        self.assertEqual([s["id"] for s in self.search.searchStories("renamed")], [1])
+
+    def test_generation_counts_refreshes(self):
+        self.assertEqual(self.mirror.generation, 0)
+        self.mirror.refresh()
+        self.mirror.refresh()
+        self.assertEqual(self.mirror.generation, 2)
+
+    def test_descriptions_are_searched_when_the_mirror_is_hydrated(self):
+        self.mirror.refresh()
+        self.assertEqual(self.search.searchStories("stack"), [])
+        mirror = WorkspaceMirror(self.client, hydrate=True)
+        mirror.refresh()
+        search = LocalSearch(mirror, max_age=None)
+        self.assertEqual([s["id"] for s in search.searchStories("stack")], [1])
+
+    def test_hydrate_only_fetches_changed_stories(self):
+        mirror = WorkspaceMirror(self.client, hydrate=True)
+        mirror.refresh()
+        mirror.refresh(full=True)
+        self.assertEqual(self.client.hydrated, [1])
+        self.client.stories[0].update(updated_at="2020-01-02T00:00:00Z")
+        mirror.refresh()
+        self.assertEqual(self.client.hydrated, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
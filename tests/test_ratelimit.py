@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+
+from clubhouse_lib.ratelimit import RequestScheduler, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    async def release(self):
+        self.closed = True
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_drain_pauses_for_the_given_seconds(self):
+        bucket = TokenBucket(rate=10.0, capacity=10)
+        bucket.drain(60)
+        self.assertAlmostEqual(bucket.reserve(), 60.1, delta=0.05)
+
+    def test_concurrent_drains_share_one_pause(self):
+        bucket = TokenBucket(rate=10.0, capacity=10)
+        # Four workers throttled at once, each told to retry after 60 seconds
+        for _ in range(4):
+            bucket.drain(60)
+        self.assertAlmostEqual(bucket.reserve(), 60.1, delta=0.05)
+
+    def test_drain_keeps_the_longer_pause(self):
+        bucket = TokenBucket(rate=10.0, capacity=10)
+        bucket.drain(60)
+        bucket.drain(5)
+        self.assertAlmostEqual(bucket.reserve(), 60.1, delta=0.05)
+
+    def test_drain_does_not_release_queued_reservations(self):
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        for _ in range(11):
+            bucket.reserve()
+        # Callers are already queued 10 seconds out, which a shorter pause must not undo
+        bucket.drain(5)
+        self.assertAlmostEqual(bucket.reserve(), 11.0, delta=0.05)
+
+
+class RequestSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = RequestScheduler(rate=None, backoff_base=0.0)
+        self.responses = [FakeResponse(503), FakeResponse(503), FakeResponse(200)]
+
+    def test_discarded_responses_are_closed(self):
+        responses = iter(self.responses)
+        final = self.scheduler.send("GET", lambda: next(responses))
+        self.assertIs(final, self.responses[-1])
+        self.assertEqual([r.closed for r in self.responses], [True, True, False])
+
+    def test_discarded_responses_are_released_on_the_asyncio_path(self):
+        responses = iter(self.responses)
+
+        async def send():
+            return next(responses)
+
+        final = asyncio.run(self.scheduler.send_async("GET", send))
+        self.assertIs(final, self.responses[-1])
+        self.assertEqual([r.closed for r in self.responses], [True, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
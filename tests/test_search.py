@@ -0,0 +1,126 @@
+import re
+import threading
+import unittest
+import warnings
+from datetime import date, timedelta
+from urllib.parse import urlencode
+
+from clubhouse_lib.search import IterSharded
+
+API_URL = "https://api.clubhouse.io/api/v3"
+
+
+class FakeSearch:
+    """Pages through stories created on given days, recording the windows whose totals were asked for."""
+
+    def __init__(self, days):
+        self.stories = [{"id": i, "created": day} for i, day in enumerate(days)]
+        self.counted = []
+        self.lock = threading.Lock()
+
+    def __call__(self, endpoint, params):
+        lo, hi = re.search(r"created:(\S+)\.\.(\S+)$", params["query"]).groups()
+        matches = [s for s in self.stories if lo <= s["created"] <= hi]
+        size = int(params["page_size"])
+        if size == 1:
+            with self.lock:
+                self.counted.append((lo, hi))
+        offset = int(params.get("next", 0))
+        page = matches[offset : offset + size]
+        if offset + size < len(matches):
+            query = urlencode(dict(params, next=offset + size))
+            next = "/api/v3{}?{}".format(endpoint, query)
+        else:
+            next = None
+        return {"data": page, "next": next, "total": len(matches)}
+
+
+def Days(start: date, counts):
+    return [
+        (start + timedelta(days=i)).isoformat()
+        for i, count in enumerate(counts)
+        for _ in range(count)
+    ]
+
+
+class IterShardedTest(unittest.TestCase):
+    def test_windows_are_bisected_until_under_the_limit(self):
+        days = Days(date(2020, 1, 1), [3, 0, 4, 1, 0, 0, 2, 5])
+        fetch = FakeSearch(days)
+        ids = [
+            s["id"]
+            for s in IterSharded(
+                fetch,
+                "/search/stories",
+                "bug",
+                date(2020, 1, 1),
+                date(2020, 1, 8),
+                API_URL,
+                page_size=2,
+                limit=5,
+            )
+        ]
+        self.assertEqual(sorted(ids), list(range(len(days))))
+        self.assertEqual(len(ids), len(set(ids)))
+        # 15 matches are bisected until no shard holds more than 5, down to single days if need be
+        self.assertEqual(
+            sorted(fetch.counted),
+            [
+                ("2020-01-01", "2020-01-02"),
+                ("2020-01-01", "2020-01-04"),
+                ("2020-01-01", "2020-01-08"),
+                ("2020-01-03", "2020-01-04"),
+                ("2020-01-05", "2020-01-06"),
+                ("2020-01-05", "2020-01-08"),
+                ("2020-01-07", "2020-01-07"),
+                ("2020-01-07", "2020-01-08"),
+                ("2020-01-08", "2020-01-08"),
+            ],
+        )
+
+    def test_results_in_several_shards_are_yielded_once(self):
+        fetch = FakeSearch(Days(date(2020, 1, 1), [2, 2]))
+        original = fetch.__call__
+
+        def overlapping(endpoint, params):
+            page = original(endpoint, params)
+            # The search index matches story 0 in every window, as it does mid-update
+            if not any(s["id"] == 0 for s in page["data"]) and not page["next"]:
+                page["data"] = page["data"] + [fetch.stories[0]]
+            return page
+
+        ids = [
+            s["id"]
+            for s in IterSharded(
+                overlapping,
+                "/search/stories",
+                "bug",
+                date(2020, 1, 1),
+                date(2020, 1, 2),
+                API_URL,
+                limit=2,
+            )
+        ]
+        self.assertEqual(sorted(ids), [0, 1, 2, 3])
+
+    def test_a_single_day_over_the_limit_warns(self):
+        fetch = FakeSearch(Days(date(2020, 1, 1), [4]))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            ids = list(
+                IterSharded(
+                    fetch,
+                    "/search/stories",
+                    "bug",
+                    date(2020, 1, 1),
+                    date(2020, 1, 1),
+                    API_URL,
+                    limit=3,
+                )
+            )
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(len(caught), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
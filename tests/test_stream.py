@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from clubhouse_lib.stream import IterJSONArray
+
+
+def Chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class IterJSONArrayTest(unittest.TestCase):
+    values = [
+        {"id": 1, "name": "Café ☃", "labels": [{"name": "bug"}]},
+        12.5,
+        -3,
+        1e10,
+        "a, ] string",
+        None,
+        True,
+        [],
+        {},
+    ]
+
+    def test_values_split_across_chunk_boundaries(self):
+        data = json.dumps(self.values, ensure_ascii=False).encode("utf-8")
+        # Every chunk size splits some value, number or multibyte character somewhere
+        for size in range(1, len(data) + 1):
+            self.assertEqual(list(IterJSONArray(Chunks(data, size))), self.values)
+
+    def test_whitespace_between_values(self):
+        data = b' \n[ 1 ,\t2 ,\r\n"three" ]\n '
+        for size in (1, 2, 3):
+            self.assertEqual(list(IterJSONArray(Chunks(data, size))), [1, 2, "three"])
+
+    def test_empty_array(self):
+        self.assertEqual(list(IterJSONArray([b"[", b" ", b"]"])), [])
+
+    def test_elements_are_yielded_before_the_input_ends(self):
+        def chunks():
+            yield b'[{"id": 1},'
+            raise AssertionError("read past the first element")
+
+        self.assertEqual(next(IterJSONArray(chunks())), {"id": 1})
+
+    def test_malformed_input(self):
+        for data in (
+            b'{"id": 1}',
+            b"",
+            b"[1 2]",
+            b"[1,",
+            b'[{"id": 1]',
+            b"[1,]",
+            b"[tru]",
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    list(IterJSONArray(Chunks(data, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
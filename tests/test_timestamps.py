@@ -0,0 +1,70 @@
+import unittest
+from datetime import datetime, timezone
+
+from clubhouse_lib.record import Records
+from clubhouse_lib.timestamps import DecodeTimestamps, ParseTimestamp, TimestampArray
+from clubhouse_lib.type import StorySlim
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ROWS = [
+    {"id": 1, "created_at": "2019-08-20T17:38:20Z", "completed_at": None},
+    {
+        "id": 2,
+        "created_at": "2019-08-20T17:38:20.123Z",
+        "completed_at": "2019-08-21T09:00:00+02:00",
+    },
+]
+
+
+class ParseTimestampTest(unittest.TestCase):
+    def test_parses_utc_and_offsets(self):
+        self.assertEqual(
+            ParseTimestamp("2019-08-21T09:00:00+02:00"),
+            datetime(2019, 8, 21, 7, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            ParseTimestamp("2019-08-20T17:38:20.1Z"),
+            datetime(2019, 8, 20, 17, 38, 20, 100000, tzinfo=timezone.utc),
+        )
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class DecodeTimestampsTest(unittest.TestCase):
+    def check(self, rows):
+        columns = DecodeTimestamps(StorySlim, rows, ["created_at", "completed_at"])
+        self.assertEqual(
+            columns["created_at"].tolist(),
+            [
+                datetime(2019, 8, 20, 17, 38, 20),
+                datetime(2019, 8, 20, 17, 38, 20, 123000),
+            ],
+        )
+        self.assertTrue(np.isnat(columns["completed_at"][0]))
+        self.assertEqual(
+            columns["completed_at"][1], np.datetime64("2019-08-21T07:00:00")
+        )
+
+    def test_dicts(self):
+        self.check(ROWS)
+
+    def test_records(self):
+        self.check(Records(StorySlim, ROWS))
+
+    def test_mixed_strings_and_datetimes(self):
+        parsed = TimestampArray(
+            [
+                "2019-08-20T17:38:20Z",
+                datetime(2019, 8, 20, 17, 38, 20, tzinfo=timezone.utc),
+                None,
+            ]
+        )
+        self.assertEqual(parsed[0], parsed[1])
+        self.assertTrue(np.isnat(parsed[2]))
+
+
+if __name__ == "__main__":
+    unittest.main()